@@ -1,137 +1,29 @@
-# List of TPUS PA Services
-TPUS_PA_SERVICES = [
-    ['Service Group 1', 'Service Group 2', 'Service', 'Default UofM'],
-    ['Language Services', 'Translation', 'Translation and Proofreading', 'Word'],
-    ['Language Services', 'Translation', 'MT full EditProof', 'Word'],
-    ['Language Services', 'Translation', 'TM - Fuzzy Matches', 'Word'],
-    ['Language Services', 'Translation', 'TM - Exact Matches', 'Word'],
-    ['Language Services', 'Translation', 'Localization', 'Hour'],
-    ['Desktop Publishing', 'Translation', 'Formatting', 'Hour'],
-    ['Language Services', 'Translation', 'Redaction', 'Hour'],
-    ['Language Services', 'Translation', 'Transcription', 'Word'],
-    ['Language Services', 'Translation', 'Proofreading', 'Hour'],
-    ['Language Services', 'Translation', 'Reconciliation', 'Hour'],
-    ['Language Services', 'Translation', 'Review', 'Hour'],
-    ['Language Services', 'Translation', 'Revision', 'Hour'],
-    ['Verification Services', 'Notary Service', 'Notary Service', 'Word'],
-    ['Handling & Delivery', '', 'Courrier', 'Fee'],
-    ['Desktop Publishing', 'Translation', 'Desktop Publishing', 'Hour'],
-    ['Handling & Delivery', '', 'Courier - Domestic', 'Fee'],
-    ['testSG1', 'test Sg2', 'test Servce', 'test Uofm'],
-    ['', '', '', ''],
-]
+"""
+PA Services per entity.
 
-# List of TPTDE PA Services
-TPTDE_PA_SERVICES = [
-    ['Service Group 1', 'Service Group 2', 'Service', 'Default UofM'],
-    ['Language Services', 'Translation', 'Translation and Proofreading', 'Word'],
-    ['Language Services', 'Translation', 'MT full EditProof', 'Word'],
-    ['Language Services', 'Translation', 'TM - Fuzzy Matches', 'Word'],
-    ['Language Services', 'Translation', 'TM - Exact Matches', 'Word'],
-    ['Language Services', 'Translation', 'Localization', 'Hour'],
-    ['Desktop Publishing', 'Translation', 'Formatting', 'Hour'],
-    ['Language Services', 'Translation', 'Redaction', 'Hour'],
-    ['Language Services', 'Translation', 'Transcription', 'Word'],
-    ['Language Services', 'Translation', 'Proofreading', 'Hour'],
-    ['Language Services', 'Translation', 'Reconciliation', 'Hour'],
-    ['Language Services', 'Translation', 'Review', 'Hour'],
-    ['Language Services', 'Translation', 'Revision', 'Hour'],
-    ['Verification Services', 'Notary Service', 'Notary Service', 'Word'],
-    ['Handling & Delivery', '', 'Courrier', 'Fee'],
-    ['Desktop Publishing', 'Translation', 'Desktop Publishing', 'Hour'],
-    ['Handling & Delivery', '', 'Courier - Domestic', 'Fee'],
-    ['testSG1', 'test Sg2', 'test Servce', 'test Uofm'],
-    ['', '', '', ''],
-]
+The services are stored in pa_services.json and edited through
+pa_service_store; PA_SERVICES is a live, read-only view of that store
+(entity name -> [header row, service rows...]).
+"""
 
-# Dictionary mapping entity names to their service lists
+try:
+    from .pa_service_store import PAServicesView, pa_service_store
+except ImportError:  # imported as a top-level module with Core on sys.path
+    from pa_service_store import PAServicesView, pa_service_store
 
-
-# List of TPTFR PA Services
-TPTFR_PA_SERVICES = [
-    ['Service Group 1', 'Service Group 2', 'Service', 'Default UofM'],
-    ['Language Services', 'Translation', 'Translation and Proofreading', 'Word'],
-    ['Language Services', 'Translation', 'MT full EditProof', 'Word'],
-    ['Language Services', 'Translation', 'TM - Fuzzy Matches', 'Word'],
-    ['Language Services', 'Translation', 'TM - Exact Matches', 'Word'],
-    ['Language Services', 'Translation', 'Localization', 'Hour'],
-    ['Desktop Publishing', 'Translation', 'Le Formatting :(', 'Hour'],
-    ['Language Services', 'Translation', 'Redaction', 'Hour'],
-    ['Language Services', 'Translation', 'Transcription', 'Word'],
-    ['Language Services', 'Translation', 'Proofreading', 'Hour'],
-    ['Language Services', 'Translation', 'Reconciliation', 'Hour'],
-    ['Language Services', 'Translation', 'Review', 'Hour'],
-    ['Language Services', 'Translation', 'Revision', 'Hour'],
-    ['Verification Services', 'Notary Service', 'Notary Service', 'Word'],
-    ['Handling & Delivery', '', 'Courrier', 'Fee'],
-    ['Desktop Publishing', 'Translation', 'Desktop Publishing', 'Hour'],
-    ['Handling & Delivery', '', 'Courier - Domestic', 'Fee'],
-    ['Desktop Publishing', 'Translation', 'Formatting', 'Hour'],
-    ['testSG1', 'test Sg2', 'test Servce', 'test Uofm'],
-    ['', '', '', ''],
-]
-
-
-# List of TPTIT PA Services
-TPTIT_PA_SERVICES = [
-    ['Service Group 1', 'Service Group 2', 'Service', 'Default UofM'],
-    ['Language Services', 'Translation', 'Translation and Proofreading', 'Word'],
-    ['Language Services', 'Translation', 'MT full EditProof', 'Word'],
-    ['Language Services', 'Translation', 'TM - Fuzzy Matches', 'Word'],
-    ['Language Services', 'Translation', 'TM - Exact Matches', 'Word'],
-    ['Language Services', 'Translation', 'Localization', 'Hour'],
-    ['Desktop Publishing', 'Translation', 'Formatting', 'Hour'],
-    ['Language Services', 'Translation', 'Redaction', 'Hour'],
-    ['Language Services', 'Translation', 'Transcription', 'Word'],
-    ['Language Services', 'Translation', 'Proofreading', 'Hour'],
-    ['Language Services', 'Translation', 'Reconciliation', 'Hour'],
-    ['Language Services', 'Translation', 'Review', 'Hour'],
-    ['Language Services', 'Translation', 'Revision', 'Hour'],
-    ['Verification Services', 'Notary Service', 'Notary Service', 'Word'],
-    ['Handling & Delivery', '', 'Courrier', 'Fee'],
-    ['Desktop Publishing', 'Translation', 'Desktop Publishing', 'Hour'],
-    ['Handling & Delivery', '', 'Courier - Domestic', 'Fee'],
-    ['testSG1', 'test Sg2', 'test Servce', 'test Uofm'],
-    ['', '', '', ''],
-]
-
-
-# List of TPT PA Services
-TPT_PA_SERVICES = [
-    ['Service Group 1', 'Service Group 2', 'Service', 'Default UofM'],
-    ['Language Services', 'Translation', 'Translation and Proofreading', 'Word'],
-    ['Language Services', 'Translation', 'MT full EditProof', 'Word'],
-    ['Language Services', 'Translation', 'TM - Fuzzy Matches', 'Word'],
-    ['Language Services', 'Translation', 'TM - Exact Matches', 'Word'],
-    ['Language Services', 'Translation', 'Localization', 'Hour'],
-    ['Desktop Publishing', 'Translation', 'Formatting', 'Hour'],
-    ['Language Services', 'Translation', 'Redaction', 'Hour'],
-    ['Language Services', 'Translation', 'Transcription', 'Word'],
-    ['Language Services', 'Translation', 'Proofreading', 'Hour'],
-    ['Language Services', 'Translation', 'Reconciliation', 'Hour'],
-    ['Language Services', 'Translation', 'Review', 'Hour'],
-    ['Language Services', 'Translation', 'Revision', 'Hour'],
-    ['Verification Services', 'Notary Service', 'Notary Service', 'Word'],
-    ['Handling & Delivery', '', 'Courrier', 'Fee'],
-    ['Desktop Publishing', 'Translation', 'Desktop Publishing', 'Hour'],
-    ['Handling & Delivery', '', 'Courier - Domestic', 'Fee'],
-    ['testSG1', 'test Sg2', 'test Servce', 'test Uofm'],
-    ['', '', '', ''],
-]
-
-PA_SERVICES = {
-    "TPUS": TPUS_PA_SERVICES,
-    "TPTDE": TPTDE_PA_SERVICES,
-    "TPTIT": TPTIT_PA_SERVICES,
-    "TPT": TPT_PA_SERVICES,
-}
+PA_SERVICES = PAServicesView(pa_service_store)
 
 
+def __getattr__(name):
+    # Entity lists used to be module variables named <ENTITY>_PA_SERVICES
+    if name.endswith("_PA_SERVICES") and name[:-len("_PA_SERVICES")] in PA_SERVICES:
+        return PA_SERVICES[name[:-len("_PA_SERVICES")]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def add_pa_service(entity, service_group_1, service_group_2, service, default_uom):
     """
-    Add a new PA service to the specified entity's service list.
+    Add a new PA service to the specified entity's service list and save it.
     
     Args:
         entity (str): Entity name (TPUS or TPTDE)
@@ -150,7 +42,7 @@ def add_pa_service(entity, service_group_1, service_group_2, service, default_uo
         return False
     
     new_service = [service_group_1, service_group_2, service, default_uom]
-    PA_SERVICES[entity_upper].append(new_service)
+    pa_service_store.append_services(entity_upper, [new_service])
     print(f"✓ Service '{service}' added to {entity_upper}")
     return True
 
@@ -6,16 +6,31 @@ Shared utilities and common functionality for all projects.
 __version__ = '1.0.0'
 __author__ = 'Your Organization'
 
-# Import main components for easy access
-from .excel_io import excel_handler, ExcelHandler
-from .df_processing import df_processor, DataFrameProcessor
-from .validators import validator, DataValidator
-
-__all__ = [
-    'excel_handler',
-    'ExcelHandler',
-    'df_processor',
-    'DataFrameProcessor',
-    'validator',
-    'DataValidator',
-]
+import importlib
+
+# Main components for easy access. They are imported on first use so that
+# importing a light Core module (e.g. Core.workflow_manager) does not pull
+# in pandas/openpyxl.
+_LAZY_EXPORTS = {
+    'excel_handler': '.excel_io',
+    'ExcelHandler': '.excel_io',
+    'df_processor': '.df_processing',
+    'DataFrameProcessor': '.df_processing',
+    'validator': '.validators',
+    'DataValidator': '.validators',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,129 @@
+"""
+Account Comparison Module
+Price one job against every "S " ratesheet and rank the results.
+
+All worksheets come from a single QuoteEngine (one workbook read), and
+each sheet's rate index is built once and reused, so comparing accounts
+costs one vectorized quote per sheet instead of a worksheet switch and
+an xlsx read per account.
+"""
+
+from dataclasses import replace
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .quote_engine import (
+    MACHINE_TRANSLATION, PERCENTAGE_SERVICES, TRANSLATION, Quote, QuoteEngine,
+    QuoteRequest, resolve_rate_column, split_language_pairs
+)
+from .rate_calculations import get_service_type
+
+
+COMPARISON_HEADERS = [
+    "Rank", "Account", "Total", "Applicable", "Missing LPs", "Missing Services", "Fallback LPs"
+]
+
+
+def account_coverage(engine: QuoteEngine, account: str, lps: Sequence[str], services: Sequence[str]) -> Tuple[List[str], List[str]]:
+    """
+    Find the LPs and services an account's ratesheet has no rates for.
+
+    Args:
+        engine: QuoteEngine holding the ratesheet
+        account: Ratesheet worksheet name
+        lps: Language pair strings
+        services: Selected services
+
+    Returns:
+        Tuple of (missing LPs, missing services)
+    """
+    index = engine.rate_index(account).index
+    sources, targets = split_language_pairs(lps)
+    missing_lps = [lp for lp, src, tgt in zip(lps, sources, targets) if (src, tgt) not in index]
+
+    columns = engine.ratesheets[account].columns
+    missing_services = []
+    for service in services:
+        if service in PERCENTAGE_SERVICES:
+            continue
+        if get_service_type(service, engine.services_uofm.get(service, "")) == "hType":
+            found = service in columns
+        else:
+            found = resolve_rate_column(columns, service) is not None
+            # Machine Translation falls back to Translation
+            if not found and service == MACHINE_TRANSLATION:
+                found = resolve_rate_column(columns, TRANSLATION) is not None
+        if not found:
+            missing_services.append(service)
+    return missing_lps, missing_services
+
+
+def _account_quotes(
+    engine: QuoteEngine,
+    request: QuoteRequest,
+    accounts: Optional[Sequence[str]]
+) -> Iterator[Tuple[str, Quote, List[str], List[str]]]:
+    for account in accounts or engine.accounts:
+        account_request = replace(request, account=account)
+        missing_lps, missing_services = account_coverage(engine, account, request.lps, request.services)
+        yield account, engine.quote(account_request), missing_lps, missing_services
+
+
+def compare_accounts(
+    engine: QuoteEngine,
+    request: QuoteRequest,
+    accounts: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    Price a request against several ratesheets and rank them.
+
+    Accounts that have a rate for every LP and service come first, cheapest
+    first; the others follow, also by total.
+
+    Args:
+        engine: QuoteEngine loaded with every "S " worksheet
+        request: Request to price (its account is ignored)
+        accounts: Ratesheets to compare (default: all loaded sheets)
+
+    Returns:
+        Ranked DataFrame with COMPARISON_HEADERS columns
+    """
+    rows = []
+    for account, quote, missing_lps, missing_services in _account_quotes(engine, request, accounts):
+        rows.append({
+            "Account": account,
+            "Total": round(quote.total, 2),
+            "Applicable": not missing_lps and not missing_services,
+            "Missing LPs": len(missing_lps),
+            "Missing Services": ", ".join(missing_services),
+            "Fallback LPs": len(quote.fallback_lps),
+        })
+
+    table = pd.DataFrame(rows, columns=COMPARISON_HEADERS[1:])
+    table = table.sort_values(["Applicable", "Total"], ascending=[False, True], kind="stable")
+    table.insert(0, "Rank", range(1, len(table) + 1))
+    return table.reset_index(drop=True)
+
+
+def compare_accounts_by_lp(
+    engine: QuoteEngine,
+    request: QuoteRequest,
+    accounts: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    Get the total of every LP under each ratesheet.
+
+    Args:
+        engine: QuoteEngine loaded with every "S " worksheet
+        request: Request to price (its account is ignored)
+        accounts: Ratesheets to compare (default: all loaded sheets)
+
+    Returns:
+        DataFrame of LP x account totals; LPs missing from a sheet are NaN
+    """
+    columns: Dict[str, pd.Series] = {}
+    for account, quote, missing_lps, _ in _account_quotes(engine, request, accounts):
+        totals = quote.totals_by_lp()
+        columns[account] = totals.mask(totals.index.isin(missing_lps))
+    return pd.DataFrame(columns)
@@ -0,0 +1,197 @@
+"""
+Charges Writer Module
+Stream charges tables to CSV, XLSX or JSON Lines as they are priced.
+
+Each chunk of charges (e.g. from QuoteEngine.quote_chunks) is sanitised
+column by column with NumPy and written straight to the output, so an
+export never holds more than one chunk in memory and never copies the
+whole table through DataFrame post-processing. Output goes to a ".part"
+file that replaces the target only once every row was written.
+"""
+
+import csv
+import json
+import os
+from pathlib import Path
+from typing import Iterable, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .profiling import profiler
+from .quote_engine import CHARGES_HEADERS
+
+
+def sanitize_charges(charges: pd.DataFrame) -> List[list]:
+    """
+    Turn a charges chunk into plain rows.
+
+    Missing values (and the text "nan") become empty strings; numbers stay
+    numbers. Equivalent to applying sanitize_csv_value to every cell.
+
+    Args:
+        charges: Charges chunk with CHARGES_HEADERS columns
+
+    Returns:
+        List of rows, one list of cell values per charge line
+    """
+    columns = []
+    for header in CHARGES_HEADERS:
+        values = charges[header].to_numpy(dtype=object)
+        missing = pd.isna(values)
+        if charges[header].dtype == object:
+            missing |= np.char.lower(values.astype(str)) == "nan"
+        columns.append(np.where(missing, "", values))
+    return np.column_stack(columns).tolist() if columns and len(charges) else []
+
+
+class ChargesWriter:
+    """
+    Base class of the streaming writers.
+
+    Use as a context manager: rows are written to "<file>.part", which
+    replaces the target file on a normal exit and is deleted if the block
+    raises or discard() was called.
+    """
+
+    suffix = ""
+
+    def __init__(self, file_path, headers: Sequence[str] = CHARGES_HEADERS):
+        """
+        Initialize ChargesWriter.
+
+        Args:
+            file_path: Output file path
+            headers: Column headers written first
+        """
+        self.file_path = Path(file_path)
+        self.part_path = self.file_path.with_name(self.file_path.name + ".part")
+        self.headers = list(headers)
+        self.rows_written = 0
+        self._discarded = False
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        if exc_type is None and not self._discarded:
+            os.replace(self.part_path, self.file_path)
+        else:
+            self.part_path.unlink(missing_ok=True)
+        return False
+
+    def discard(self):
+        """Drop the output instead of replacing the target file."""
+        self._discarded = True
+
+    def write(self, charges: pd.DataFrame):
+        """Write a charges chunk."""
+        with profiler.span(f"charges write ({self.suffix})"):
+            rows = sanitize_charges(charges)
+            self.write_rows(rows)
+        self.rows_written += len(rows)
+
+    def open(self):
+        raise NotImplementedError
+
+    def write_rows(self, rows: List[list]):
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+
+class CsvChargesWriter(ChargesWriter):
+    """CSV, UTF-8 with BOM like the app export."""
+
+    suffix = ".csv"
+
+    def open(self):
+        self._file = open(self.part_path, "w", encoding="utf-8-sig", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.headers)
+
+    def write_rows(self, rows):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+
+class XlsxChargesWriter(ChargesWriter):
+    """XLSX through openpyxl's write-only mode (rows are not kept in memory)."""
+
+    suffix = ".xlsx"
+
+    def open(self):
+        from openpyxl import Workbook
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet("Charges")
+        self._sheet.append(self.headers)
+
+    def write_rows(self, rows):
+        for row in rows:
+            self._sheet.append(row)
+
+    def close(self):
+        # openpyxl picks the format from the extension
+        with open(self.part_path, "wb") as f:
+            self._workbook.save(f)
+
+
+class JsonLinesChargesWriter(ChargesWriter):
+    """JSON Lines: one object per charge line, keyed by header."""
+
+    suffix = ".jsonl"
+
+    def open(self):
+        self._file = open(self.part_path, "w", encoding="utf-8")
+
+    def write_rows(self, rows):
+        self._file.writelines(
+            json.dumps(dict(zip(self.headers, row)), ensure_ascii=False) + "\n" for row in rows
+        )
+
+    def close(self):
+        self._file.close()
+
+
+CHARGES_WRITERS = {writer.suffix: writer for writer in (CsvChargesWriter, XlsxChargesWriter, JsonLinesChargesWriter)}
+CHARGES_FILETYPES = [
+    ("CSV files", "*.csv"),
+    ("Excel files", "*.xlsx"),
+    ("JSON Lines files", "*.jsonl"),
+]
+
+
+def open_charges_writer(file_path) -> ChargesWriter:
+    """
+    Create the writer matching a file extension (CSV if unknown).
+
+    Args:
+        file_path: Output file path
+
+    Returns:
+        ChargesWriter to use as a context manager
+    """
+    writer_class = CHARGES_WRITERS.get(Path(file_path).suffix.lower(), CsvChargesWriter)
+    return writer_class(file_path)
+
+
+def write_charges(file_path, chunks: Iterable[pd.DataFrame]) -> int:
+    """
+    Stream charges chunks to a file.
+
+    Args:
+        file_path: Output path; the extension picks CSV, XLSX or JSON Lines
+        chunks: Charges DataFrames, written in order
+
+    Returns:
+        Number of charge lines written
+    """
+    with open_charges_writer(file_path) as writer:
+        for charges in chunks:
+            writer.write(charges)
+    return writer.rows_written
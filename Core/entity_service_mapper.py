@@ -8,6 +8,11 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    from .service_catalog import service_catalog
+except ImportError:  # imported as a top-level module with Core on sys.path
+    from service_catalog import service_catalog
+
 # Path to mappings file
 MAPPINGS_FILE = Path(__file__).parent / "service_mappings.json"
 
@@ -41,12 +46,7 @@ class EntityServiceMapper:
         Returns:
             List of service names (excluding header)
         """
-        master_list = pa_services.get(self.master_entity, [])
-        if not master_list or len(master_list) < 2:
-            return []
-        
-        # Extract service names (column index 2)
-        return [row[2] for row in master_list[1:]]  # Skip header
+        return list(service_catalog(pa_services).service_names(self.master_entity))
     
     def get_entity_services(self, entity_name: str, pa_services: dict) -> List[str]:
         """
@@ -59,11 +59,7 @@ class EntityServiceMapper:
         Returns:
             List of service names (excluding header)
         """
-        entity_list = pa_services.get(entity_name, [])
-        if not entity_list or len(entity_list) < 2:
-            return []
-        
-        return [row[2] for row in entity_list[1:]]  # Skip header
+        return list(service_catalog(pa_services).service_names(entity_name))
     
     def get_mapping(self, entity_name: str, entity_service_name: str) -> Optional[str]:
         """
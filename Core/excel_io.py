@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Union, Dict, List, Optional, Any, Tuple
 import logging
 
+from .profiling import profiler
+
 # Setup logger
 logger = logging.getLogger(__name__)
 
@@ -43,10 +45,12 @@ class ExcelHandler:
             raise FileNotFoundError(f"Excel file not found: {file_path}")
         
         try:
-            if sheet_name:
-                return pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
-            else:
-                return pd.read_excel(file_path, sheet_name=None, **kwargs)
+            profiler.count("xlsx reads")
+            with profiler.span("xlsx read: ExcelHandler.read_excel"):
+                if sheet_name:
+                    return pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
+                else:
+                    return pd.read_excel(file_path, sheet_name=None, **kwargs)
         except Exception as e:
             raise Exception(f"Error reading Excel file {file_path}: {str(e)}")
     
@@ -0,0 +1,78 @@
+"""
+Language Index Module
+Prebuilt substring search over the language list of a ratesheet.
+
+Casefolded forms and a trigram index are built once per language list, so
+a typeahead query only verifies the few languages that contain all of its
+trigrams instead of lowercasing and scanning every language. Results are
+ranked: exact match, then languages starting with the query, then those
+with a word starting with it, then any other substring match.
+"""
+
+from typing import Dict, List, Sequence, Set
+
+
+def trigrams(text: str) -> Set[str]:
+    """Get the set of 3-character substrings of a string."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class LanguageIndex:
+    """Immutable search index over a list of language names."""
+
+    def __init__(self, values: Sequence[str]):
+        """
+        Initialize LanguageIndex.
+
+        Args:
+            values: Language names, in the order results should keep
+                within a rank
+        """
+        self.values = list(values)
+        self._folded = [value.casefold() for value in self.values]
+        self._trigrams: Dict[str, Set[int]] = {}
+        for position, folded in enumerate(self._folded):
+            for gram in trigrams(folded):
+                self._trigrams.setdefault(gram, set()).add(position)
+
+    def __len__(self):
+        return len(self.values)
+
+    def _candidates(self, query: str) -> Sequence[int]:
+        """Positions that may contain the query, narrowed by its trigrams."""
+        if len(query) < 3:
+            return range(len(self.values))
+        postings = sorted((self._trigrams.get(gram, set()) for gram in trigrams(query)), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return sorted(candidates)
+
+    def _rank(self, folded: str, query: str) -> int:
+        if folded == query:
+            return 0
+        if folded.startswith(query):
+            return 1
+        if f" {query}" in folded or f"({query}" in folded:
+            return 2
+        return 3
+
+    def search(self, query: str, limit: int = None) -> List[str]:
+        """
+        Find the languages containing a query, best matches first.
+
+        Args:
+            query: Typed text (case-insensitive); empty returns every language
+            limit: Maximum number of results (default: all)
+
+        Returns:
+            Matching language names
+        """
+        query = query.strip().casefold()
+        if not query:
+            return self.values[:limit]
+        matches = [
+            (self._rank(self._folded[position], query), position)
+            for position in self._candidates(query)
+            if query in self._folded[position]
+        ]
+        matches.sort()
+        return [self.values[position] for _, position in matches[:limit]]
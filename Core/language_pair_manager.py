@@ -94,6 +94,27 @@ class LanguagePairManager:
         """Clear all language pairs."""
         self.language_pairs.clear()
     
+    def set_language_pairs(self, language_pairs: List[str]) -> List[str]:
+        """
+        Replace all language pairs at once (e.g. when restoring a session).
+        
+        Args:
+            language_pairs: Language pair strings ("Source into Target")
+        
+        Returns:
+            The pairs that were skipped as malformed or duplicate
+        """
+        kept, skipped, seen = [], [], set()
+        for lp in language_pairs:
+            source, target = self.parse_language_pair(lp)
+            if source and target and lp not in seen:
+                kept.append(lp)
+                seen.add(lp)
+            else:
+                skipped.append(lp)
+        self.language_pairs = kept
+        return skipped
+    
     def get_all_language_pairs(self) -> List[str]:
         """
         Get all language pairs.
@@ -0,0 +1,248 @@
+"""
+PA Service Store Module
+Storage of the PA services of every entity.
+
+The services live in pa_services.json (one row per line, so edits diff
+cleanly) instead of Python source. Every edit changes only the affected
+entity in memory and is written to a temporary file that atomically
+replaces the store, so a crash never leaves a half-written file. Readers
+see edits made through any PAServiceStore on the same file without
+reloading modules: the file's stat is checked on access and the store is
+re-read only when it changed.
+
+Most entities list nearly the same services, so rows are kept as
+PAServiceRow tuples of interned strings in a table shared by all
+entities: an entity is a list of references into that table, and memory
+grows with the number of distinct rows rather than entities x services.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+PA_SERVICES_FILE = Path(__file__).parent / "pa_services.json"
+PA_SERVICE_HEADER = ["Service Group 1", "Service Group 2", "Service", "Default UofM"]
+
+
+class PAServiceRow(NamedTuple):
+    """One PA service row, shared by every entity that lists it."""
+    service_group_1: str
+    service_group_2: str
+    service: str
+    uom: str
+
+
+ROW_WIDTH = len(PAServiceRow._fields)
+
+
+class PAServiceStore:
+    """Read and edit the PA services of every entity."""
+
+    def __init__(self, store_file=PA_SERVICES_FILE):
+        """
+        Initialize PAServiceStore.
+
+        Args:
+            store_file: Path to the PA services JSON file
+        """
+        self.store_file = Path(store_file)
+        self.version = 0  # Increases whenever the services change
+        self._entities: Dict[str, List[PAServiceRow]] = {}
+        self._row_table: Dict[PAServiceRow, PAServiceRow] = {}
+        self._stat: Optional[Tuple[int, int, int]] = None
+
+    def _intern_rows(self, rows: Iterable[Sequence[str]]) -> List[PAServiceRow]:
+        """
+        Get the shared PAServiceRow of each row.
+
+        Short rows are padded with empty strings.
+
+        Raises:
+            ValueError: If a row has more than four values
+        """
+        interned = []
+        for row in rows:
+            # A row seen before is found by value; only new rows are built
+            shared = self._row_table.get(tuple(row)) if len(row) == ROW_WIDTH else None
+            if shared is None:
+                if len(row) > ROW_WIDTH:
+                    raise ValueError(f"PA service row has too many values: {row}")
+                values = [sys.intern(str(value)) for value in row] + [""] * (ROW_WIDTH - len(row))
+                new_row = PAServiceRow(*values)
+                shared = self._row_table.setdefault(new_row, new_row)
+            interned.append(shared)
+        return interned
+
+    def _file_stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.store_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _current(self) -> Dict[str, List[PAServiceRow]]:
+        """Get the services, re-reading the file if it changed since the last read."""
+        stat = self._file_stat()
+        if stat != self._stat:
+            entities = {}
+            if stat is not None:
+                with open(self.store_file, "r", encoding="utf-8") as f:
+                    entities = json.load(f).get("entities", {})
+            self._row_table = {}
+            self._entities = {sys.intern(name): self._intern_rows(rows) for name, rows in entities.items()}
+            self._stat = stat
+            self.version += 1
+        return self._entities
+
+    def _save(self):
+        """Write all entities to a temporary file and swap it in."""
+        lines = ["{", f'  "columns": {json.dumps(PA_SERVICE_HEADER)},', '  "entities": {']
+        names = list(self._entities)
+        for i, name in enumerate(names):
+            rows = self._entities[name]
+            lines.append(f"    {json.dumps(name, ensure_ascii=False)}: [")
+            lines += [
+                f"      {json.dumps(row, ensure_ascii=False)}{',' if j < len(rows) - 1 else ''}"
+                for j, row in enumerate(rows)
+            ]
+            lines.append("    ]," if i < len(names) - 1 else "    ]")
+        lines += ["  }", "}"]
+
+        self.store_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.store_file.parent, prefix=".pa_services-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            os.replace(temp_path, self.store_file)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._stat = self._file_stat()
+        self.version += 1
+
+    def entity_names(self) -> List[str]:
+        """Get the entity names, in store order."""
+        return list(self._current())
+
+    def has_entity(self, entity: str) -> bool:
+        return entity in self._current()
+
+    def get_services(self, entity: str) -> List[List[str]]:
+        """
+        Get the service rows of an entity (without header).
+
+        Args:
+            entity: Entity name
+
+        Returns:
+            Copies of the [group 1, group 2, service, UofM] rows
+
+        Raises:
+            KeyError: If the entity does not exist
+        """
+        return [list(row) for row in self._current()[entity]]
+
+    def rows(self, entity: str) -> Tuple[PAServiceRow, ...]:
+        """
+        Get the shared service rows of an entity without copying them.
+
+        Raises:
+            KeyError: If the entity does not exist
+        """
+        return tuple(self._current()[entity])
+
+    @property
+    def distinct_rows(self) -> int:
+        """Number of distinct service rows held for all entities (since the last read)."""
+        self._current()
+        return len(self._row_table)
+
+    def set_services(self, entity: str, rows: Iterable[Sequence[str]]):
+        """
+        Replace the service rows of an existing entity.
+
+        Raises:
+            KeyError: If the entity does not exist
+        """
+        entities = self._current()
+        if entity not in entities:
+            raise KeyError(entity)
+        entities[entity] = self._intern_rows(rows)
+        self._save()
+
+    def append_services(self, entity: str, rows: Iterable[Sequence[str]]):
+        """
+        Add service rows at the end of an entity.
+
+        Raises:
+            KeyError: If the entity does not exist
+        """
+        self._current()[entity].extend(self._intern_rows(rows))
+        self._save()
+
+    def add_entity(self, entity: str, rows: Iterable[Sequence[str]] = ()):
+        """
+        Create an entity.
+
+        Args:
+            entity: Entity name
+            rows: Initial service rows (without header)
+
+        Raises:
+            ValueError: If the entity already exists
+        """
+        entities = self._current()
+        if entity in entities:
+            raise ValueError(f"Entity '{entity}' already exists")
+        entities[sys.intern(entity)] = self._intern_rows(rows)
+        self._save()
+
+    def delete_entity(self, entity: str) -> bool:
+        """
+        Delete an entity and its services.
+
+        Returns:
+            True if the entity existed
+        """
+        entities = self._current()
+        if entity not in entities:
+            return False
+        del entities[entity]
+        self._save()
+        return True
+
+
+class PAServicesView(Mapping):
+    """
+    Read-only mapping of entity name to its services, header row first.
+
+    This is the shape WF_Matrix.PA_SERVICES always had; each lookup reads
+    the store, so edits are visible immediately. Edit through the store.
+    """
+
+    def __init__(self, store: PAServiceStore):
+        self.store = store
+
+    def __getitem__(self, entity: str) -> List[List[str]]:
+        return [list(PA_SERVICE_HEADER)] + self.store.get_services(entity)
+
+    def __contains__(self, entity) -> bool:
+        return self.store.has_entity(entity)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.entity_names())
+
+    def __len__(self) -> int:
+        return len(self.store.entity_names())
+
+    def __repr__(self) -> str:
+        return f"PAServicesView({self.store.store_file})"
+
+
+# Shared by WF_Matrix and the entity management tools
+pa_service_store = PAServiceStore()
@@ -0,0 +1,178 @@
+"""
+Price Sweep Module
+Evaluate a workflow over a grid of word counts x LPs x file types.
+
+Rates only depend on the LP and quantities only depend on the scenario
+(word count, file type), so the sweep builds one scenario x line quantity
+grid and one LP x line rate grid and prices their outer product in a
+single NumPy pass: word rates, hourly ceil/minimum rules, minimum fee and
+PM/Rush percentages.
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .quote_engine import (
+    PERCENTAGE_SERVICES, QUOTEME_WORD_LABELS, QuoteEngine, QuoteRequest,
+    rate_grid, resolve_line_services, split_language_pairs
+)
+from .rate_calculations import (
+    DEFAULT_PERCENTAGE_SERVICES, apply_minimum_fee_grid, apply_percentage_services,
+    calculate_hourly_quantities, get_service_type
+)
+
+
+QUOTEME_MIX = {"New Words:": 1.0}
+QTC_MIX = {"TC WC for TRANSLATION:": 1.0, "TC WC for REVISION:": 1.0}
+
+
+def _scenario_quantities(
+    engine: QuoteEngine,
+    request: QuoteRequest,
+    line_services: Sequence[str],
+    word_counts: np.ndarray,
+    file_types: Sequence[str],
+    mix: Dict[str, float]
+) -> np.ndarray:
+    """Build the (file types, word counts, lines) quantity grid."""
+    config = engine.pricing_config(request.account)
+    input_type = "QTC" if request.use_qtc_input else "QuoteMe"
+
+    # Every label is base count + share of the swept word count
+    base = {label: float(value or 0) for label, value in request.word_counts.items()}
+    labels = {
+        label: base.get(label, 0.0) + mix.get(label, 0.0) * word_counts
+        for label in set(base) | set(mix)
+    }
+    # Total Words is the sum of the QuoteMe word fields (a template built by the
+    # app already holds it), so it follows the swept share of those fields
+    if "Total Words:" not in mix:
+        base_total = base.get("Total Words:", sum(base.get(label, 0.0) for label in QUOTEME_WORD_LABELS))
+        labels["Total Words:"] = base_total + sum(mix.get(label, 0.0) for label in QUOTEME_WORD_LABELS) * word_counts
+
+    percentages = {PERCENTAGE_SERVICES[0]: config.default_pm_percent}
+    percentages.update(request.percentages)
+
+    n_counts = len(word_counts)
+    q = np.zeros((len(file_types), n_counts, len(line_services)))
+    hourly = []
+    for i, service in enumerate(line_services):
+        if service in PERCENTAGE_SERVICES:
+            q[..., i] = float(percentages.get(service, 0) or 0) / 100
+        elif get_service_type(service, engine.services_uofm.get(service, "")) == "hType":
+            hourly.append(i)
+        else:
+            q[..., i] = sum(labels.get(label, 0.0) for label in config.labels(service, input_type))
+
+    if hourly:
+        q[..., hourly] = calculate_hourly_quantities(
+            np.array([line_services[i] for i in hourly], dtype=object),
+            np.asarray(file_types, dtype=object)[:, None, None],
+            request.use_qtc_input,
+            labels["Total Words:"][:, None],
+            labels.get("TC WC for TRANSLATION:", 0.0 * word_counts)[:, None],
+            labels.get("TC WC for REVISION:", 0.0 * word_counts)[:, None],
+            config
+        )
+    return q
+
+
+def price_curve(
+    engine: QuoteEngine,
+    request: QuoteRequest,
+    word_counts: Sequence[float],
+    file_types: Sequence[str] = ("Live", "Dead"),
+    mix: Optional[Dict[str, float]] = None,
+    detail: bool = False
+) -> pd.DataFrame:
+    """
+    Price a workflow for every word count, LP and file type in one pass.
+
+    Args:
+        engine: QuoteEngine holding the account's ratesheet
+        request: Template request (account, LPs, services, input mode,
+            min fee, percentages); its word_counts are added as a base
+        word_counts: Word count grid, e.g. np.geomspace(100, 100_000, 31)
+        file_types: File types to price
+        mix: Share of the swept word count given to each label; defaults to
+            all new words for QuoteMe input, or translation and revision
+            word counts for QTC input
+        detail: Return one row per charge line instead of one per LP
+
+    Returns:
+        Tidy DataFrame with File Type, Word Count, Line Item Description and
+        Total columns (plus Service, UofM, Quantity and Rate when detail)
+    """
+    engine.validate(request)
+    if mix is None:
+        mix = QTC_MIX if request.use_qtc_input else QUOTEME_MIX
+    word_counts = np.asarray(word_counts, dtype=float)
+    file_types = list(file_types)
+
+    # One curve per distinct LP
+    lps = list(dict.fromkeys(request.lps))
+    sources, targets = split_language_pairs(lps)
+    line_services = resolve_line_services(request.services)
+    line_uofm = [engine.services_uofm.get(svc, "") for svc in line_services]
+    rates, active, _ = rate_grid(
+        sources, targets, line_services, engine.ratesheets[request.account],
+        engine.services_uofm, engine.rate_index(request.account)
+    )
+
+    # (file types, word counts, LPs, lines)
+    scenario_q = _scenario_quantities(engine, request, line_services, word_counts, file_types, mix)
+    shape = scenario_q.shape[:2] + rates.shape
+    q = np.broadcast_to(scenario_q[:, :, None, :], shape)
+    r = np.broadcast_to(rates, shape)
+    q, r, minimum = apply_minimum_fee_grid(q, r, line_services, line_uofm, request.min_fee, active)
+    r = apply_percentage_services(q, r, line_services, DEFAULT_PERCENTAGE_SERVICES, active)
+    amounts = q * r * active
+
+    index = pd.MultiIndex.from_product(
+        [file_types, word_counts, lps] + ([line_services] if detail else []),
+        names=["File Type", "Word Count", "Line Item Description"] + (["Service"] if detail else [])
+    )
+    if not detail:
+        return pd.DataFrame({"Total": amounts.sum(axis=-1).ravel()}, index=index).reset_index()
+
+    uofm = np.where(minimum, "Minimum", np.broadcast_to(np.asarray(line_uofm, dtype=object), shape))
+    curve = pd.DataFrame({
+        "UofM": uofm.ravel(),
+        "Quantity": q.ravel(),
+        "Rate": r.ravel(),
+        "Total": amounts.ravel(),
+    }, index=index).reset_index()
+    return curve[np.broadcast_to(active, shape).ravel()].reset_index(drop=True)
+
+
+def pivot_price_curve(curve: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Pivot a price curve to LP x word count totals, one table per file type.
+
+    Args:
+        curve: DataFrame returned by price_curve
+
+    Returns:
+        Dictionary mapping file type to its pivot table
+    """
+    totals = curve.groupby(["File Type", "Word Count", "Line Item Description"], sort=False)["Total"].sum()
+    return {
+        file_type: group.droplevel("File Type").unstack("Word Count")
+        for file_type, group in totals.groupby(level="File Type", sort=False)
+    }
+
+
+def write_price_curve_workbook(curve: pd.DataFrame, file_path) -> None:
+    """
+    Write a price curve as a workbook: one pivoted sheet per file type plus the tidy data.
+
+    Args:
+        curve: DataFrame returned by price_curve
+        file_path: Output xlsx path
+    """
+    with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
+        for file_type, table in pivot_price_curve(curve).items():
+            table.to_excel(writer, sheet_name=str(file_type)[:31])
+        curve.to_excel(writer, sheet_name="Data", index=False)
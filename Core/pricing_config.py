@@ -0,0 +1,169 @@
+"""
+Pricing Configuration Module
+Compiled, read-only view of an account's service label mapping.
+
+The raw mapping in service_label_mapping.json stores numbers as strings and
+mixes label lists (word services) with divider settings (hourly services).
+Compiling it once per account pre-parses every value so pricing code does
+not re-walk nested dicts or re-run float() parsing on each call.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
+
+
+DEFAULT_MIN_HOURLY_RATE = 0.5
+DEFAULT_INCREMENT_RATE = 0.25
+DEFAULT_PM_PERCENT = 10.0
+
+# Account-level settings stored next to the services in the mapping
+ACCOUNT_SETTINGS = ("min_hourly_rate", "increment_rate", "default_pm_percent")
+
+
+def _parse_float(value: Any, default: float, keep_zero: bool = False) -> float:
+    """Parse a mapping value, falling back to default when empty or invalid."""
+    try:
+        return float(value if keep_zero else (value or default))
+    except (ValueError, TypeError):
+        return default
+
+
+class _Frozen:
+    """Base class for immutable __slots__ objects."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _init(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+
+class ServicePricing(_Frozen):
+    """
+    Pre-parsed pricing settings for one service.
+
+    Attributes:
+        name: Service name
+        quoteme_labels: QuoteMe labels summed for word services
+        qtc_labels: QTC labels summed for word services
+        quoteme_dividers: (live, dead) words/hour for QuoteMe input
+        qtc_dividers: (live, dead) words/hour for QTC input
+        qtc_wc_source: "translation", "revision" or None for QTC hours
+        is_hourly: Whether the mapping holds divider settings
+    """
+
+    __slots__ = (
+        "name", "quoteme_labels", "qtc_labels", "quoteme_dividers",
+        "qtc_dividers", "qtc_wc_source", "is_hourly",
+    )
+
+    def __init__(self, name: str, raw: Optional[Dict[str, Any]] = None):
+        raw = raw or {}
+        quoteme = raw.get("QuoteMe", [])
+        qtc = raw.get("QTC", [])
+        quoteme_cfg = quoteme if isinstance(quoteme, dict) else {}
+        qtc_cfg = qtc if isinstance(qtc, dict) else {}
+
+        if qtc_cfg.get("use_wc_for_translation"):
+            qtc_wc_source = "translation"
+        elif qtc_cfg.get("use_wc_for_revision"):
+            qtc_wc_source = "revision"
+        else:
+            qtc_wc_source = None
+
+        self._init(
+            name=name,
+            quoteme_labels=tuple(quoteme) if isinstance(quoteme, list) else (),
+            qtc_labels=tuple(qtc) if isinstance(qtc, list) else (),
+            quoteme_dividers=self._dividers(quoteme_cfg),
+            qtc_dividers=self._dividers(qtc_cfg),
+            qtc_wc_source=qtc_wc_source,
+            is_hourly=isinstance(quoteme, dict) or isinstance(qtc, dict),
+        )
+
+    @staticmethod
+    def _dividers(cfg: Dict[str, Any]) -> Tuple[float, float]:
+        return (_parse_float(cfg.get("live_divider", 1), 1.0), _parse_float(cfg.get("dead_divider", 1), 1.0))
+
+    def labels(self, input_type: str) -> Tuple[str, ...]:
+        """Get the mapped labels for "QuoteMe" or "QTC" input."""
+        return self.qtc_labels if input_type == "QTC" else self.quoteme_labels
+
+    def divider(self, use_qtc_input: bool, file_type: str) -> float:
+        """Get the words/hour divider for an input mode and file type."""
+        dividers = self.qtc_dividers if use_qtc_input else self.quoteme_dividers
+        return dividers[0] if file_type == "Live" else dividers[1]
+
+    def __repr__(self):
+        return f"ServicePricing({self.name!r})"
+
+
+class AccountPricingConfig(_Frozen):
+    """
+    Compiled pricing configuration for one account.
+
+    Attributes:
+        account_key: Account/ratesheet identifier
+        min_hourly_rate: Minimum hours billed for hourly services
+        increment_rate: Hour increment that hourly quantities are ceiled to
+        default_pm_percent: Default Project Management percentage
+        services: Read-only mapping of service name to ServicePricing
+        source: The raw mapping block this config was compiled from
+    """
+
+    __slots__ = (
+        "account_key", "min_hourly_rate", "increment_rate",
+        "default_pm_percent", "services", "source",
+    )
+
+    def __init__(self, account_key: str, mapping: Optional[Dict[str, Any]] = None):
+        if mapping is None:
+            mapping = {}
+        increment_rate = _parse_float(mapping.get("increment_rate", DEFAULT_INCREMENT_RATE), DEFAULT_INCREMENT_RATE)
+        services = {
+            name: ServicePricing(name, raw)
+            for name, raw in mapping.items()
+            if name not in ACCOUNT_SETTINGS and isinstance(raw, dict)
+        }
+        self._init(
+            account_key=account_key,
+            min_hourly_rate=_parse_float(mapping.get("min_hourly_rate", DEFAULT_MIN_HOURLY_RATE), DEFAULT_MIN_HOURLY_RATE),
+            increment_rate=increment_rate if increment_rate > 0 else DEFAULT_INCREMENT_RATE,
+            default_pm_percent=_parse_float(
+                mapping.get("default_pm_percent", DEFAULT_PM_PERCENT), DEFAULT_PM_PERCENT, keep_zero=True
+            ),
+            services=MappingProxyType(services),
+            source=mapping,
+        )
+
+    def service(self, name: str) -> ServicePricing:
+        """Get the settings for a service (empty settings if not mapped)."""
+        pricing = self.services.get(name)
+        return pricing if pricing is not None else ServicePricing(name)
+
+    def labels(self, service: str, input_type: str) -> Tuple[str, ...]:
+        """Get the mapped labels for a service and input type."""
+        return self.service(service).labels(input_type)
+
+    def __repr__(self):
+        return f"AccountPricingConfig({self.account_key!r}, {len(self.services)} services)"
+
+
+def compile_pricing_config(account_key: str, mapping: Optional[Dict[str, Any]]) -> AccountPricingConfig:
+    """
+    Compile a raw account mapping block.
+
+    Args:
+        account_key: Account/ratesheet identifier
+        mapping: Raw mapping block from service_label_mapping.json
+
+    Returns:
+        Immutable AccountPricingConfig
+    """
+    return AccountPricingConfig(account_key, mapping)
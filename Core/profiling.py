@@ -0,0 +1,231 @@
+"""
+Profiling Module
+Opt-in timing spans and cProfile capture for the One Stop Shop.
+
+Profiling is off unless the ONE_STOP_SHOP_PROFILE environment variable is
+set (or the app is started with --profile). When off, span() and count()
+return immediately, so instrumented code costs nothing measurable. When on,
+every span's duration is recorded and a report of the slowest operations
+and the I/O counters (e.g. xlsx reads) is written when the session ends.
+
+    ONE_STOP_SHOP_PROFILE=1         timing spans only
+    ONE_STOP_SHOP_PROFILE=cprofile  timing spans plus cProfile of the UI thread
+    --profile / --profile=cprofile  the same, from the command line
+"""
+
+import atexit
+import cProfile
+import functools
+import heapq
+import io
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+PROFILE_ENV = "ONE_STOP_SHOP_PROFILE"
+PROFILE_FLAG = "--profile"
+SLOWEST_SPANS = 20
+
+
+class Profiler:
+    """
+    Collect timing spans and counters for one app session.
+
+    Spans may be recorded from any thread; cProfile (when requested) only
+    covers the thread that called start(), i.e. the Tk main loop.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.use_cprofile = False
+        self.started_at = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, List[float]] = {}  # name -> [count, total, max]
+        self._slowest: List[tuple] = []  # min-heap of (duration, started, name)
+        self._counters: Dict[str, int] = {}
+        self._cprofile: Optional[cProfile.Profile] = None
+
+    def start(self, use_cprofile: bool = False, report_dir=None):
+        """
+        Switch profiling on.
+
+        Args:
+            use_cprofile: Also run cProfile on the calling thread
+            report_dir: If given, write the report there when the process exits
+        """
+        with self._lock:
+            self._stats.clear()
+            self._slowest.clear()
+            self._counters.clear()
+        self.enabled = True
+        self.use_cprofile = use_cprofile
+        self.started_at = datetime.now()
+        self._cprofile = cProfile.Profile() if use_cprofile else None
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        if report_dir is not None:
+            atexit.register(self.write_report, report_dir)
+
+    def stop(self):
+        """Switch profiling off; what was recorded stays available for the report."""
+        self.enabled = False
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+    def configure(self, argv: Sequence[str] = (), environ=os.environ, report_dir=None) -> bool:
+        """
+        Start profiling if the environment variable or the command line flag asks for it.
+
+        Args:
+            argv: Command line arguments
+            environ: Environment variables
+            report_dir: Folder of the session report
+
+        Returns:
+            True if profiling was started
+        """
+        mode = environ.get(PROFILE_ENV, "").strip().lower()
+        for arg in argv:
+            if arg == PROFILE_FLAG:
+                mode = mode or "1"
+            elif arg.startswith(PROFILE_FLAG + "="):
+                mode = arg.split("=", 1)[1].strip().lower()
+        if mode in ("", "0", "false", "off", "no"):
+            return False
+        self.start(use_cprofile=(mode == "cprofile"), report_dir=report_dir)
+        return True
+
+    @contextmanager
+    def span(self, name: str):
+        """Time the enclosed block under the given operation name."""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, time.perf_counter() - started, started)
+
+    def profiled(self, name: Optional[str] = None):
+        """
+        Decorator timing every call of a function.
+
+        Args:
+            name: Operation name (default: the function name)
+        """
+        def decorator(func):
+            span_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count(self, name: str, amount: int = 1):
+        """Increase an I/O counter (e.g. "xlsx reads")."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def _record(self, name, duration, started):
+        with self._lock:
+            stats = self._stats.setdefault(name, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+            entry = (duration, started, name)
+            if len(self._slowest) < SLOWEST_SPANS:
+                heapq.heappush(self._slowest, entry)
+            elif entry > self._slowest[0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    @property
+    def operations(self) -> Dict[str, Dict[str, float]]:
+        """Per-operation call count, total and max duration (seconds)."""
+        with self._lock:
+            return {
+                name: {"calls": calls, "total": total, "max": longest}
+                for name, (calls, total, longest) in self._stats.items()
+            }
+
+    def report(self) -> str:
+        """
+        Build the plain-text session report.
+
+        Returns:
+            Report with operations by total time, the slowest single calls,
+            the counters and (if captured) the top cProfile entries
+        """
+        operations = sorted(self.operations.items(), key=lambda item: item[1]["total"], reverse=True)
+        with self._lock:
+            slowest = sorted(self._slowest, reverse=True)
+        lines = [f"One Stop Shop profile - session started {self.started_at:%Y-%m-%d %H:%M:%S}", ""]
+
+        lines.append("Operations by total time")
+        lines.append(f"{'operation':<40}{'calls':>8}{'total ms':>12}{'mean ms':>12}{'max ms':>12}")
+        for name, stats in operations:
+            lines.append(
+                f"{name:<40}{stats['calls']:>8}{stats['total'] * 1000:>12.1f}"
+                f"{stats['total'] / stats['calls'] * 1000:>12.2f}{stats['max'] * 1000:>12.1f}"
+            )
+
+        lines += ["", f"Slowest {len(slowest)} calls"]
+        for duration, started, name in slowest:
+            offset = started - _PROCESS_T0
+            lines.append(f"{duration * 1000:>10.1f} ms  {name}  (at +{offset:.1f} s)")
+
+        lines += ["", "Counters"]
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<40}{value:>8}")
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            stream = io.StringIO()
+            pstats.Stats(self._cprofile, stream=stream).sort_stats("cumulative").print_stats(30)
+            lines += ["", "cProfile (UI thread, top 30 by cumulative time)", stream.getvalue()]
+            if self.enabled:
+                self._cprofile.enable()
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, report_dir) -> Optional[Path]:
+        """
+        Write the session report (and the raw cProfile data, if captured).
+
+        Args:
+            report_dir: Output folder, created if missing
+
+        Returns:
+            Path of the text report, or None if profiling was never started
+        """
+        if self.started_at is None:
+            return None
+        report_dir = Path(report_dir)
+        report_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"profile-{self.started_at:%Y%m%d-%H%M%S}"
+        report_path = report_dir / f"{stem}.txt"
+        report_path.write_text(self.report(), encoding="utf-8")
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(str(report_dir / f"{stem}.prof"))
+        return report_path
+
+
+_PROCESS_T0 = time.perf_counter()
+
+# Shared by the app and the Core modules it instruments
+profiler = Profiler()
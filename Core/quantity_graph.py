@@ -0,0 +1,114 @@
+"""
+Quantity Graph Module
+Which preview quantities depend on which QuoteMe/QTC input labels.
+
+The graph is built from an account's compiled service label mapping for
+the selected services and input mode:
+
+    input label -> derived label ("Total Words:") -> services that consume
+    it -> percentage services (PM, Rush) downstream of every other line
+
+so an edit to one input only recomputes the services it reaches, e.g.
+"Fuzzy Matches:" reaches TM - Fuzzy Matches, the hour-based services fed
+by Total Words, and PM/Rush.
+"""
+
+from typing import Dict, Iterable, List, Sequence, Set
+
+from .pricing_config import AccountPricingConfig
+from .quote_engine import PERCENTAGE_SERVICES, QUOTEME_WORD_LABELS
+from .rate_calculations import get_service_type
+
+
+TOTAL_WORDS = "Total Words:"
+QTC_WC_LABELS = {
+    "translation": "TC WC for TRANSLATION:",
+    "revision": "TC WC for REVISION:",
+}
+
+
+class QuantityGraph:
+    """
+    Dependency graph from input labels to the preview services they feed.
+
+    Attributes:
+        services: Selected services, in preview order
+        derived: Label -> labels computed from it
+        consumers: Label -> services whose quantity reads it
+    """
+
+    def __init__(
+        self,
+        config: AccountPricingConfig,
+        services: Sequence[str],
+        services_uofm: Dict[str, str],
+        use_qtc_input: bool
+    ):
+        """
+        Initialize QuantityGraph.
+
+        Args:
+            config: Compiled pricing config of the account
+            services: Selected services
+            services_uofm: Dictionary mapping services to their UofM
+            use_qtc_input: Whether QTC input is used (True) or QuoteMe (False)
+        """
+        input_type = "QTC" if use_qtc_input else "QuoteMe"
+        self.services = list(services)
+        self.derived: Dict[str, Set[str]] = {}
+        self.consumers: Dict[str, Set[str]] = {}
+        self._percentage = [svc for svc in self.services if svc in PERCENTAGE_SERVICES]
+
+        if not use_qtc_input:
+            for label in QUOTEME_WORD_LABELS:
+                self.derived.setdefault(label, set()).add(TOTAL_WORDS)
+
+        for service in self.services:
+            for label in self.inputs(service, config, services_uofm, use_qtc_input, input_type):
+                self.consumers.setdefault(label, set()).add(service)
+
+    @staticmethod
+    def inputs(
+        service: str,
+        config: AccountPricingConfig,
+        services_uofm: Dict[str, str],
+        use_qtc_input: bool,
+        input_type: str
+    ) -> List[str]:
+        """Get the labels a service's quantity is computed from."""
+        pricing = config.service(service)
+        if service not in PERCENTAGE_SERVICES and get_service_type(service, services_uofm.get(service, "")) == "hType":
+            if not use_qtc_input:
+                return [TOTAL_WORDS]
+            label = QTC_WC_LABELS.get(pricing.qtc_wc_source)
+            return [label] if label else []
+        return list(pricing.labels(input_type))
+
+    def labels_reached(self, labels: Iterable[str]) -> Set[str]:
+        """Get the edited labels plus every label derived from them."""
+        reached = set()
+        pending = list(labels)
+        while pending:
+            label = pending.pop()
+            if label not in reached:
+                reached.add(label)
+                pending.extend(self.derived.get(label, ()))
+        return reached
+
+    def affected(self, labels: Iterable[str]) -> List[str]:
+        """
+        Get the services to recompute after some input labels changed.
+
+        Args:
+            labels: Edited input labels
+
+        Returns:
+            Affected services, in preview order
+        """
+        affected = set()
+        for label in self.labels_reached(labels):
+            affected |= self.consumers.get(label, set())
+        # Percentage lines are priced on the lines above them
+        if affected - set(self._percentage):
+            affected.update(self._percentage)
+        return [svc for svc in self.services if svc in affected]
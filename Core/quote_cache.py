@@ -0,0 +1,110 @@
+"""
+Quote Cache Module
+LRU memo of priced charge blocks, one entry per language pair.
+
+Every LP's block of charge lines depends only on the ratesheet contents,
+the account, the LP itself and the settings shared by the whole quote
+(line services, per-service quantities and the minimum fee). Caching at
+LP granularity means regenerating a quote after changing one LP only
+prices that LP, while a change to the shared settings changes the key of
+every LP.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def canonical_key(*parts: Any) -> str:
+    """
+    Hash JSON-serialisable parts into a stable key.
+
+    Dictionaries are serialised with sorted keys and numbers as floats, so
+    equivalent requests (e.g. 100 vs 100.0, different dict order) share a key.
+    """
+    def normalise(value):
+        if isinstance(value, dict):
+            return {str(k): normalise(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [normalise(v) for v in value]
+        if isinstance(value, (bool, np.bool_)) or value is None:
+            return value
+        if isinstance(value, (int, float, np.number)):
+            return float(value)
+        return str(value)
+
+    payload = json.dumps(normalise(parts), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def dataframe_version(df: pd.DataFrame) -> str:
+    """Content hash of a worksheet DataFrame (columns and values)."""
+    digest = hashlib.sha1("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class QuoteCache:
+    """Thread-safe LRU cache of per-LP charge blocks."""
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Initialize QuoteCache.
+
+        Args:
+            maxsize: Maximum number of LP blocks kept
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[np.ndarray, bool]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[np.ndarray, bool]]:
+        """
+        Get a cached LP block.
+
+        Returns:
+            (rows, fell_back_to_translation) or None if not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, rows: np.ndarray, fell_back: bool):
+        """Store an LP block, evicting the least recently used ones."""
+        rows.flags.writeable = False
+        with self._lock:
+            self._entries[key] = (rows, fell_back)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,680 @@
+"""
+Quote Engine Module
+Vectorized charges computation for all language pairs (LPs) at once.
+
+The engine lays a quote out as an (LP x service line) grid and computes the
+quantity and rate matrices with NumPy instead of building rows one LP and one
+service at a time. The charges table is emitted directly from those matrices.
+"""
+
+import logging
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .pricing_config import AccountPricingConfig, compile_pricing_config
+from .profiling import profiler
+from .quote_cache import QuoteCache, canonical_key, dataframe_version
+from .rate_calculations import (
+    DEFAULT_PERCENTAGE_SERVICES, MINIMUM_FEE_SERVICES, PercentageService,
+    apply_minimum_fee, apply_percentage_services, calculate_hourly_quantities,
+    get_service_type
+)
+
+# Setup logger
+logger = logging.getLogger(__name__)
+
+
+CHARGES_HEADERS = [
+    "Mark New Line Item", "Line Item Description", "Source", "Target", "Hide Unit Costs",
+    "Hide Details", "Service Group 1", "Service Group 2", "Service Group 3", "Service",
+    "UofM", "Quantity", "Rate", "CommentsForInvoice", "Technology Product",
+]
+
+SOURCE_COLUMN = "Source Language"
+TARGET_COLUMN = "Target Language"
+
+# Plural service names that map to singular ratesheet columns
+WORD_SERVICE_ALIASES = {
+    "TM - Fuzzy Matches": "TM - Fuzzy Match",
+    "TM - Exact Matches": "TM - Exact Match",
+}
+
+QUOTEME_WORD_LABELS = ["Context:", "100%:", "Repetitions:", "Fuzzy Matches:", "New Words:"]
+
+# LPs priced per step by QuoteEngine.quote_chunks
+QUOTE_CHUNK_LPS = 25
+
+TRANSLATION = "Translation"
+MACHINE_TRANSLATION = "Machine Translation"
+PERCENTAGE_SERVICES = tuple(spec.name for spec in DEFAULT_PERCENTAGE_SERVICES)
+
+
+def split_language_pairs(lps: Sequence[str]) -> Tuple[List[str], List[str]]:
+    """
+    Split "<source> into <target>" strings into source and target lists.
+
+    Args:
+        lps: Language pair strings
+
+    Returns:
+        Tuple of (source_languages, target_languages)
+    """
+    sources, targets = [], []
+    for lp in lps:
+        parts = lp.split(" into ")
+        sources.append(parts[0].strip())
+        targets.append(parts[1].strip() if len(parts) > 1 else "")
+    return sources, targets
+
+
+def build_rate_index(df_ratesheet: pd.DataFrame) -> pd.DataFrame:
+    """
+    Index a ratesheet worksheet by (Source Language, Target Language).
+
+    Duplicate pairs keep their first row, matching the row-by-row lookup.
+
+    Args:
+        df_ratesheet: DataFrame containing the "S " worksheet
+
+    Returns:
+        DataFrame indexed by (source, target)
+    """
+    df = df_ratesheet.dropna(subset=[SOURCE_COLUMN, TARGET_COLUMN])
+    df = df.drop_duplicates(subset=[SOURCE_COLUMN, TARGET_COLUMN], keep="first")
+    return df.set_index([SOURCE_COLUMN, TARGET_COLUMN])
+
+
+def resolve_rate_column(columns, service: str) -> Optional[str]:
+    """
+    Find the ratesheet column holding the rate for a service.
+
+    Args:
+        columns: Ratesheet columns
+        service: Service name
+
+    Returns:
+        Column name, or None if the ratesheet has no rate for the service
+    """
+    if service in columns:
+        return service
+    alias = WORD_SERVICE_ALIASES.get(service)
+    if alias and alias in columns:
+        return alias
+    return None
+
+
+def resolve_line_services(selected_services: Sequence[str]) -> List[str]:
+    """
+    Get the ordered service lines of the quote grid.
+
+    When Machine Translation is selected, Translation is kept as a leading
+    line so LPs without an MT rate can fall back to it.
+
+    Args:
+        selected_services: Services ticked by the user, in display order
+
+    Returns:
+        List of service names, one per grid column
+    """
+    if MACHINE_TRANSLATION in selected_services:
+        return [TRANSLATION] + [svc for svc in selected_services if svc != TRANSLATION]
+    return list(selected_services)
+
+
+def compute_service_quantities(
+    services: Sequence[str],
+    services_uofm: Dict[str, str],
+    mapping,
+    label_values: Dict[str, float],
+    use_qtc_input: bool = False,
+    file_type: str = "Live",
+    percentages: Optional[Dict[str, float]] = None
+) -> Dict[str, float]:
+    """
+    Compute the per-service quantity shared by every LP.
+
+    Args:
+        services: Service names
+        services_uofm: Dictionary mapping services to their UofM
+        mapping: Service label mapping for the account, raw or compiled
+        label_values: QuoteMe and QTC word counts keyed by label
+        use_qtc_input: Whether QTC input is used (True) or QuoteMe (False)
+        file_type: "Live" or "Dead"
+        percentages: Percentages entered for percentage-based services
+
+    Returns:
+        Dictionary mapping services to their quantity
+    """
+    percentages = percentages or {}
+    if not isinstance(mapping, AccountPricingConfig):
+        mapping = AccountPricingConfig("", mapping)
+    input_type = "QTC" if use_qtc_input else "QuoteMe"
+    quantities = {}
+    hourly_services = []
+    for service in services:
+        if service in PERCENTAGE_SERVICES:
+            quantities[service] = float(percentages.get(service, 0) or 0) / 100
+        elif get_service_type(service, services_uofm.get(service, "")) == "hType":
+            hourly_services.append(service)
+        else:
+            labels = mapping.labels(service, input_type)
+            quantities[service] = float(sum(label_values.get(label, 0) for label in labels))
+
+    if hourly_services:
+        hours = calculate_hourly_quantities(
+            hourly_services,
+            file_type,
+            use_qtc_input,
+            label_values.get("Total Words:", 0),
+            label_values.get("TC WC for TRANSLATION:", 0),
+            label_values.get("TC WC for REVISION:", 0),
+            mapping
+        )
+        quantities.update(zip(hourly_services, hours.tolist()))
+    return quantities
+
+
+def _to_rates(values: pd.Series) -> pd.Series:
+    """
+    Convert rate cells to floats the way float() does.
+
+    Text cells are stripped first, so rates stored as strings padded with
+    spaces or non-breaking spaces ("0.12\xa0") still parse; anything else
+    that float() would reject becomes NaN.
+    """
+    if not pd.api.types.is_numeric_dtype(values):
+        values = values.map(lambda value: value.strip() if isinstance(value, str) else value)
+    return pd.to_numeric(values, errors="coerce")
+
+
+def _word_rate_matrix(
+    rate_index: pd.DataFrame,
+    sources: List[str],
+    targets: List[str],
+    services: List[str]
+) -> np.ndarray:
+    """Look up word rates for every (LP, service) pair in one reindex."""
+    rates = np.zeros((len(sources), len(services)))
+    columns = [resolve_rate_column(rate_index.columns, svc) for svc in services]
+    present = [i for i, col in enumerate(columns) if col is not None]
+    for i, col in enumerate(columns):
+        if col is None and services[i] in MINIMUM_FEE_SERVICES:
+            logger.warning(f"Service '{services[i]}' not found in ratesheet")
+    if present and sources:
+        wanted = pd.MultiIndex.from_arrays([sources, targets])
+        block = rate_index.reindex(wanted)[[columns[i] for i in present]]
+        block = block.apply(_to_rates)
+        rates[:, present] = block.to_numpy(dtype=float, na_value=np.nan)
+    return np.nan_to_num(rates, nan=0.0)
+
+
+def _hourly_rate(df_ratesheet: pd.DataFrame, service: str) -> float:
+    """Get the hourly rate from the first row of the service column."""
+    if service not in df_ratesheet.columns or df_ratesheet.empty:
+        return 0
+    rate = _to_rates(df_ratesheet[service].iloc[:1]).iloc[0]
+    return float(rate) if pd.notna(rate) else 0
+
+
+def _clean_labels(values: Sequence) -> np.ndarray:
+    """Blank out NaN/None/"nan" strings the same way CSV sanitising does."""
+    cleaned = []
+    for val in values:
+        text = "" if val is None or (isinstance(val, float) and np.isnan(val)) else str(val)
+        cleaned.append("" if text.lower() == "nan" else text)
+    return np.array(cleaned, dtype=object)
+
+
+def rate_grid(
+    sources: Sequence[str],
+    targets: Sequence[str],
+    line_services: Sequence[str],
+    df_ratesheet: pd.DataFrame,
+    services_uofm: Dict[str, str],
+    rate_index: pd.DataFrame
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Look up the LP x line rate grid and which lines each LP is billed for.
+
+    Args:
+        sources: Source language of each LP
+        targets: Target language of each LP
+        line_services: Service lines (see resolve_line_services)
+        df_ratesheet: DataFrame containing the "S " worksheet
+        services_uofm: Dictionary mapping services to their UofM
+        rate_index: Rate index built by build_rate_index
+
+    Returns:
+        Tuple of (rates, active mask, per-LP Translation fallback flags)
+    """
+    line_types = [get_service_type(svc, services_uofm.get(svc, "")) for svc in line_services]
+    n_lps, n_lines = len(sources), len(line_services)
+
+    r = np.zeros((n_lps, n_lines))
+    word_cols = [i for i, t in enumerate(line_types) if t == "wcType"]
+    if word_cols:
+        r[:, word_cols] = _word_rate_matrix(
+            rate_index, list(sources), list(targets), [line_services[i] for i in word_cols]
+        )
+    for i, t in enumerate(line_types):
+        if t == "hType":
+            r[:, i] = _hourly_rate(df_ratesheet, line_services[i])
+
+    # Work out which lines are billed for each LP (MT vs Translation fallback)
+    active = np.ones((n_lps, n_lines), dtype=bool)
+    fallback = np.zeros(n_lps, dtype=bool)
+    if MACHINE_TRANSLATION in line_services:
+        mt_col = line_services.index(MACHINE_TRANSLATION)
+        t_col = line_services.index(TRANSLATION)
+        fallback = ~(r[:, mt_col] > 0)
+        active[:, mt_col] = ~fallback
+        active[:, t_col] = fallback
+    return r, active, fallback
+
+
+def compute_charges(
+    lps: Sequence[str],
+    selected_services: Sequence[str],
+    df_ratesheet: pd.DataFrame,
+    services_uofm: Dict[str, str],
+    service_group1: Dict[str, str],
+    service_group2: Dict[str, str],
+    quantities: Dict[str, float],
+    min_fee: float,
+    rate_index: Optional[pd.DataFrame] = None,
+    percentage_services: Sequence[PercentageService] = DEFAULT_PERCENTAGE_SERVICES
+) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Compute the charges table for every LP and selected service at once.
+
+    Args:
+        lps: Language pair strings ("<source> into <target>")
+        selected_services: Services ticked by the user, in display order
+        df_ratesheet: DataFrame containing the "S " worksheet
+        services_uofm: Dictionary mapping services to their UofM
+        service_group1: Dictionary mapping services to Service Group 1
+        service_group2: Dictionary mapping services to Service Group 2
+        quantities: Per-service quantities (see compute_service_quantities)
+        min_fee: Minimum fee threshold
+        rate_index: Prebuilt rate index (built from df_ratesheet if omitted)
+        percentage_services: Percentage service declarations
+
+    Returns:
+        Tuple of (charges DataFrame, LPs that fell back to Translation)
+    """
+    if rate_index is None:
+        rate_index = build_rate_index(df_ratesheet)
+
+    sources, targets = split_language_pairs(lps)
+    line_services = resolve_line_services(selected_services)
+    line_uofm = [services_uofm.get(svc, "") for svc in line_services]
+    n_lps, n_lines = len(sources), len(line_services)
+
+    # Quantities do not depend on the LP, so broadcast one row over the grid
+    quantity_row = np.array([float(quantities.get(svc, 0) or 0) for svc in line_services])
+    q = np.tile(quantity_row, (n_lps, 1))
+    r, active, fallback = rate_grid(sources, targets, line_services, df_ratesheet, services_uofm, rate_index)
+
+    # Flatten the grid into LP-major rows, dropping inactive lines
+    positions = np.flatnonzero(active.ravel())
+    lp_idx, line_idx = np.divmod(positions, n_lines)
+    first_line = np.zeros((n_lps, n_lines), dtype=bool)
+    has_lines = active.any(axis=1)
+    first_line[np.arange(n_lps)[has_lines], active.argmax(axis=1)[has_lines]] = True
+
+    src = np.array(sources, dtype=object)
+    tgt = np.array(targets, dtype=object)
+    groups1 = _clean_labels([service_group1.get(svc, "") for svc in line_services])
+    groups2 = _clean_labels([service_group2.get(svc, "") for svc in line_services])
+    n_rows = len(positions)
+
+    charges = pd.DataFrame({
+        "Mark New Line Item": np.where(first_line.ravel()[positions], "x", ""),
+        "Line Item Description": src[lp_idx] + " into " + tgt[lp_idx],
+        "Source": src[lp_idx],
+        "Target": tgt[lp_idx],
+        "Hide Unit Costs": np.full(n_rows, "0", dtype=object),
+        "Hide Details": np.full(n_rows, "0", dtype=object),
+        "Service Group 1": groups1[line_idx],
+        "Service Group 2": groups2[line_idx],
+        "Service Group 3": np.full(n_rows, "", dtype=object),
+        "Service": np.array(line_services, dtype=object)[line_idx],
+        "UofM": _clean_labels(line_uofm)[line_idx],
+        "Quantity": q.ravel()[positions],
+        "Rate": r.ravel()[positions],
+        "CommentsForInvoice": np.full(n_rows, "", dtype=object),
+        "Technology Product": np.full(n_rows, "", dtype=object),
+    }, columns=CHARGES_HEADERS)
+
+    # Min fee runs on the table; percentage lines are then rated on the grid
+    charges = apply_minimum_fee(charges, min_fee)
+    q.reshape(-1)[positions] = charges["Quantity"].to_numpy()
+    r.reshape(-1)[positions] = charges["Rate"].to_numpy()
+    r = apply_percentage_services(q, r, line_services, percentage_services, active)
+    charges["Rate"] = r.ravel()[positions]
+
+    fallback_lps = [lp for lp, fell_back in zip(lps, fallback) if fell_back]
+    return charges, fallback_lps
+
+
+@dataclass
+class QuoteRequest:
+    """
+    Everything needed to price a quote, independent of any UI.
+
+    Attributes:
+        account: Ratesheet worksheet name (e.g. "S IQVIA")
+        lps: Language pair strings ("<source> into <target>")
+        services: Selected services, in display order
+        word_counts: QuoteMe and/or QTC word counts keyed by label
+        use_qtc_input: Price from QTC counts (True) or QuoteMe counts (False)
+        file_type: "Live" or "Dead"
+        min_fee: Minimum fee threshold
+        hourly_divider: Words per hour (must be greater than zero)
+        percentages: Percentages for percentage-based services; Project
+            Management defaults to the account's default PM percent
+    """
+    account: str
+    lps: List[str]
+    services: List[str]
+    word_counts: Dict[str, float] = field(default_factory=dict)
+    use_qtc_input: bool = False
+    file_type: str = "Live"
+    min_fee: float = 150
+    hourly_divider: int = 1000
+    percentages: Dict[str, float] = field(default_factory=dict)
+
+    def label_values(self) -> Dict[str, float]:
+        """Word counts with "Total Words:" filled in from the QuoteMe fields if missing."""
+        values = {label: float(value or 0) for label, value in self.word_counts.items()}
+        if "Total Words:" not in values:
+            values["Total Words:"] = sum(values.get(label, 0) for label in QUOTEME_WORD_LABELS)
+        return values
+
+
+@dataclass
+class Quote:
+    """
+    Result of pricing a QuoteRequest.
+
+    Attributes:
+        request: The request that was priced
+        charges: Charges table (CHARGES_HEADERS columns)
+        fallback_lps: LPs priced with Translation for lack of an MT rate
+    """
+    request: QuoteRequest
+    charges: pd.DataFrame
+    fallback_lps: List[str] = field(default_factory=list)
+
+    @property
+    def total(self) -> float:
+        """Total value of the quote (sum of quantity x rate)."""
+        return float((self.charges["Quantity"] * self.charges["Rate"]).sum())
+
+    def totals_by_lp(self) -> pd.Series:
+        """Total value per language pair, in quote order."""
+        value = self.charges["Quantity"] * self.charges["Rate"]
+        return value.groupby(self.charges["Line Item Description"], sort=False).sum()
+
+    @classmethod
+    def concat(cls, request: QuoteRequest, quotes: Sequence["Quote"]) -> "Quote":
+        """Join the quotes of consecutive chunks of a request's LPs."""
+        charges = pd.concat([quote.charges for quote in quotes], ignore_index=True) if quotes \
+            else pd.DataFrame(columns=CHARGES_HEADERS)
+        return cls(request, charges, [lp for quote in quotes for lp in quote.fallback_lps])
+
+    def to_csv(self, file_path, **kwargs):
+        """Write the charges table as CSV (UTF-8 with BOM, like the app export)."""
+        kwargs.setdefault("encoding", "utf-8-sig")
+        self.charges.to_csv(file_path, index=False, **kwargs)
+
+
+def parse_uofm_sheet(df_uofm: pd.DataFrame) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
+    """
+    Read service UofM and service groups from the "UofM" worksheet.
+
+    Args:
+        df_uofm: DataFrame containing the "UofM" worksheet
+
+    Returns:
+        Tuple of (services_uofm, service_group1, service_group2)
+    """
+    services_uofm, service_group1, service_group2 = {}, {}, {}
+    for _, row in df_uofm.iterrows():
+        service = str(row.get("Service name", "")).strip()
+        if service:
+            uom = str(row.get("UofM", "")).strip()
+            group1 = str(row.get("Service Group 1", "")).strip()
+            group2 = str(row.get("Service Group 2", "")).strip()
+            if uom:
+                services_uofm[service] = uom
+            if group1:
+                service_group1[service] = group1
+            if group2:
+                service_group2[service] = group2
+    return services_uofm, service_group1, service_group2
+
+
+class QuoteEngine:
+    """
+    Prices QuoteRequests against loaded ratesheets without any UI.
+
+    The engine only holds plain data (DataFrames and dicts), so it can be
+    shared by the GUI, batch jobs and services, and pickled to worker
+    processes.
+    """
+
+    def __init__(
+        self,
+        ratesheets: Dict[str, pd.DataFrame],
+        services_uofm: Dict[str, str],
+        service_group1: Dict[str, str],
+        service_group2: Dict[str, str],
+        mappings: Union[Dict[str, Any], Any],
+        cache: Optional[QuoteCache] = None
+    ):
+        """
+        Initialize QuoteEngine.
+
+        Args:
+            ratesheets: "S " worksheets keyed by sheet name
+            services_uofm: Dictionary mapping services to their UofM
+            service_group1: Dictionary mapping services to Service Group 1
+            service_group2: Dictionary mapping services to Service Group 2
+            mappings: ServiceMappingManager, or raw mappings keyed by account
+            cache: Optional QuoteCache of per-LP charge blocks; it may be
+                shared between engines since keys include the sheet contents
+        """
+        self.ratesheets = ratesheets
+        self.services_uofm = services_uofm
+        self.service_group1 = service_group1
+        self.service_group2 = service_group2
+        self.mappings = mappings
+        self.cache = cache
+        self._rate_indexes: Dict[str, pd.DataFrame] = {}
+        self._sheet_versions: Dict[str, str] = {}
+        self._pricing_configs: Dict[str, AccountPricingConfig] = {}
+        self._labels_version = canonical_key(services_uofm, service_group1, service_group2)
+
+    @classmethod
+    def from_workbook(cls, excel_path, mapping_manager, cache: Optional[QuoteCache] = None) -> "QuoteEngine":
+        """
+        Load every "S " worksheet and the "UofM" sheet from a ratesheet workbook.
+
+        Args:
+            excel_path: Path to the ratesheet xlsx
+            mapping_manager: ServiceMappingManager, or raw mappings keyed by account
+            cache: Optional QuoteCache of per-LP charge blocks
+
+        Returns:
+            QuoteEngine ready to price any account in the workbook
+        """
+        with profiler.span("xlsx read: QuoteEngine.from_workbook"), pd.ExcelFile(excel_path) as workbook:
+            profiler.count("xlsx reads")
+            sheet_names = [ws for ws in workbook.sheet_names if ws.startswith("S ")]
+            sheets = pd.read_excel(workbook, sheet_name=sheet_names + ["UofM"])
+            profiler.count("xlsx sheets read", len(sheet_names) + 1)
+        services_uofm, group1, group2 = parse_uofm_sheet(sheets.pop("UofM"))
+        return cls(sheets, services_uofm, group1, group2, mapping_manager, cache)
+
+    @property
+    def accounts(self) -> List[str]:
+        """Names of the ratesheet worksheets the engine can price."""
+        return list(self.ratesheets.keys())
+
+    def rate_index(self, account: str) -> pd.DataFrame:
+        """Get the (source, target) rate index of an account, building it once."""
+        if account not in self._rate_indexes:
+            self._rate_indexes[account] = build_rate_index(self.ratesheets[account])
+        return self._rate_indexes[account]
+
+    def reuse_sheet_state(self, other: "QuoteEngine"):
+        """
+        Take over another engine's rate indexes and sheet versions.
+
+        Only worksheets this engine shares with the other one (the same
+        DataFrame object) are taken over; the rest are built on first use.
+
+        Args:
+            other: Engine over an earlier version of the workbook
+        """
+        for account, df in self.ratesheets.items():
+            if other.ratesheets.get(account) is not df:
+                continue
+            if account in other._rate_indexes:
+                self._rate_indexes.setdefault(account, other._rate_indexes[account])
+            if account in other._sheet_versions:
+                self._sheet_versions.setdefault(account, other._sheet_versions[account])
+
+    def sheet_version(self, account: str) -> str:
+        """Get the content hash of an account's worksheet, computing it once."""
+        if account not in self._sheet_versions:
+            self._sheet_versions[account] = dataframe_version(self.ratesheets[account])
+        return self._sheet_versions[account]
+
+    def pricing_config(self, account: str) -> AccountPricingConfig:
+        """Get the compiled pricing config of an account."""
+        if hasattr(self.mappings, "get_pricing_config"):
+            return self.mappings.get_pricing_config(account)
+        if account not in self._pricing_configs:
+            self._pricing_configs[account] = compile_pricing_config(account, self.mappings.get(account, {}))
+        return self._pricing_configs[account]
+
+    def validate(self, request: QuoteRequest):
+        """
+        Check a request can be priced.
+
+        Raises:
+            ValueError: If the request is incomplete or invalid
+        """
+        if not request.lps:
+            raise ValueError("Please save at least one Language Pair before saving charges.")
+        if not request.services:
+            raise ValueError("Please select at least one service before saving charges.")
+        if request.account not in self.ratesheets:
+            raise ValueError(f"Ratesheet '{request.account}' not found.")
+        if request.hourly_divider is not None and request.hourly_divider <= 0:
+            raise ValueError("Hourly divider must be greater than zero.")
+
+    def service_quantities(self, request: QuoteRequest) -> Dict[str, float]:
+        """Get the per-service quantities shared by every LP of a request."""
+        config = self.pricing_config(request.account)
+        percentages = {PERCENTAGE_SERVICES[0]: config.default_pm_percent}
+        percentages.update(request.percentages)
+        return compute_service_quantities(
+            resolve_line_services(request.services),
+            self.services_uofm,
+            config,
+            request.label_values(),
+            request.use_qtc_input,
+            request.file_type,
+            percentages
+        )
+
+    def _compute(self, request: QuoteRequest, lps: Sequence[str], quantities: Dict[str, float]):
+        return compute_charges(
+            lps,
+            request.services,
+            self.ratesheets[request.account],
+            self.services_uofm,
+            self.service_group1,
+            self.service_group2,
+            quantities,
+            request.min_fee,
+            rate_index=self.rate_index(request.account)
+        )
+
+    def _cached_charges(self, request: QuoteRequest, quantities: Dict[str, float]):
+        """Serve unchanged LPs from the cache and price only the missing ones."""
+        line_services = resolve_line_services(request.services)
+        settings = canonical_key(
+            self.sheet_version(request.account), self._labels_version, request.account,
+            request.services, [quantities.get(svc, 0) for svc in line_services], request.min_fee
+        )
+
+        blocks, missing = {}, []
+        for lp in dict.fromkeys(request.lps):
+            entry = self.cache.get((settings, lp))
+            if entry is None:
+                missing.append(lp)
+            else:
+                blocks[lp] = entry
+
+        if missing:
+            charges, fallback_lps = self._compute(request, missing, quantities)
+            fallback_lps = set(fallback_lps)
+            # Every LP block starts with its "x" line
+            starts = np.flatnonzero(charges["Mark New Line Item"].to_numpy() == "x")
+            for lp, rows in zip(missing, np.split(charges.to_numpy(dtype=object), starts[1:])):
+                blocks[lp] = (rows, lp in fallback_lps)
+                self.cache.put((settings, lp), rows, lp in fallback_lps)
+
+        charges = pd.DataFrame(np.concatenate([blocks[lp][0] for lp in request.lps]), columns=CHARGES_HEADERS)
+        charges[["Quantity", "Rate"]] = charges[["Quantity", "Rate"]].astype(float)
+        return charges, [lp for lp in request.lps if blocks[lp][1]]
+
+    def quote(self, request: QuoteRequest) -> Quote:
+        """
+        Price a request.
+
+        Args:
+            request: QuoteRequest to price
+
+        Returns:
+            Quote with the charges table and MT fallback LPs
+
+        Raises:
+            ValueError: If the request is incomplete or invalid
+        """
+        self.validate(request)
+        quantities = self.service_quantities(request)
+        if self.cache is not None:
+            charges, fallback_lps = self._cached_charges(request, quantities)
+        else:
+            charges, fallback_lps = self._compute(request, request.lps, quantities)
+        return Quote(request, charges, fallback_lps)
+
+    def quote_chunks(self, request: QuoteRequest, chunk_size: int = QUOTE_CHUNK_LPS) -> Iterator[Quote]:
+        """
+        Price a request a few LPs at a time.
+
+        Every LP is priced independently, so the chunks joined with
+        Quote.concat equal quote(request). Callers can report progress or
+        stop between chunks.
+
+        Args:
+            request: QuoteRequest to price
+            chunk_size: LPs per chunk
+
+        Yields:
+            Quote of each consecutive chunk of LPs
+
+        Raises:
+            ValueError: If the request is incomplete or invalid
+        """
+        self.validate(request)
+        for start in range(0, len(request.lps), chunk_size):
+            yield self.quote(replace(request, lps=list(request.lps[start:start + chunk_size])))
@@ -0,0 +1,136 @@
+"""
+Quote Session Module
+Save and restore the full state of a quote in one compact file.
+
+A session holds everything needed to rebuild a quote in the app: the
+account, LPs, selected services, QuoteMe and QTC counts and the quote
+settings. It is stored as minified JSON, written to a temporary file and
+swapped in, so a crash while saving never corrupts an existing session.
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, List
+
+SESSION_VERSION = 1
+SESSION_FILETYPES = [("Quote sessions", "*.oss.json"), ("JSON files", "*.json")]
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_str_list(value) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+# Check of each field's JSON value; a session file is user input
+_FIELD_CHECKS = {
+    "account": lambda value: isinstance(value, str),
+    "lps": _is_str_list,
+    "services": _is_str_list,
+    "quoteme": lambda value: isinstance(value, dict),
+    "qtc": lambda value: isinstance(value, dict),
+    "use_qtc_input": lambda value: isinstance(value, bool),
+    "file_type": lambda value: isinstance(value, str),
+    "min_fee": _is_int,
+    "hourly_divider": _is_int,
+    "pa_entity": lambda value: isinstance(value, str),
+}
+
+
+@dataclass
+class QuoteSession:
+    """
+    State of a quote in the One Stop Shop app.
+
+    Attributes:
+        account: Ratesheet worksheet name
+        lps: Language pair strings, in order
+        services: Selected services
+        quoteme: QuoteMe entry values by label
+        qtc: QTC entry values by label
+        use_qtc_input: Whether QTC input is active
+        file_type: "Live" or "Dead"
+        min_fee: Minimum fee per LP
+        hourly_divider: Hourly divider setting
+        pa_entity: Selected PA entity
+    """
+    account: str
+    lps: List[str] = field(default_factory=list)
+    services: List[str] = field(default_factory=list)
+    quoteme: Dict[str, int] = field(default_factory=dict)
+    qtc: Dict[str, int] = field(default_factory=dict)
+    use_qtc_input: bool = False
+    file_type: str = "Live"
+    min_fee: int = 150
+    hourly_divider: int = 1000
+    pa_entity: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), version=SESSION_VERSION)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuoteSession":
+        """
+        Build a session from its dictionary form.
+
+        Raises:
+            ValueError: If the data is not a session, has a field of the
+                wrong type or comes from a newer version
+        """
+        if not isinstance(data, dict) or "account" not in data:
+            raise ValueError("Not a quote session file.")
+        version = data.get("version", SESSION_VERSION)
+        if not _is_int(version):
+            raise ValueError(f"Not a quote session file: invalid version {version!r}.")
+        if version > SESSION_VERSION:
+            raise ValueError("This quote session was saved by a newer version of the app.")
+        values = {f.name: data[f.name] for f in fields(cls) if f.name in data}
+        for name, value in values.items():
+            if not _FIELD_CHECKS[name](value):
+                raise ValueError(f"Not a quote session file: invalid {name} {value!r}.")
+        return cls(**values)
+
+
+def save_session(session: QuoteSession, file_path):
+    """
+    Write a session atomically.
+
+    Args:
+        session: Session to save
+        file_path: Target file path
+    """
+    folder = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(dir=folder, prefix=".session-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(session.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def load_session(file_path) -> QuoteSession:
+    """
+    Read a session file.
+
+    Args:
+        file_path: Session file path
+
+    Returns:
+        QuoteSession
+
+    Raises:
+        ValueError: If the file is not a valid session
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Not a quote session file: {e}")
+    return QuoteSession.from_dict(data)
@@ -4,8 +4,41 @@ Handles all rate and quantity calculations for services.
 """
 
 import math
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, NamedTuple, Optional, Sequence, Union
+
+from .pricing_config import AccountPricingConfig
+
+
+class PercentageService(NamedTuple):
+    """
+    Declares how a percentage-based service is rated.
+    
+    The rate of a percentage line is the value (quantity x rate) of the lines
+    above it; its quantity is the percentage as a fraction.
+    
+    Attributes:
+        name: Service name
+        include_self: Gross the rate up so it also covers the line's own value
+        include_percentages: Include earlier percentage lines in the base
+    """
+    name: str
+    include_self: bool = False
+    include_percentages: bool = True
+
+
+# Project Management is rated on every line above it. Rush Premium also covers
+# Project Management; its "itself" term was always zero (the rate is not known
+# yet when the sum runs), so it is not grossed up.
+DEFAULT_PERCENTAGE_SERVICES = (
+    PercentageService("Project Management"),
+    PercentageService("Rush Premium"),
+)
+
+# Services replaced by a single Minimum line when the LP is below the min fee
+MINIMUM_FEE_SERVICES = ("Translation", "Machine Translation")
+BACK_TRANSLATION = "Back Translation"
 
 
 def get_service_type(service: str, uom: str) -> str:
@@ -34,7 +67,7 @@ def calculate_hourly_quantity(
     quoteme_wc: float,
     qtc_wc_translation: float,
     qtc_wc_revision: float,
-    config: Dict[str, Any]
+    config: Union[Dict[str, Any], AccountPricingConfig]
 ) -> float:
     """
     Calculate the quantity for an hourly service based on configuration.
@@ -46,11 +79,16 @@ def calculate_hourly_quantity(
         quoteme_wc: Total QuoteMe word count
         qtc_wc_translation: QTC word count for translation
         qtc_wc_revision: QTC word count for revision
-        config: Service configuration mapping
+        config: Service configuration mapping, raw or compiled
     
     Returns:
         Calculated quantity in hours
     """
+    if isinstance(config, AccountPricingConfig):
+        return _compiled_hourly_quantity(
+            service, file_type, use_qtc_input, quoteme_wc, qtc_wc_translation, qtc_wc_revision, config
+        )
+    
     min_hourly_rate = float(config.get("min_hourly_rate", 0.5) or 0.5)
     increment_rate = float(config.get("increment_rate", 0.25) or 0.25)
     
@@ -81,6 +119,101 @@ def calculate_hourly_quantity(
     return max(hours_ceiled, min_hourly_rate)
 
 
+def _compiled_hourly_quantity(
+    service: str,
+    file_type: str,
+    use_qtc_input: bool,
+    quoteme_wc: float,
+    qtc_wc_translation: float,
+    qtc_wc_revision: float,
+    config: AccountPricingConfig
+) -> float:
+    """calculate_hourly_quantity on a compiled config: no dict walks or parsing."""
+    pricing = config.service(service)
+    divider = pricing.divider(use_qtc_input, file_type)
+    
+    if not use_qtc_input:
+        wc = quoteme_wc
+    elif pricing.qtc_wc_source == "translation":
+        wc = qtc_wc_translation
+    elif pricing.qtc_wc_source == "revision":
+        wc = qtc_wc_revision
+    else:
+        wc = 0
+    
+    if divider == 0:
+        return config.min_hourly_rate
+    
+    hours_ceiled = math.ceil(wc / divider / config.increment_rate) * config.increment_rate
+    return max(hours_ceiled, config.min_hourly_rate)
+
+
+def calculate_hourly_quantities(
+    services,
+    file_types,
+    use_qtc_input,
+    quoteme_wc,
+    qtc_wc_translation,
+    qtc_wc_revision,
+    config: Union[Dict[str, Any], AccountPricingConfig]
+) -> np.ndarray:
+    """
+    Calculate hourly quantities for many jobs at once.
+    
+    Array version of calculate_hourly_quantity. Arguments broadcast against
+    each other, so a single service or file type can be combined with a
+    vector of word counts and vice versa. Dividers are resolved once per
+    distinct service; the ceil-to-increment and minimum hours rules are
+    applied with NumPy.
+    
+    Args:
+        services: Service name(s)
+        file_types: "Live" or "Dead" value(s)
+        use_qtc_input: Whether QTC input is used, per job or for all jobs
+        quoteme_wc: Total QuoteMe word count(s)
+        qtc_wc_translation: QTC word count(s) for translation
+        qtc_wc_revision: QTC word count(s) for revision
+        config: Service configuration mapping, raw or compiled
+    
+    Returns:
+        Array of quantities in hours
+    """
+    if not isinstance(config, AccountPricingConfig):
+        config = AccountPricingConfig("", config)
+    min_hourly_rate = config.min_hourly_rate
+    increment_rate = config.increment_rate
+    
+    services, is_live, use_qtc, quoteme_wc, qtc_wc_translation, qtc_wc_revision = np.broadcast_arrays(
+        np.asarray(services, dtype=object),
+        np.asarray(file_types, dtype=object) == "Live",
+        np.asarray(use_qtc_input, dtype=bool),
+        np.asarray(quoteme_wc, dtype=float),
+        np.asarray(qtc_wc_translation, dtype=float),
+        np.asarray(qtc_wc_revision, dtype=float),
+    )
+    
+    # Resolve dividers and the QTC word count source once per distinct service
+    unique_services, inverse = np.unique(services.astype(str), return_inverse=True)
+    inverse = inverse.reshape(services.shape)
+    # Columns: QuoteMe live, QuoteMe dead, QTC live, QTC dead
+    dividers = np.ones((len(unique_services), 4))
+    qtc_source = np.zeros(len(unique_services), dtype=int)
+    for i, service in enumerate(unique_services):
+        pricing = config.service(service)
+        dividers[i] = pricing.quoteme_dividers + pricing.qtc_dividers
+        qtc_source[i] = {"translation": 1, "revision": 2}.get(pricing.qtc_wc_source, 0)
+    
+    divider_col = np.where(use_qtc, 2, 0) + np.where(is_live, 0, 1)
+    divider = dividers[inverse, divider_col]
+    source = qtc_source[inverse]
+    qtc_wc = np.select([source == 1, source == 2], [qtc_wc_translation, qtc_wc_revision], 0.0)
+    wc = np.where(use_qtc, qtc_wc, quoteme_wc)
+    
+    safe_divider = np.where(divider == 0, 1, divider)
+    hours_ceiled = np.ceil(wc / safe_divider / increment_rate) * increment_rate
+    return np.where(divider == 0, min_hourly_rate, np.maximum(hours_ceiled, min_hourly_rate))
+
+
 def get_word_rate(
     df_ratesheet: pd.DataFrame,
     source_lang: str,
@@ -145,13 +278,119 @@ def get_hourly_rate(df_ratesheet: pd.DataFrame, service: str) -> float:
     return 0
 
 
+def _minimum_fee_masks(
+    charges: pd.DataFrame,
+    min_fee: float,
+    group_column: str
+):
+    """Find the rows to turn into Minimum lines and the rows to zero out."""
+    quantity = pd.to_numeric(charges["Quantity"], errors="coerce").fillna(0)
+    rate = pd.to_numeric(charges["Rate"], errors="coerce").fillna(0)
+    value = quantity * rate
+    
+    service = charges["Service"]
+    is_bt = service == BACK_TRANSLATION
+    is_word = (charges["UofM"] == "Word") & ~is_bt
+    is_minimum_service = service.isin(MINIMUM_FEE_SERVICES)
+    
+    # Word sum-product (excluding Back Translation) and Back Translation sum per group
+    sums = pd.DataFrame({
+        "word": value.where(is_word, 0),
+        "bt": value.where(is_bt, 0),
+    }).groupby(charges[group_column], sort=False).transform("sum")
+    below = sums["word"] < min_fee
+    
+    minimum = (below & is_minimum_service) | (is_bt & (sums["bt"] < min_fee))
+    zeroed = below & is_word & ~is_minimum_service
+    return minimum, zeroed, quantity, rate
+
+
+def apply_minimum_fee(
+    charges: pd.DataFrame,
+    min_fee: float,
+    group_column: str = "Line Item Description"
+) -> pd.DataFrame:
+    """
+    Apply minimum fee logic to a charges table, for all LPs at once.
+    
+    The Word sum-product (excluding Back Translation) and the Back Translation
+    sum are computed per LP with a single groupby. LPs below the minimum fee
+    get Translation/Machine Translation replaced by a Minimum line and their
+    other Word services zeroed; a Back Translation below the minimum fee is
+    replaced by its own Minimum line.
+    
+    Args:
+        charges: Charges table with Service, UofM, Quantity and Rate columns
+        min_fee: Minimum fee threshold
+        group_column: Column identifying the LP of each row
+    
+    Returns:
+        Copy of the charges table with minimum fee logic applied
+    """
+    minimum, zeroed, quantity, rate = _minimum_fee_masks(charges, min_fee, group_column)
+    
+    quantity = quantity.mask(zeroed, 0).mask(minimum, 1)
+    rate = rate.mask(minimum, min_fee)
+    
+    result = charges.copy()
+    result["Quantity"] = quantity
+    result["Rate"] = rate
+    result.loc[minimum, "UofM"] = "Minimum"
+    return result
+
+
+def apply_minimum_fee_grid(
+    quantities: np.ndarray,
+    rates: np.ndarray,
+    line_services: Sequence[str],
+    line_uofm: Sequence[str],
+    min_fee: float,
+    active: Optional[np.ndarray] = None
+):
+    """
+    Apply minimum fee logic to quantity/rate grids with lines on the last axis.
+    
+    Same rules as apply_minimum_fee, with every leading index (LP, scenario,
+    ...) checked against the minimum fee on its own.
+    
+    Args:
+        quantities: Line quantities (..., lines)
+        rates: Line rates, same shape as quantities
+        line_services: Service name of each line
+        line_uofm: UofM of each line
+        min_fee: Minimum fee threshold
+        active: Optional mask of lines that are billed
+    
+    Returns:
+        Tuple of (quantities, rates, minimum mask), new arrays
+    """
+    quantities = np.nan_to_num(np.array(quantities, dtype=float), nan=0.0)
+    rates = np.nan_to_num(np.array(rates, dtype=float), nan=0.0)
+    billed = np.ones(quantities.shape, dtype=bool) if active is None else np.broadcast_to(active, quantities.shape)
+    
+    is_bt = np.array([svc == BACK_TRANSLATION for svc in line_services])
+    is_word = (np.asarray(line_uofm, dtype=object) == "Word") & ~is_bt
+    is_minimum_service = np.array([svc in MINIMUM_FEE_SERVICES for svc in line_services])
+    
+    values = quantities * rates * billed
+    below = ((values * is_word).sum(axis=-1) < min_fee)[..., None]
+    bt_below = ((values * is_bt).sum(axis=-1) < min_fee)[..., None]
+    
+    minimum = billed & ((below & is_minimum_service) | (is_bt & bt_below))
+    zeroed = billed & below & is_word & ~is_minimum_service
+    quantities[zeroed] = 0
+    quantities[minimum] = 1
+    rates[minimum] = min_fee
+    return quantities, rates, minimum
+
+
 def apply_minimum_fee_logic(
     row_data: list,
     services_uofm: Dict[str, str],
     min_fee: float
 ) -> list:
     """
-    Apply minimum fee logic to service rows.
+    Apply minimum fee logic to the service rows of a single LP.
     
     Args:
         row_data: List of dictionaries containing service row data
@@ -161,34 +400,80 @@ def apply_minimum_fee_logic(
     Returns:
         Updated row_data with minimum fee logic applied
     """
-    # Calculate sumproduct for Word services except Back Translation
-    word_sumproduct = sum(
-        float(row["quantity"]) * float(row["rate"])
-        for row in row_data
-        if services_uofm.get(row["service"], "") == "Word" and row["service"] != "Back Translation"
-    )
+    if not row_data:
+        return row_data
+    
+    charges = pd.DataFrame({
+        "LP": 0,
+        "Service": [row["service"] for row in row_data],
+        "UofM": [services_uofm.get(row["service"], "") for row in row_data],
+        "Quantity": [row["quantity"] for row in row_data],
+        "Rate": [row["rate"] for row in row_data],
+    })
+    minimum, zeroed, _, _ = _minimum_fee_masks(charges, min_fee, "LP")
     
-    if word_sumproduct < min_fee:
-        for row in row_data:
-            if row["service"] in ["Translation", "Machine Translation"]:
-                row["UofM"] = "Minimum"
-                row["quantity"] = 1
-                row["rate"] = min_fee
-            elif services_uofm.get(row["service"], "") == "Word" and row["service"] != "Back Translation":
-                row["quantity"] = 0
-    
-    # Back Translation min fee logic
-    bt_row = next((row for row in row_data if row["service"] == "Back Translation"), None)
-    if bt_row:
-        bt_sum = float(bt_row["quantity"]) * float(bt_row["rate"])
-        if bt_sum < min_fee:
-            bt_row["UofM"] = "Minimum"
-            bt_row["quantity"] = 1
-            bt_row["rate"] = min_fee
+    for i in np.flatnonzero(zeroed.to_numpy()):
+        row_data[i]["quantity"] = 0
+    for i in np.flatnonzero(minimum.to_numpy()):
+        row_data[i]["UofM"] = "Minimum"
+        row_data[i]["quantity"] = 1
+        row_data[i]["rate"] = min_fee
     
     return row_data
 
 
+def apply_percentage_services(
+    quantities: np.ndarray,
+    rates: np.ndarray,
+    line_services: Sequence[str],
+    percentage_services: Sequence[PercentageService] = DEFAULT_PERCENTAGE_SERVICES,
+    active: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Rate all percentage-based lines from a running prefix sum of quantity x rate.
+    
+    Lines are laid out along the last axis, so a 2-D grid prices every LP at
+    once. Each percentage line is evaluated once, in order, which keeps the
+    cost linear in the number of lines.
+    
+    Args:
+        quantities: Line quantities (lines, or LPs x lines)
+        rates: Line rates, same shape as quantities
+        line_services: Service name of each line
+        percentage_services: Percentage service declarations
+        active: Optional mask of lines that are billed
+    
+    Returns:
+        Copy of rates with percentage lines filled in
+    """
+    specs = {spec.name: spec for spec in percentage_services}
+    quantities = np.asarray(quantities, dtype=float)
+    rates = np.nan_to_num(np.array(rates, dtype=float), nan=0.0)
+    billed = np.ones(quantities.shape, dtype=bool) if active is None else np.asarray(active, dtype=bool)
+    
+    percentage_cols = [i for i, svc in enumerate(line_services) if svc in specs]
+    if not percentage_cols:
+        return rates
+    
+    values = quantities * rates * billed
+    values[..., percentage_cols] = 0
+    base_prefix = np.cumsum(values, axis=-1) - values
+    percentage_total = np.zeros(quantities.shape[:-1])
+    
+    for col in percentage_cols:
+        spec = specs[line_services[col]]
+        base = base_prefix[..., col]
+        if spec.include_percentages:
+            base = base + percentage_total
+        if spec.include_self:
+            share = quantities[..., col]
+            base = np.where(share < 1, base / np.where(share < 1, 1 - share, 1), base)
+        rates[..., col] = np.round(base, 6)
+        percentage_total = percentage_total + quantities[..., col] * rates[..., col] * billed[..., col]
+    
+    return rates
+
+
 def calculate_percentage_service_rate(
     row_data: list,
     service_index: int,
@@ -197,6 +482,9 @@ def calculate_percentage_service_rate(
     """
     Calculate rate for percentage-based services (Project Management, Rush Premium).
     
+    Kept for callers that rate a single row; use apply_percentage_services
+    to rate every percentage line in one pass.
+    
     Args:
         row_data: List of service row dictionaries
         service_index: Index of the current service in row_data
@@ -205,20 +493,13 @@ def calculate_percentage_service_rate(
     Returns:
         Calculated rate based on sum of previous services
     """
-    total_value = 0
-    
-    if service_name == "Project Management":
-        # Sum all services above (excluding itself)
-        for j in range(service_index):
-            total_value += float(row_data[j]["quantity"]) * float(row_data[j]["rate"])
-    elif service_name == "Rush Premium":
-        # Sum all services above (including Project Management and itself)
-        for j in range(service_index + 1):
-            q = float(row_data[j]["quantity"])
-            r = float(row_data[j]["rate"]) if row_data[j]["rate"] is not None else 0
-            total_value += q * r
+    if service_name not in [spec.name for spec in DEFAULT_PERCENTAGE_SERVICES]:
+        return 0
     
-    return round(total_value, 6)
+    rows = row_data[:service_index]
+    quantities = np.array([float(row["quantity"]) for row in rows])
+    rates = np.array([float(row["rate"]) if row["rate"] is not None else 0 for row in rows])
+    return round(float(np.dot(quantities, rates)), 6)
 
 
 def sanitize_csv_value(val) -> str:
@@ -0,0 +1,234 @@
+"""
+Ratesheet Model Module
+In-memory view of the ratesheet workbook shared by the app callbacks.
+
+The workbook is read once ("Services per account", "UofM" and every "S "
+sheet) and indexed: services per account, UofM and service group maps,
+the language list of each sheet and the (source, target) rate index of
+the QuoteEngine. Switching accounts, populating widgets and exporting
+then query these structures instead of reading the xlsx again.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+
+from .profiling import profiler
+from .quote_cache import QuoteCache, dataframe_version
+from .quote_engine import QuoteEngine, parse_uofm_sheet
+
+
+SERVICES_SHEET = "Services per account"
+UOFM_SHEET = "UofM"
+RATESHEET_PREFIX = "S "
+
+
+def account_name(sheet_name: str) -> str:
+    """Get the "Services per account" column of a ratesheet ("S IQVIA" -> "IQVIA")."""
+    return sheet_name.replace(RATESHEET_PREFIX, "")
+
+
+def parse_services_sheet(df_services: pd.DataFrame) -> Dict[str, List[str]]:
+    """
+    Read the services offered to each account.
+
+    Args:
+        df_services: DataFrame containing the "Services per account" worksheet
+
+    Returns:
+        Dictionary mapping account column names to their services
+    """
+    return {
+        str(column): df_services[column].dropna().tolist()
+        for column in df_services.columns
+    }
+
+
+class RatesheetModel:
+    """
+    Indexed, read-only contents of a ratesheet workbook.
+
+    Language lists are built on first use per sheet; rate indexes are kept
+    by the wrapped QuoteEngine.
+    """
+
+    def __init__(
+        self,
+        ratesheets: Dict[str, pd.DataFrame],
+        df_services: pd.DataFrame,
+        df_uofm: pd.DataFrame,
+        mappings,
+        cache: Optional[QuoteCache] = None
+    ):
+        """
+        Initialize RatesheetModel.
+
+        Args:
+            ratesheets: "S " worksheets keyed by sheet name
+            df_services: "Services per account" worksheet
+            df_uofm: "UofM" worksheet
+            mappings: ServiceMappingManager, or raw mappings keyed by account
+            cache: Optional QuoteCache of per-LP charge blocks
+        """
+        self.df_services = df_services
+        self.df_uofm = df_uofm
+        self.services_by_account = parse_services_sheet(df_services)
+        services_uofm, service_group1, service_group2 = parse_uofm_sheet(df_uofm)
+        self.engine = QuoteEngine(ratesheets, services_uofm, service_group1, service_group2, mappings, cache)
+        self._languages: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_workbook(
+        cls,
+        excel_path,
+        mappings,
+        cache: Optional[QuoteCache] = None,
+        progress: Optional[Callable[[float, str], None]] = None
+    ) -> "RatesheetModel":
+        """
+        Read a ratesheet workbook once.
+
+        Args:
+            excel_path: Path to the ratesheet xlsx
+            mappings: ServiceMappingManager, or raw mappings keyed by account
+            cache: Optional QuoteCache of per-LP charge blocks
+            progress: Optional callback(fraction, message), called after each sheet
+
+        Returns:
+            RatesheetModel of the workbook
+
+        Raises:
+            ValueError: If the "Services per account" or "UofM" sheet is missing
+        """
+        sheets = {}
+        with profiler.span("xlsx read: ratesheet load"), pd.ExcelFile(excel_path) as workbook:
+            profiler.count("xlsx reads")
+            names = [ws for ws in workbook.sheet_names if ws.startswith(RATESHEET_PREFIX)]
+            wanted = [SERVICES_SHEET, UOFM_SHEET] + names
+            for i, sheet_name in enumerate(wanted, start=1):
+                sheets[sheet_name] = pd.read_excel(workbook, sheet_name=sheet_name)
+                profiler.count("xlsx sheets read")
+                if progress:
+                    progress(i / len(wanted), f"Loaded {sheet_name}")
+        return cls(
+            {name: sheets[name] for name in names},
+            sheets[SERVICES_SHEET], sheets[UOFM_SHEET], mappings, cache
+        )
+
+    @classmethod
+    def empty(cls, mappings, cache: Optional[QuoteCache] = None) -> "RatesheetModel":
+        """Model without any sheet, used when the workbook cannot be read."""
+        return cls({}, pd.DataFrame(), pd.DataFrame(), mappings, cache)
+
+    def reload_sheets(
+        self,
+        excel_path,
+        candidates: Iterable[str],
+        sheet_names: Optional[Sequence[str]] = None
+    ) -> Tuple["RatesheetModel", Set[str]]:
+        """
+        Build a new model, re-reading only some sheets of the workbook.
+
+        A re-read sheet whose contents did not change keeps its old
+        DataFrame (and language list); the new engine takes over the rate
+        indexes and content hashes of every kept sheet, and cached quotes
+        of those sheets stay valid. This model is left untouched, so readers
+        never see a half-updated model.
+
+        Args:
+            excel_path: Path to the ratesheet xlsx
+            candidates: Names of the sheets that may have changed
+            sheet_names: "S " sheets of the workbook now (default: the current
+                ones); sheets not loaded yet are read, missing ones dropped
+
+        Returns:
+            Tuple of (new model, names of the sheets whose contents changed)
+        """
+        candidates = set(candidates)
+        sheet_names = list(self.sheet_names if sheet_names is None else sheet_names)
+        current = dict(self.ratesheets, **{SERVICES_SHEET: self.df_services, UOFM_SHEET: self.df_uofm})
+        to_read = [
+            name for name in [SERVICES_SHEET, UOFM_SHEET] + sheet_names
+            if name in candidates or name not in current
+        ]
+        fresh = {}
+        if to_read:
+            with profiler.span("xlsx read: ratesheet reload"):
+                fresh = pd.read_excel(excel_path, sheet_name=to_read)
+            profiler.count("xlsx reads")
+            profiler.count("xlsx sheets read", len(to_read))
+        changed = {
+            name for name, df in fresh.items()
+            if name not in current or dataframe_version(df) != (
+                # The engine keeps the hashes of the "S " sheets it has priced
+                self.engine.sheet_version(name) if name in self.ratesheets else dataframe_version(current[name])
+            )
+        }
+        sheets = {name: fresh[name] if name in changed else current[name] for name in current.keys() | fresh.keys()}
+
+        model = RatesheetModel(
+            {name: sheets[name] for name in sheet_names},
+            sheets[SERVICES_SHEET], sheets[UOFM_SHEET],
+            self.engine.mappings, self.engine.cache
+        )
+        model.engine.reuse_sheet_state(self.engine)
+        model._languages = {
+            name: languages for name, languages in self._languages.items()
+            if name in model.ratesheets and name not in changed
+        }
+        return model, changed
+
+    @property
+    def ratesheets(self) -> Dict[str, pd.DataFrame]:
+        return self.engine.ratesheets
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """Names of the "S " worksheets, in workbook order."""
+        return self.engine.accounts
+
+    @property
+    def services_uofm(self) -> Dict[str, str]:
+        return self.engine.services_uofm
+
+    @property
+    def service_group1(self) -> Dict[str, str]:
+        return self.engine.service_group1
+
+    @property
+    def service_group2(self) -> Dict[str, str]:
+        return self.engine.service_group2
+
+    def services(self, sheet_name: str) -> Optional[List[str]]:
+        """
+        Get the services offered on a ratesheet.
+
+        Returns:
+            List of services, or None if the account has no column in
+            "Services per account"
+        """
+        services = self.services_by_account.get(account_name(sheet_name))
+        return list(services) if services is not None else None
+
+    def max_service_count(self) -> int:
+        """Get the largest number of services offered on any ratesheet."""
+        counts = [len(self.services(name) or []) for name in self.sheet_names]
+        return max(counts, default=0)
+
+    def languages(self, sheet_name: str) -> List[str]:
+        """
+        Get the sorted source and target languages of a ratesheet.
+
+        Raises:
+            KeyError: If the sheet or its language columns do not exist
+        """
+        if sheet_name not in self._languages:
+            df = self.ratesheets[sheet_name]
+            source_languages = df["Source Language"].dropna().unique()
+            target_languages = df["Target Language"].dropna().unique()
+            self._languages[sheet_name] = sorted(set(source_languages).union(set(target_languages)))
+        return self._languages[sheet_name]
+
+    def rate_index(self, sheet_name: str) -> pd.DataFrame:
+        """Get the (source, target) rate index of a ratesheet."""
+        return self.engine.rate_index(sheet_name)
@@ -0,0 +1,171 @@
+"""
+Ratesheet Watcher Module
+Pick up edits to the ratesheet workbook while the app is running.
+
+A background thread polls the file size and modification time. Only when
+they change is the file hashed (so a touch or a copy of identical bytes
+does nothing), and only when the hash changes are the sheets compared.
+An xlsx is a zip archive with one XML member per worksheet, so comparing
+the CRCs of those members tells which sheets may have been edited without
+parsing any of them. Only those sheets are read again, and the ones whose
+contents really changed are swapped into a new RatesheetModel that is
+handed to the on_reload callback; the previous model is never modified.
+"""
+
+import hashlib
+import os
+import threading
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from .profiling import profiler
+from .ratesheet_model import RATESHEET_PREFIX, SERVICES_SHEET, UOFM_SHEET, RatesheetModel
+from .utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+# Members every worksheet depends on: cell text and number formats
+SHARED_MEMBERS = ("xl/sharedStrings.xml", "xl/styles.xml")
+
+
+def file_stat(excel_path) -> Optional[Tuple[int, int]]:
+    """Get (mtime in ns, size) of a file, or None if it cannot be read."""
+    try:
+        stat = os.stat(excel_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def file_digest(excel_path, chunk_size: int = 1 << 20) -> str:
+    """SHA-1 of the file contents."""
+    digest = hashlib.sha1()
+    with open(excel_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sheet_signatures(excel_path) -> Dict[str, str]:
+    """
+    Get a signature of every worksheet of an xlsx, in workbook order.
+
+    The signature combines the CRC of the worksheet's XML member with the
+    CRCs of the shared strings and styles, so it changes whenever the
+    values pandas would read from the sheet can change.
+
+    Args:
+        excel_path: Path to the xlsx
+
+    Returns:
+        Dictionary mapping sheet names to signatures
+    """
+    with zipfile.ZipFile(excel_path) as archive:
+        crcs = {info.filename: info.CRC for info in archive.infolist()}
+        workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+        relationships = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+
+    targets = {rel.get("Id"): rel.get("Target", "") for rel in relationships}
+    shared = "-".join(f"{crcs.get(member, 0):08x}" for member in SHARED_MEMBERS)
+    signatures = {}
+    for sheet in workbook.iter(f"{{{MAIN_NS}}}sheet"):
+        target = targets.get(sheet.get(f"{{{REL_NS}}}id"), "")
+        member = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+        signatures[sheet.get("name")] = f"{crcs.get(member, 0):08x}-{shared}"
+    return signatures
+
+
+class RatesheetWatcher:
+    """
+    Polls the ratesheet workbook and reloads the sheets that changed.
+
+    on_reload(model, changed) is called from the watcher thread with the
+    new model and the names of the changed sheets; GUI callers should hand
+    it over to their UI thread.
+    """
+
+    def __init__(
+        self,
+        excel_path,
+        model: RatesheetModel,
+        on_reload: Callable[[RatesheetModel, Set[str]], None],
+        interval: float = 2.0
+    ):
+        """
+        Initialize RatesheetWatcher.
+
+        Args:
+            excel_path: Path to the ratesheet xlsx
+            model: Model currently loaded from the workbook
+            on_reload: Callback(model, changed sheet names)
+            interval: Seconds between polls
+        """
+        self.excel_path = excel_path
+        self.model = model
+        self.on_reload = on_reload
+        self.interval = interval
+        self._stat = file_stat(excel_path)
+        self._digest = file_digest(excel_path) if self._stat else None
+        self._signatures = sheet_signatures(excel_path) if self._stat else {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def poll(self) -> Set[str]:
+        """
+        Check the workbook once and reload it if it changed.
+
+        A workbook that cannot be read (e.g. still being saved) is retried
+        on the next poll.
+
+        Returns:
+            Names of the sheets that were reloaded or removed
+        """
+        stat = file_stat(self.excel_path)
+        if stat is None or stat == self._stat:
+            return set()
+        try:
+            with profiler.span("ratesheet watcher: file changed"):
+                digest = file_digest(self.excel_path)
+                if digest == self._digest:
+                    self._stat = stat
+                    return set()
+                signatures = sheet_signatures(self.excel_path)
+                sheet_names = [name for name in signatures if name.startswith(RATESHEET_PREFIX)]
+                watched = set(sheet_names) | {SERVICES_SHEET, UOFM_SHEET}
+                candidates = {
+                    name for name, signature in signatures.items()
+                    if name in watched and self._signatures.get(name) != signature
+                }
+                model, changed = self.model.reload_sheets(self.excel_path, candidates, sheet_names)
+        except Exception as e:
+            logger.warning(f"Ratesheet not reloaded, retrying: {e}")
+            return set()
+
+        removed = set(self.model.sheet_names) - set(sheet_names)
+        self._stat, self._digest, self._signatures = stat, digest, signatures
+        changed |= removed
+        if changed:
+            self.model = model
+            logger.info(f"Ratesheet reloaded: {', '.join(sorted(changed))}")
+            self.on_reload(model, changed)
+        return changed
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def start(self):
+        """Start polling on a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ratesheet-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop polling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,112 @@
+"""
+Service Catalog Module
+Indexed lookups over the PA services of every entity.
+
+PA_SERVICES holds each entity's services as a list of rows, so finding a
+service or listing an entity's service names means scanning the rows.
+A ServiceCatalog indexes them once: entity -> service name -> row,
+entity -> ordered service names, and entity -> set of service names.
+service_catalog() keeps one catalog per PA service store and rebuilds it
+only after the store changed, so an edit is never served from a stale index.
+"""
+
+import weakref
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+
+SERVICE_COLUMN = 2  # Column of the service name in a PA service row
+
+
+class ServiceCatalog:
+    """Read-only indexes of the PA services of every entity."""
+
+    def __init__(self, pa_services: Mapping[str, Sequence[Sequence[str]]]):
+        """
+        Build the indexes.
+
+        Args:
+            pa_services: Entity name -> [header row, service rows...],
+                e.g. WF_Matrix.PA_SERVICES
+        """
+        self._names: Dict[str, Tuple[str, ...]] = {}
+        self._name_sets: Dict[str, FrozenSet[str]] = {}
+        self._rows: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+        for entity, rows in pa_services.items():
+            self._index(entity, rows[1:])  # Skip header
+
+    @classmethod
+    def from_store(cls, store) -> "ServiceCatalog":
+        """Build the catalog of a PAServiceStore, sharing its rows instead of copying them."""
+        catalog = cls({})
+        for entity in store.entity_names():
+            catalog._index(entity, store.rows(entity))
+        return catalog
+
+    def _index(self, entity: str, rows: Sequence[Sequence[str]]):
+        names, by_name = [], {}
+        for row in rows:
+            names.append(row[SERVICE_COLUMN])
+            # Like a scan, the first complete row with a name wins
+            if len(row) >= 4 and row[SERVICE_COLUMN] not in by_name:
+                by_name[row[SERVICE_COLUMN]] = row if isinstance(row, tuple) else tuple(row)
+        self._names[entity] = tuple(names)
+        self._name_sets[entity] = frozenset(names)
+        self._rows[entity] = by_name
+
+    def entities(self) -> List[str]:
+        """Get the entity names, in PA_SERVICES order."""
+        return list(self._names)
+
+    def has_entity(self, entity: str) -> bool:
+        return entity in self._names
+
+    def service_names(self, entity: str) -> Tuple[str, ...]:
+        """Get an entity's service names in row order (empty if the entity is unknown)."""
+        return self._names.get(entity, ())
+
+    def service_name_set(self, entity: str) -> FrozenSet[str]:
+        """Get an entity's service names as a set (empty if the entity is unknown)."""
+        return self._name_sets.get(entity, frozenset())
+
+    def has_service(self, entity: str, service_name: str) -> bool:
+        return service_name in self.service_name_set(entity)
+
+    def find(self, entity: str, service_name: str) -> Optional[Tuple[str, ...]]:
+        """
+        Find a service row of an entity.
+
+        Args:
+            entity: Entity name
+            service_name: Service name (column 3 of the row)
+
+        Returns:
+            (group 1, group 2, service, UofM) row, or None if not found
+        """
+        return self._rows.get(entity, {}).get(service_name)
+
+
+_store_catalogs = weakref.WeakKeyDictionary()  # store -> (store version, catalog)
+
+
+def service_catalog(pa_services: Mapping[str, Sequence[Sequence[str]]]) -> ServiceCatalog:
+    """
+    Get the catalog of a PA services mapping.
+
+    For WF_Matrix.PA_SERVICES (a view over a PAServiceStore) the catalog is
+    built once and reused until the store changes; any other mapping gets a
+    fresh catalog.
+
+    Args:
+        pa_services: Entity name -> [header row, service rows...]
+
+    Returns:
+        ServiceCatalog of the mapping's current contents
+    """
+    store = getattr(pa_services, "store", None)
+    if store is None:
+        return ServiceCatalog(pa_services)
+    store.entity_names()  # Picks up edits saved through other stores
+    cached = _store_catalogs.get(store)
+    if cached is None or cached[0] != store.version:
+        cached = (store.version, ServiceCatalog.from_store(store))
+        _store_catalogs[store] = cached
+    return cached[1]
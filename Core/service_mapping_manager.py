@@ -7,6 +7,8 @@ import json
 import os
 from typing import Dict, List, Any, Optional
 
+from .pricing_config import AccountPricingConfig, compile_pricing_config
+
 
 class ServiceMappingManager:
     """Manages service label mappings for different accounts."""
@@ -19,6 +21,7 @@ class ServiceMappingManager:
             mapping_file: Path to the mapping JSON file
         """
         self.mapping_file = mapping_file
+        self._pricing_configs: Dict[str, AccountPricingConfig] = {}
         self.all_mappings = self.load_all_mappings()
     
     def load_all_mappings(self) -> Dict[str, Any]:
@@ -28,11 +31,16 @@ class ServiceMappingManager:
         Returns:
             Dictionary mapping account keys to their service mappings
         """
+        self.invalidate_pricing_config()
         if os.path.exists(self.mapping_file):
             with open(self.mapping_file, "r", encoding="utf-8") as f:
                 return json.load(f)
         return {}
     
+    def reload_mappings(self):
+        """Re-read mappings from file, e.g. after another window saved them."""
+        self.all_mappings = self.load_all_mappings()
+    
     def save_all_mappings(self):
         """Save all mappings to file."""
         with open(self.mapping_file, "w", encoding="utf-8") as f:
@@ -63,8 +71,43 @@ class ServiceMappingManager:
             mapping: Service mapping dictionary
         """
         self.all_mappings[account_key] = mapping
+        self.invalidate_pricing_config(account_key)
         self.save_all_mappings()
     
+    def get_pricing_config(self, account_key: str) -> AccountPricingConfig:
+        """
+        Get the compiled pricing configuration for an account.
+        
+        The account block is compiled once and cached; it is recompiled only
+        when the block is replaced, saved or reloaded. Unmapped accounts get
+        one cached config too, so it can be used as a stable cache key.
+        
+        Args:
+            account_key: Account/ratesheet identifier
+        
+        Returns:
+            Immutable AccountPricingConfig
+        """
+        stored = self.all_mappings.get(account_key)  # None while the account is unmapped
+        config = self._pricing_configs.get(account_key)
+        if config is None or (stored is not None and config.source is not stored):
+            config = compile_pricing_config(account_key, self.get_mapping_for_account(account_key))
+            self._pricing_configs[account_key] = config
+        return config
+    
+    def invalidate_pricing_config(self, account_key: Optional[str] = None):
+        """
+        Drop cached pricing configurations; called whenever mappings are
+        saved or reloaded, and after editing a mapping in place.
+        
+        Args:
+            account_key: Account to invalidate, or None for all accounts
+        """
+        if account_key is None:
+            self._pricing_configs.clear()
+        else:
+            self._pricing_configs.pop(account_key, None)
+    
     def get_service_labels(
         self,
         account_key: str,
@@ -82,9 +125,7 @@ class ServiceMappingManager:
         Returns:
             List of label names
         """
-        mapping = self.get_mapping_for_account(account_key)
-        service_config = mapping.get(service, {})
-        return service_config.get(input_type, [])
+        return list(self.get_pricing_config(account_key).labels(service, input_type))
     
     def get_default_pm_percent(self, account_key: str) -> float:
         """
@@ -96,12 +137,7 @@ class ServiceMappingManager:
         Returns:
             Default PM percentage (default: 10.0)
         """
-        mapping = self.get_mapping_for_account(account_key)
-        val = mapping.get("default_pm_percent", 10)
-        try:
-            return float(val)
-        except (ValueError, TypeError):
-            return 10.0
+        return self.get_pricing_config(account_key).default_pm_percent
     
     def get_min_hourly_rate(self, account_key: str) -> float:
         """
@@ -113,12 +149,7 @@ class ServiceMappingManager:
         Returns:
             Minimum hourly rate (default: 0.5)
         """
-        mapping = self.get_mapping_for_account(account_key)
-        val = mapping.get("min_hourly_rate", 0.5)
-        try:
-            return float(val)
-        except (ValueError, TypeError):
-            return 0.5
+        return self.get_pricing_config(account_key).min_hourly_rate
     
     def get_increment_rate(self, account_key: str) -> float:
         """
@@ -130,9 +161,4 @@ class ServiceMappingManager:
         Returns:
             Increment rate (default: 0.25)
         """
-        mapping = self.get_mapping_for_account(account_key)
-        val = mapping.get("increment_rate", 0.25)
-        try:
-            return float(val)
-        except (ValueError, TypeError):
-            return 0.25
+        return self.get_pricing_config(account_key).increment_rate
@@ -8,8 +8,9 @@ from pathlib import Path
 
 # Add Core to path
 sys.path.insert(0, str(Path(__file__).parent))
-from WF_Matrix import PA_SERVICES
+from WF_Matrix import PA_SERVICES, pa_service_store
 from entity_service_mapper import EntityServiceMapper
+from service_catalog import service_catalog
 
 
 def sync_all_entities_to_master():
@@ -19,13 +20,13 @@ def sync_all_entities_to_master():
     """
     master_entity = "TPUS"
     
-    if master_entity not in PA_SERVICES:
+    catalog = service_catalog(PA_SERVICES)
+    if not catalog.has_entity(master_entity):
         print(f"Error: Master entity '{master_entity}' not found!")
         return False
     
     # Get master services (skip header)
     master_services = PA_SERVICES[master_entity][1:]
-    master_service_names = [row[2] for row in master_services]  # Column 3 = Service name
     
     print(f"Master Entity: {master_entity}")
     print(f"Master Services: {len(master_services)}")
@@ -34,83 +35,40 @@ def sync_all_entities_to_master():
     # Load mapper
     mapper = EntityServiceMapper()
     
-    # Read WF_Matrix.py file
-    wf_matrix_path = Path(__file__).parent / "WF_Matrix.py"
-    with open(wf_matrix_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
     changes_made = False
     
     # Process each entity
-    for entity_name, entity_services in PA_SERVICES.items():
+    for entity_name in catalog.entities():
         if entity_name == master_entity:
             continue  # Skip master
         
         print(f"Checking {entity_name}...")
         
-        # Get current entity service names (skip header)
-        current_services = entity_services[1:]
-        current_service_names = [row[2] for row in current_services]
+        # Get current entity service names
+        current_count = len(catalog.service_names(entity_name))
+        current_service_names = catalog.service_name_set(entity_name)
         
         # Find missing services
-        missing_services = []
-        for master_row in master_services:
-            master_service_name = master_row[2]
-            if master_service_name not in current_service_names:
-                missing_services.append(master_row)
+        missing_services = [row for row in master_services if row[2] not in current_service_names]
         
         if not missing_services:
-            print(f"  ✓ {entity_name}: Already in sync ({len(current_services)} services)")
+            print(f"  ✓ {entity_name}: Already in sync ({current_count} services)")
             continue
         
         print(f"  ⚠ {entity_name}: Missing {len(missing_services)} services")
         
-        # Add missing services to this entity
-        variable_name = f"{entity_name}_PA_SERVICES"
-        
-        # Find the entity's list in the file
-        start_line = -1
-        end_line = -1
-        bracket_count = 0
-        
-        for i, line in enumerate(lines):
-            if f"{variable_name} = [" in line:
-                start_line = i
-                bracket_count = line.count('[') - line.count(']')
-            elif start_line != -1:
-                bracket_count += line.count('[') - line.count(']')
-                if bracket_count == 0:
-                    end_line = i
-                    break
-        
-        if start_line == -1:
-            print(f"  ✗ Could not find {variable_name} in file!")
-            continue
-        
-        # Build new service list with missing services added
-        new_services = entity_services.copy()  # Include header
+        # Add missing services to this entity (same data as TPUS)
         for missing_row in missing_services:
-            new_services.append(missing_row.copy())  # Add with same data as TPUS
             print(f"    + Adding: {missing_row[2]}")
             
             # Create mapping for new service
             mapper.set_mapping(entity_name, missing_row[2], missing_row[2])
-        
-        # Replace in file
-        new_lines = [f"{variable_name} = [\n"]
-        for service in new_services:
-            new_lines.append(f"    {service},\n")
-        new_lines.append("]\n")
-        
-        lines = lines[:start_line] + new_lines + lines[end_line + 1:]
+        pa_service_store.append_services(entity_name, missing_services)
         
         changes_made = True
-        print(f"  ✓ {entity_name}: Synced to {len(new_services) - 1} services")
+        print(f"  ✓ {entity_name}: Synced to {current_count + len(missing_services)} services")
     
     if changes_made:
-        # Write back to file
-        with open(wf_matrix_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
         print("\n✓ All entities synchronized!")
         return True
     else:
@@ -122,14 +80,15 @@ def get_sync_status():
     """Get synchronization status for all entities"""
     master_entity = "TPUS"
     
-    if master_entity not in PA_SERVICES:
+    catalog = service_catalog(PA_SERVICES)
+    if not catalog.has_entity(master_entity):
         return None
     
-    master_count = len(PA_SERVICES[master_entity]) - 1  # Exclude header
+    master_count = len(catalog.service_names(master_entity))
     
     status = {}
-    for entity_name, entity_services in PA_SERVICES.items():
-        entity_count = len(entity_services) - 1  # Exclude header
+    for entity_name in catalog.entities():
+        entity_count = len(catalog.service_names(entity_name))
         in_sync = entity_count == master_count
         
         status[entity_name] = {
@@ -0,0 +1,49 @@
+"""
+Test script for the account comparison
+Run this to verify one job is ranked across every ratesheet
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.account_comparison import compare_accounts, compare_accounts_by_lp
+from Core.quote_engine import QuoteEngine, QuoteRequest
+from Core.test_quote_engine import MAPPING, SERVICES_UOFM, make_ratesheet
+
+
+def make_engine():
+    cheap = make_ratesheet()
+    cheap["Translation"] = [0.10, 0.12]
+    partial = make_ratesheet().drop(columns=["Formatting"]).iloc[:1]
+    ratesheets = {"S BASE": make_ratesheet(), "S CHEAP": cheap, "S PARTIAL": partial}
+    return QuoteEngine(ratesheets, SERVICES_UOFM, {}, {}, {name: MAPPING for name in ratesheets})
+
+
+def test_compare_accounts_ranking():
+    """Applicable sheets rank cheapest first; incomplete sheets go last"""
+    request = QuoteRequest(
+        account="",
+        lps=["English (US) into French", "English (US) into German"],
+        services=["Translation", "Formatting"],
+        word_counts={"New Words:": 2000},
+    )
+    table = compare_accounts(make_engine(), request)
+
+    assert table["Account"].tolist() == ["S CHEAP", "S BASE", "S PARTIAL"]
+    assert table["Rank"].tolist() == [1, 2, 3]
+    assert table["Total"].tolist()[:2] == [(200 + 80) + (240 + 80), (400 + 80) + (500 + 80)]
+    assert table.loc[2, "Missing LPs"] == 1
+    assert table.loc[2, "Missing Services"] == "Formatting"
+
+    by_lp = compare_accounts_by_lp(make_engine(), request)
+    assert by_lp.loc["English (US) into French", "S CHEAP"] == 200 + 80
+    assert np.isnan(by_lp.loc["English (US) into German", "S PARTIAL"])
+
+
+if __name__ == "__main__":
+    test_compare_accounts_ranking()
+    print("✓ All account comparison tests passed!")
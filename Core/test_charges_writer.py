@@ -0,0 +1,83 @@
+"""
+Test script for the Charges Writer
+Run this to verify streamed exports match the DataFrame export
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.charges_writer import open_charges_writer, write_charges
+from Core.quote_engine import QuoteEngine, QuoteRequest
+from Core.test_quote_engine import MAPPING, SERVICES_UOFM, make_ratesheet
+
+
+def make_chunks():
+    engine = QuoteEngine({"S TEST": make_ratesheet()}, SERVICES_UOFM, {}, {}, {"S TEST": MAPPING})
+    request = QuoteRequest(
+        account="S TEST",
+        lps=["English (US) into French", "English (US) into German", "English (US) into French"],
+        services=["Machine Translation", "Formatting", "Project Management"],
+        word_counts={"New Words:": 1000},
+    )
+    return engine.quote(request), list(engine.quote_chunks(request, chunk_size=2))
+
+
+def test_streamed_csv_matches_dataframe_export():
+    """CSV, XLSX and JSON Lines streams hold the same rows as Quote.to_csv"""
+    quote, chunks = make_chunks()
+    with tempfile.TemporaryDirectory() as folder:
+        expected_path = os.path.join(folder, "expected.csv")
+        quote.to_csv(expected_path)
+
+        for suffix in (".csv", ".xlsx", ".jsonl"):
+            path = os.path.join(folder, f"charges{suffix}")
+            assert write_charges(path, (chunk.charges for chunk in chunks)) == len(quote.charges)
+            assert not os.path.exists(path + ".part")
+
+        with open(expected_path, "rb") as expected, open(os.path.join(folder, "charges.csv"), "rb") as streamed:
+            assert streamed.read().replace(b"\r\n", b"\n") == expected.read().replace(b"\r\n", b"\n")
+
+        table = pd.read_csv(expected_path, keep_default_na=False)
+        xlsx = pd.read_excel(os.path.join(folder, "charges.xlsx"), keep_default_na=False)
+        assert xlsx.astype(str).equals(table.astype(str))
+
+        with open(os.path.join(folder, "charges.jsonl"), encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        assert [line["Quantity"] for line in lines] == table["Quantity"].tolist()
+        assert lines[0]["Target"] == "French" and lines[0]["CommentsForInvoice"] == ""
+
+
+def test_failed_export_keeps_existing_file():
+    """A failed or discarded export leaves the previous file untouched"""
+    _, chunks = make_chunks()
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "charges.csv")
+        with open(path, "w") as f:
+            f.write("previous")
+
+        with open_charges_writer(path) as writer:
+            writer.write(chunks[0].charges)
+            writer.discard()
+        try:
+            with open_charges_writer(path) as writer:
+                writer.write(chunks[0].charges)
+                raise RuntimeError("pricing failed")
+        except RuntimeError:
+            pass
+
+        with open(path) as f:
+            assert f.read() == "previous"
+        assert os.listdir(folder) == ["charges.csv"]
+
+
+if __name__ == "__main__":
+    test_streamed_csv_matches_dataframe_export()
+    test_failed_export_keeps_existing_file()
+    print("✓ All charges writer tests passed!")
@@ -0,0 +1,41 @@
+"""
+Test script for the Language Index
+Run this to verify typeahead search matches the substring filter and ranks prefixes first
+"""
+
+import sys
+from pathlib import Path
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.language_index import LanguageIndex
+
+
+LANGUAGES = sorted([
+    "Chinese (Simplified)", "English (GB)", "English (US)", "French (Canada)", "French (FR)",
+    "German (Austria)", "German (DE)", "Norwegian (Bokmal)", "Portuguese (Brazil)", "Swiss German",
+])
+
+
+def test_search_matches_substring_filter():
+    """Every query returns exactly the languages the old substring scan returned"""
+    index = LanguageIndex(LANGUAGES)
+    for query in ["", "g", "ge", "ger", "GERMAN", "(de", "an (", "xyz", "bra", " "]:
+        expected = [lang for lang in LANGUAGES if query.strip().lower() in lang.lower()]
+        assert sorted(index.search(query)) == sorted(expected), query
+
+
+def test_search_ranking():
+    """Exact and prefix matches come before matches inside the name"""
+    index = LanguageIndex(LANGUAGES)
+    assert index.search("german") == ["German (Austria)", "German (DE)", "Swiss German"]
+    assert index.search("fr")[:2] == ["French (Canada)", "French (FR)"]
+    assert index.search("english (gb)") == ["English (GB)"]
+    assert index.search("(de") == ["German (DE)"]
+    assert index.search("a", limit=2) == index.search("a")[:2]
+
+
+if __name__ == "__main__":
+    test_search_matches_substring_filter()
+    test_search_ranking()
+    print("✓ All language index tests passed!")
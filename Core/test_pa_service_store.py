@@ -0,0 +1,97 @@
+"""
+Test script for the PA Service Store
+Run this to verify PA services are saved atomically and seen without reloading modules
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core import WF_Matrix
+from Core.pa_service_store import PA_SERVICE_HEADER, PAServiceRow, PAServicesView, PAServiceStore
+
+ROWS = [
+    ["Language Services", "Translation", "Translation and Proofreading", "Word"],
+    ["Desktop Publishing", "Translation", "Formatting", "Hour"],
+]
+
+
+def test_wf_matrix_view():
+    """PA_SERVICES keeps its shape: entity -> header row plus service rows"""
+    assert list(WF_Matrix.PA_SERVICES) == ["TPUS", "TPTDE", "TPTIT", "TPT"]
+    tpus = WF_Matrix.PA_SERVICES["TPUS"]
+    assert tpus[0] == PA_SERVICE_HEADER
+    assert tpus[1] == ROWS[0]
+    assert WF_Matrix.TPUS_PA_SERVICES == tpus
+    assert "TPFR" not in WF_Matrix.PA_SERVICES and WF_Matrix.PA_SERVICES.get("TPFR") is None
+
+
+def test_edits_are_saved_and_visible():
+    """Edits touch only their entity and are seen by every store on the file"""
+    with tempfile.TemporaryDirectory() as folder:
+        store_file = os.path.join(folder, "pa_services.json")
+        store = PAServiceStore(store_file)
+        other = PAServicesView(PAServiceStore(store_file))
+        assert len(other) == 0
+
+        store.add_entity("TPUS", ROWS)
+        store.add_entity("TPIT", ROWS[:1])
+        assert list(other) == ["TPUS", "TPIT"]
+        assert other["TPIT"] == [PA_SERVICE_HEADER, ROWS[0]]
+
+        version = store.version
+        store.append_services("TPIT", [ROWS[1]])
+        store.set_services("TPUS", [ROWS[1]])
+        assert store.version > version
+        assert other["TPIT"] == [PA_SERVICE_HEADER] + ROWS
+        assert other["TPUS"] == [PA_SERVICE_HEADER, ROWS[1]]
+
+        # Lookups return copies, so callers cannot change the store by accident
+        other["TPUS"][1][2] = "Changed"
+        assert store.get_services("TPUS") == [ROWS[1]]
+
+        assert store.delete_entity("TPIT") and not store.delete_entity("TPIT")
+        assert "TPIT" not in other
+        try:
+            store.add_entity("TPUS")
+            assert False, "duplicate entity should be rejected"
+        except ValueError:
+            pass
+
+        with open(store_file, encoding="utf-8") as f:
+            assert json.load(f) == {"columns": PA_SERVICE_HEADER, "entities": {"TPUS": [ROWS[1]]}}
+        assert os.listdir(folder) == ["pa_services.json"]
+
+
+def test_rows_are_shared_between_entities():
+    """Identical rows of different entities are one interned PAServiceRow"""
+    with tempfile.TemporaryDirectory() as folder:
+        store = PAServiceStore(os.path.join(folder, "pa_services.json"))
+        for entity in ("TPUS", "TPTDE", "TPTIT"):
+            store.add_entity(entity, [list(row) for row in ROWS])
+        store.append_services("TPTIT", [["Handling & Delivery", "", "Courier"]])
+
+        reloaded = PAServiceStore(store.store_file)
+        assert reloaded.distinct_rows == 3
+        first = reloaded.rows("TPUS")[0]
+        assert isinstance(first, PAServiceRow) and first.service == ROWS[0][2]
+        assert all(reloaded.rows(entity)[0] is first for entity in ("TPTDE", "TPTIT"))
+        assert first.service_group_2 is reloaded.rows("TPUS")[1].service_group_2  # interned strings
+        assert reloaded.rows("TPTIT")[-1] == ("Handling & Delivery", "", "Courier", "")
+        assert reloaded.get_services("TPUS") == ROWS
+        try:
+            store.append_services("TPUS", [["a", "b", "c", "d", "e"]])
+            assert False, "rows with more than four values should be rejected"
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    test_wf_matrix_view()
+    test_edits_are_saved_and_visible()
+    test_rows_are_shared_between_entities()
+    print("✓ All PA service store tests passed!")
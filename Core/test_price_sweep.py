@@ -0,0 +1,74 @@
+"""
+Test script for the price sweep
+Run this to verify the vectorized sweep matches individual quotes
+"""
+
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.price_sweep import pivot_price_curve, price_curve
+from Core.quote_engine import QuoteEngine, QuoteRequest
+from Core.test_quote_engine import MAPPING, SERVICES_UOFM, make_ratesheet
+
+
+def test_price_curve_matches_quotes():
+    """Every grid point equals a quote priced on its own"""
+    engine = QuoteEngine({"S TEST": make_ratesheet()}, SERVICES_UOFM, {}, {}, {"S TEST": MAPPING})
+    request = QuoteRequest(
+        account="S TEST",
+        lps=["English (US) into French", "English (US) into German"],
+        services=["Machine Translation", "TM - Fuzzy Matches", "Formatting", "Back Translation", "Rush Premium"],
+        word_counts={"Fuzzy Matches:": 100},
+        percentages={"Rush Premium": 25},
+    )
+    grid = [100, 600, 2500]
+    curve = price_curve(engine, request, grid, detail=True)
+    totals = price_curve(engine, request, grid)
+
+    for file_type in ("Live", "Dead"):
+        for words in grid:
+            counts = dict(request.word_counts, **{"New Words:": words})
+            charges = engine.quote(replace(request, word_counts=counts, file_type=file_type)).charges
+            point = curve[(curve["File Type"] == file_type) & (curve["Word Count"] == words)]
+            assert point["Service"].tolist() == charges["Service"].tolist()
+            assert point["UofM"].tolist() == charges["UofM"].tolist()
+            assert np.allclose(point["Total"], charges["Quantity"] * charges["Rate"])
+
+    table = pivot_price_curve(totals)["Live"]
+    assert table.shape == (2, 3)
+    assert np.isclose(table.loc["English (US) into French", 600], curve[
+        (curve["File Type"] == "Live") & (curve["Word Count"] == 600)
+        & (curve["Line Item Description"] == "English (US) into French")
+    ]["Total"].sum())
+
+
+def test_total_words_follows_sweep():
+    """A template holding Total Words (as the app builds it) sweeps hourly lines and the minimum fee too"""
+    engine = QuoteEngine({"S TEST": make_ratesheet()}, SERVICES_UOFM, {}, {}, {"S TEST": MAPPING})
+    request = QuoteRequest(
+        account="S TEST",
+        lps=["English (US) into French", "English (US) into German"],
+        services=["Translation", "TM - Fuzzy Matches", "Formatting", "Project Management"],
+        word_counts={"New Words:": 0, "Fuzzy Matches:": 100, "Total Words:": 100},
+        min_fee=150,
+    )
+    grid = [0, 400, 5000]
+    totals = price_curve(engine, request, grid)
+
+    for file_type in ("Live", "Dead"):
+        for words in grid:
+            counts = dict(request.word_counts, **{"New Words:": words, "Total Words:": 100 + words})
+            expected = engine.quote(replace(request, word_counts=counts, file_type=file_type)).totals_by_lp()
+            point = totals[(totals["File Type"] == file_type) & (totals["Word Count"] == words)]
+            assert np.allclose(point["Total"], expected.tolist()), (file_type, words)
+
+
+if __name__ == "__main__":
+    test_price_curve_matches_quotes()
+    test_total_words_follows_sweep()
+    print("✓ All price sweep tests passed!")
@@ -0,0 +1,84 @@
+"""
+Test script for compiled pricing configurations
+Run this to verify account mappings are compiled once and cached
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.service_mapping_manager import ServiceMappingManager
+
+
+MAPPINGS = {
+    "S TEST": {
+        "Translation": {"QuoteMe": ["New Words:"], "QTC": ["TC WC for TRANSLATION:"]},
+        "Formatting": {
+            "QuoteMe": {"live_divider": "500", "dead_divider": "1000"},
+            "QTC": {"live_divider": "1000", "dead_divider": "", "use_wc_for_revision": True},
+        },
+        "min_hourly_rate": "1",
+        "increment_rate": "",
+        "default_pm_percent": "0",
+    }
+}
+
+
+def make_manager(folder):
+    mapping_file = os.path.join(folder, "service_label_mapping.json")
+    with open(mapping_file, "w", encoding="utf-8") as f:
+        json.dump(MAPPINGS, f)
+    return ServiceMappingManager(mapping_file)
+
+
+def test_compiled_values():
+    """Numbers are parsed once and empty values fall back to defaults"""
+    with tempfile.TemporaryDirectory() as folder:
+        config = make_manager(folder).get_pricing_config("S TEST")
+
+    formatting = config.service("Formatting")
+    assert (config.min_hourly_rate, config.increment_rate, config.default_pm_percent) == (1.0, 0.25, 0.0)
+    assert formatting.quoteme_dividers == (500.0, 1000.0)
+    assert formatting.divider(True, "Dead") == 1.0
+    assert formatting.qtc_wc_source == "revision"
+    assert config.labels("Translation", "QTC") == ("TC WC for TRANSLATION:",)
+    assert config.labels("Unknown", "QuoteMe") == ()
+
+    try:
+        config.min_hourly_rate = 2
+        assert False, "pricing config should be read-only"
+    except AttributeError:
+        pass
+
+
+def test_cached_until_mapping_changes():
+    """The compiled config is reused until the account mapping is saved"""
+    with tempfile.TemporaryDirectory() as folder:
+        manager = make_manager(folder)
+        config = manager.get_pricing_config("S TEST")
+        assert manager.get_pricing_config("S TEST") is config
+
+        mapping = dict(MAPPINGS["S TEST"], min_hourly_rate="2")
+        manager.save_mapping_for_account("S TEST", mapping)
+        assert manager.get_min_hourly_rate("S TEST") == 2.0
+        assert manager.get_pricing_config("S TEST") is not config
+
+        # Unmapped accounts keep one config too, until a mapping is saved for them
+        unmapped = manager.get_pricing_config("S NONE")
+        assert manager.get_pricing_config("S NONE") is unmapped
+        manager.save_mapping_for_account("S NONE", mapping)
+        assert manager.get_pricing_config("S NONE").min_hourly_rate == 2.0
+
+        # Replacing a block without saving it is noticed as well
+        manager.all_mappings["S TEST"] = dict(mapping, min_hourly_rate="3")
+        assert manager.get_min_hourly_rate("S TEST") == 3.0
+
+
+if __name__ == "__main__":
+    test_compiled_values()
+    test_cached_until_mapping_changes()
+    print("✓ All pricing config tests passed!")
@@ -0,0 +1,84 @@
+"""
+Test script for the Profiler
+Run this to verify spans, counters and the session report
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.profiling import Profiler, profiler
+from Core.ratesheet_model import RatesheetModel
+from Core.test_ratesheet_model import make_workbook
+
+
+def test_disabled_profiler_records_nothing():
+    """Without the env var or flag nothing is started or recorded"""
+    session = Profiler()
+    assert not session.configure(["--other"], environ={})
+    assert not session.configure([], environ={"ONE_STOP_SHOP_PROFILE": "0"})
+
+    @session.profiled()
+    def work(value):
+        return value * 2
+
+    with session.span("ignored"):
+        session.count("xlsx reads")
+    assert work(21) == 42
+    assert session.operations == {} and session.counters == {}
+    assert session.write_report(tempfile.gettempdir()) is None
+
+
+def test_spans_counters_and_report():
+    """Spans and xlsx reads are recorded and written to the session report"""
+    session = Profiler()
+    assert session.configure(["--profile=cprofile"], environ={})
+    assert session.use_cprofile
+
+    @session.profiled()
+    def update_preview():
+        time.sleep(0.002)
+
+    for _ in range(3):
+        update_preview()
+    with session.span("save_charges_csv"):
+        time.sleep(0.01)
+    session.count("xlsx reads", 2)
+
+    operations = session.operations
+    assert operations["update_preview"]["calls"] == 3
+    assert operations["save_charges_csv"]["max"] >= 0.01
+    assert session.counters == {"xlsx reads": 2}
+
+    with tempfile.TemporaryDirectory() as folder:
+        report_path = session.write_report(os.path.join(folder, "profiles"))
+        report = report_path.read_text(encoding="utf-8")
+        assert report.index("save_charges_csv") < report.index("update_preview")
+        assert "xlsx reads" in report and "cProfile" in report
+        assert report_path.with_suffix(".prof").exists()
+    session.stop()
+
+
+def test_core_io_is_counted():
+    """Loading a ratesheet counts its xlsx reads on the shared profiler"""
+    profiler.start()
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            file_path = os.path.join(folder, "ratesheet.xlsx")
+            make_workbook(file_path)
+            RatesheetModel.from_workbook(file_path, {})
+    finally:
+        profiler.stop()
+    assert profiler.counters == {"xlsx reads": 1, "xlsx sheets read": 4}
+    assert "xlsx read: ratesheet load" in profiler.operations
+
+
+if __name__ == "__main__":
+    test_disabled_profiler_records_nothing()
+    test_spans_counters_and_report()
+    test_core_io_is_counted()
+    print("✓ All profiling tests passed!")
@@ -0,0 +1,53 @@
+"""
+Test script for the Quantity Graph
+Run this to verify an input edit only reaches the services that use it
+"""
+
+import sys
+from pathlib import Path
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.pricing_config import compile_pricing_config
+from Core.quantity_graph import QuantityGraph
+from Core.test_quote_engine import SERVICES_UOFM
+
+
+MAPPING = {
+    "Translation": {"QuoteMe": ["New Words:"], "QTC": ["TC WC for TRANSLATION:"]},
+    "TM - Fuzzy Matches": {"QuoteMe": ["Fuzzy Matches:", "Repetitions:"], "QTC": []},
+    "Formatting": {
+        "QuoteMe": {"live_divider": "1000", "dead_divider": "1000"},
+        "QTC": {"live_divider": "1000", "dead_divider": "1000", "use_wc_for_revision": True},
+    },
+}
+SERVICES = ["Translation", "TM - Fuzzy Matches", "Formatting", "Project Management", "Rush Premium"]
+
+
+def test_quoteme_dependencies():
+    """A QuoteMe label reaches its word services, Total Words services and PM/Rush"""
+    graph = QuantityGraph(compile_pricing_config("S TEST", MAPPING), SERVICES, SERVICES_UOFM, False)
+
+    assert graph.affected({"Fuzzy Matches:"}) == [
+        "TM - Fuzzy Matches", "Formatting", "Project Management", "Rush Premium"
+    ]
+    assert graph.affected({"New Words:"}) == [
+        "Translation", "Formatting", "Project Management", "Rush Premium"
+    ]
+    # Labels no selected service reads change nothing
+    assert graph.affected({"TC WC for TRANSLATION:"}) == []
+
+
+def test_qtc_dependencies():
+    """QTC hourly services follow the word count they are mapped to"""
+    graph = QuantityGraph(compile_pricing_config("S TEST", MAPPING), SERVICES, SERVICES_UOFM, True)
+
+    assert graph.affected({"TC WC for TRANSLATION:"}) == ["Translation", "Project Management", "Rush Premium"]
+    assert graph.affected({"TC WC for REVISION:"}) == ["Formatting", "Project Management", "Rush Premium"]
+    assert graph.affected({"Fuzzy Matches:"}) == []
+
+
+if __name__ == "__main__":
+    test_quoteme_dependencies()
+    test_qtc_dependencies()
+    print("✓ All quantity graph tests passed!")
@@ -0,0 +1,251 @@
+"""
+Test script for the Quote Engine
+Run this to verify charges are computed correctly for all LPs at once
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.quote_cache import QuoteCache
+from Core.quote_engine import (
+    Quote, QuoteEngine, QuoteRequest, compute_charges, compute_service_quantities,
+    resolve_line_services
+)
+from Core.rate_calculations import (
+    PercentageService, apply_minimum_fee, apply_percentage_services,
+    calculate_hourly_quantities, calculate_hourly_quantity
+)
+
+
+SERVICES_UOFM = {
+    "Translation": "Word",
+    "Machine Translation": "Word",
+    "TM - Fuzzy Matches": "Word",
+    "Back Translation": "Word",
+    "Formatting": "Hour",
+    "Project Management": "Fee",
+    "Rush Premium": "Fee",
+}
+
+MAPPING = {
+    "Translation": {"QuoteMe": ["New Words:"], "QTC": []},
+    "Machine Translation": {"QuoteMe": ["New Words:"], "QTC": []},
+    "TM - Fuzzy Matches": {"QuoteMe": ["Fuzzy Matches:"], "QTC": []},
+    "Back Translation": {"QuoteMe": ["New Words:"], "QTC": []},
+    "Formatting": {"QuoteMe": {"live_divider": "1000", "dead_divider": "1000"}},
+    "min_hourly_rate": "0.5",
+    "increment_rate": "0.25",
+}
+
+
+def make_ratesheet():
+    """Build a small ratesheet with one LP lacking a Machine Translation rate"""
+    return pd.DataFrame({
+        "Source Language": ["English (US)", "English (US)"],
+        "Target Language": ["French", "German"],
+        "Translation": [0.20, 0.25],
+        "TM - Fuzzy Match": [0.10, 0.12],
+        "Machine Translation": [0.15, None],
+        "Back Translation": [0.20, 0.25],
+        "Formatting": [40, 40],
+    })
+
+
+def quote(selected, label_values, min_fee=0, percentages=None):
+    lps = ["English (US) into French", "English (US) into German"]
+    quantities = compute_service_quantities(
+        resolve_line_services(selected), SERVICES_UOFM, MAPPING, label_values,
+        percentages=percentages
+    )
+    return compute_charges(lps, selected, make_ratesheet(), SERVICES_UOFM, {}, {}, quantities, min_fee)
+
+
+def test_machine_translation_fallback():
+    """LPs without an MT rate fall back to Translation"""
+    charges, fallback = quote(["Machine Translation", "Formatting"], {"New Words:": 1000, "Total Words:": 1000})
+
+    assert fallback == ["English (US) into German"]
+    assert charges["Service"].tolist() == ["Machine Translation", "Formatting", "Translation", "Formatting"]
+    assert charges["Rate"].tolist() == [0.15, 40, 0.25, 40]
+    assert charges["Quantity"].tolist() == [1000, 1, 1000, 1]
+    assert charges["Mark New Line Item"].tolist() == ["x", "", "x", ""]
+
+
+def test_padded_string_rates():
+    """Rates stored as text padded with spaces or NBSP are parsed like float()"""
+    ratesheet = make_ratesheet()
+    ratesheet["TM - Fuzzy Match"] = ["\xa00.10\xa0", " 0.12 "]
+    ratesheet["Formatting"] = ["40\xa0", "n/a"]
+    selected = ["TM - Fuzzy Matches", "Formatting"]
+    quantities = compute_service_quantities(
+        resolve_line_services(selected), SERVICES_UOFM, MAPPING, {"Fuzzy Matches:": 1000, "Total Words:": 1000}
+    )
+    charges, _ = compute_charges(
+        ["English (US) into French", "English (US) into German"], selected, ratesheet,
+        SERVICES_UOFM, {}, {}, quantities, 0
+    )
+    assert charges["Rate"].tolist() == [0.10, 40, 0.12, 40]
+
+
+def test_minimum_fee_and_percentages():
+    """Minimum fee is applied before Project Management and Rush Premium are rated"""
+    selected = ["Translation", "TM - Fuzzy Matches", "Project Management", "Rush Premium"]
+    charges, _ = quote(
+        selected, {"New Words:": 100, "Fuzzy Matches:": 100}, min_fee=150,
+        percentages={"Project Management": 10, "Rush Premium": 25}
+    )
+    french = charges[charges["Target"] == "French"].set_index("Service")
+
+    assert french.loc["Translation", "UofM"] == "Minimum"
+    assert french.loc["Translation", "Rate"] == 150
+    assert french.loc["TM - Fuzzy Matches", "Quantity"] == 0
+    assert french.loc["Project Management", "Rate"] == 150
+    assert french.loc["Rush Premium", "Rate"] == 165
+
+
+def test_minimum_fee_per_lp():
+    """Each LP is checked against the minimum fee on its own"""
+    charges = pd.DataFrame({
+        "Line Item Description": ["A", "A", "A", "B", "B", "B"],
+        "Service": ["Translation", "TM - Fuzzy Matches", "Back Translation"] * 2,
+        "UofM": ["Word"] * 6,
+        "Quantity": [100, 100, 1000, 1000, 100, 100],
+        "Rate": [0.2, 0.1, 0.2, 0.2, 0.1, 0.2],
+    })
+    result = apply_minimum_fee(charges, 150)
+
+    assert result["UofM"].tolist() == ["Minimum", "Word", "Word", "Word", "Word", "Minimum"]
+    assert result["Quantity"].tolist() == [1, 0, 1000, 1000, 100, 1]
+    assert result["Rate"].tolist() == [150, 0.1, 0.2, 0.2, 0.1, 150]
+
+
+def test_percentage_services_prefix_sum():
+    """Percentage lines honour their include_self / include_percentages flags"""
+    services = ["Translation", "Fee A", "Formatting", "Fee B", "Fee C"]
+    quantities = np.array([[1000, 0.1, 2, 0.5, 0.2], [500, 0.1, 1, 0.5, 0.2]])
+    rates = np.array([[0.2, 0, 40, 0, 0], [0.2, 0, 40, 0, 0]])
+    specs = [
+        PercentageService("Fee A"),
+        PercentageService("Fee B", include_percentages=False),
+        PercentageService("Fee C", include_self=True),
+    ]
+    rated = apply_percentage_services(quantities, rates, services, specs)
+
+    assert rated[:, 1].tolist() == [200, 100]
+    assert rated[:, 3].tolist() == [280, 140]
+    # Fee C covers Translation, Formatting, Fee A, Fee B and its own 20%
+    assert rated[:, 4].tolist() == [round((280 + 20 + 140) / 0.8, 6), round((140 + 10 + 70) / 0.8, 6)]
+
+
+def test_hourly_quantities_match_scalar():
+    """The array version matches calculate_hourly_quantity job by job"""
+    config = dict(MAPPING, Review={
+        "QuoteMe": {"live_divider": "500", "dead_divider": "0"},
+        "QTC": {"live_divider": "1000", "dead_divider": "1000", "use_wc_for_revision": True},
+    })
+    services = ["Formatting", "Review", "Review", "Formatting", "Review"]
+    file_types = ["Live", "Live", "Dead", "Dead", "Live"]
+    use_qtc = [False, False, False, True, True]
+    quoteme_wc = [0, 1100, 1100, 2600, 0]
+    qtc_revision = [0, 0, 0, 0, 1800]
+    hours = calculate_hourly_quantities(services, file_types, use_qtc, quoteme_wc, 0, qtc_revision, config)
+
+    expected = [
+        calculate_hourly_quantity(*job, 0, rev, config)
+        for *job, rev in zip(services, file_types, use_qtc, quoteme_wc, qtc_revision)
+    ]
+    assert hours.tolist() == expected == [0.5, 2.25, 0.5, 0.5, 2.0]
+
+
+def test_quote_engine_request():
+    """QuoteEngine prices a QuoteRequest without any UI state"""
+    engine = QuoteEngine({"S TEST": make_ratesheet()}, SERVICES_UOFM, {}, {}, {"S TEST": MAPPING})
+    request = QuoteRequest(
+        account="S TEST",
+        lps=["English (US) into French", "English (US) into German"],
+        services=["Machine Translation", "Formatting", "Project Management"],
+        word_counts={"New Words:": 1000},
+        min_fee=0,
+    )
+    quote = engine.quote(request)
+
+    assert quote.fallback_lps == ["English (US) into German"]
+    # Total Words defaults to the QuoteMe fields and PM to the default 10%
+    assert quote.charges["Quantity"].tolist() == [1000, 1, 0.1, 1000, 1, 0.1]
+    assert quote.totals_by_lp().tolist() == [209.0, 319.0]
+    assert quote.total == 528.0
+
+    for bad in (dict(lps=[]), dict(services=[]), dict(account="S NONE"), dict(hourly_divider=0)):
+        try:
+            engine.quote(QuoteRequest(**dict(vars(request), **bad)))
+            assert False, f"request should be rejected: {bad}"
+        except ValueError:
+            pass
+
+
+def test_quote_cache_per_lp():
+    """Cached quotes match uncached ones and only new LPs are priced"""
+    cache = QuoteCache()
+    plain = QuoteEngine({"S TEST": make_ratesheet()}, SERVICES_UOFM, {}, {}, {"S TEST": MAPPING})
+    cached = QuoteEngine({"S TEST": make_ratesheet()}, SERVICES_UOFM, {}, {}, {"S TEST": MAPPING}, cache)
+    request = QuoteRequest(
+        account="S TEST",
+        lps=["English (US) into French", "English (US) into German"],
+        services=["Machine Translation", "TM - Fuzzy Matches", "Project Management"],
+        word_counts={"New Words:": 500, "Fuzzy Matches:": 200},
+    )
+
+    quote = cached.quote(request)
+    expected = plain.quote(request)
+    assert quote.charges.astype(str).equals(expected.charges.astype(str))
+    assert quote.fallback_lps == expected.fallback_lps
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    # Reordering LPs and an equivalent count (500 vs 500.0) reuse both blocks
+    request.lps.reverse()
+    request.word_counts["New Words:"] = 500.0
+    assert cached.quote(request).charges["Target"].tolist()[0] == "German"
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # A changed count invalidates every LP; a new engine over the same sheet still hits
+    request.word_counts["New Words:"] = 600
+    cached.quote(request)
+    assert (cache.hits, cache.misses) == (2, 4)
+    QuoteEngine({"S TEST": make_ratesheet()}, SERVICES_UOFM, {}, {}, {"S TEST": MAPPING}, cache).quote(request)
+    assert (cache.hits, cache.misses) == (4, 4)
+
+
+def test_quote_chunks():
+    """Quotes priced a chunk of LPs at a time join into the full quote"""
+    engine = QuoteEngine({"S TEST": make_ratesheet()}, SERVICES_UOFM, {}, {}, {"S TEST": MAPPING})
+    request = QuoteRequest(
+        account="S TEST",
+        lps=["English (US) into French", "English (US) into German", "English (US) into French"],
+        services=["Machine Translation", "Formatting", "Project Management"],
+        word_counts={"New Words:": 1000},
+    )
+    chunks = list(engine.quote_chunks(request, chunk_size=2))
+    joined = Quote.concat(request, chunks)
+    expected = engine.quote(request)
+
+    assert [len(chunk.request.lps) for chunk in chunks] == [2, 1]
+    assert joined.charges.astype(str).equals(expected.charges.astype(str))
+    assert joined.fallback_lps == expected.fallback_lps == ["English (US) into German"]
+
+
+if __name__ == "__main__":
+    test_machine_translation_fallback()
+    test_padded_string_rates()
+    test_minimum_fee_and_percentages()
+    test_minimum_fee_per_lp()
+    test_percentage_services_prefix_sum()
+    test_hourly_quantities_match_scalar()
+    test_quote_engine_request()
+    test_quote_cache_per_lp()
+    test_quote_chunks()
+    print("✓ All quote engine tests passed!")
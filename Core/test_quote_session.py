@@ -0,0 +1,64 @@
+"""
+Test script for quote sessions
+Run this to verify a quote session survives a save/load round trip
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.language_pair_manager import LanguagePairManager
+from Core.quote_session import QuoteSession, load_session, save_session
+
+
+def test_session_round_trip():
+    """Sessions are saved compactly and restored unchanged"""
+    session = QuoteSession(
+        account="S IQVIA",
+        lps=[f"English (US) into Language {i}" for i in range(50)],
+        services=["Translation", "Formatting", "Project Management"],
+        quoteme={"New Words:": 2500, "Fuzzy Matches:": 100},
+        qtc={"TC WC for TRANSLATION:": 0},
+        file_type="Dead",
+        min_fee=200,
+    )
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "quote.oss.json")
+        save_session(session, path)
+        assert load_session(path) == session
+        assert os.listdir(folder) == ["quote.oss.json"]
+
+        bad_sessions = (
+            '{"version": 99, "account": "S IQVIA"}', "[]", "not json",
+            '{"version": "2", "account": "S IQVIA"}', '{"version": null, "account": "S IQVIA"}',
+            '{"account": null}', '{"account": "S IQVIA", "lps": "English (US) into French (FR)"}',
+            '{"account": "S IQVIA", "services": [1]}', '{"account": "S IQVIA", "quoteme": []}',
+            '{"account": "S IQVIA", "use_qtc_input": "yes"}', '{"account": "S IQVIA", "min_fee": "150"}',
+        )
+        for bad in bad_sessions:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(bad)
+            try:
+                load_session(path)
+                assert False, f"session should be rejected: {bad}"
+            except ValueError:
+                pass
+
+
+def test_set_language_pairs():
+    """LPs are restored in one call; malformed and duplicate pairs are skipped"""
+    manager = LanguagePairManager()
+    skipped = manager.set_language_pairs([
+        "English (US) into French (FR)", "German", "English (US) into French (FR)", "English (US) into German (DE)"
+    ])
+    assert manager.get_all_language_pairs() == ["English (US) into French (FR)", "English (US) into German (DE)"]
+    assert skipped == ["German", "English (US) into French (FR)"]
+
+
+if __name__ == "__main__":
+    test_session_round_trip()
+    test_set_language_pairs()
+    print("✓ All quote session tests passed!")
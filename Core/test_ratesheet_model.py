@@ -0,0 +1,83 @@
+"""
+Test script for the Ratesheet Model
+Run this to verify the workbook is read once and indexed for the app
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.quote_engine import QuoteRequest
+from Core.ratesheet_model import RatesheetModel
+from Core.test_quote_engine import MAPPING, SERVICES_UOFM, make_ratesheet
+
+
+def make_workbook(file_path):
+    """Write a workbook with two ratesheets, services per account and UofM"""
+    services = pd.DataFrame({
+        "BASE": ["Translation", "Formatting", "Project Management"],
+        "SMALL": ["Translation", None, None],
+    })
+    uofm = pd.DataFrame({
+        "Service name": list(SERVICES_UOFM),
+        "UofM": list(SERVICES_UOFM.values()),
+        "Service Group 1": ["Linguistic"] * len(SERVICES_UOFM),
+    })
+    small = make_ratesheet().iloc[:1]
+    with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
+        services.to_excel(writer, sheet_name="Services per account", index=False)
+        make_ratesheet().to_excel(writer, sheet_name="S BASE", index=False)
+        uofm.to_excel(writer, sheet_name="UofM", index=False)
+        small.to_excel(writer, sheet_name="S SMALL", index=False)
+        pd.DataFrame({"Notes": ["not a ratesheet"]}).to_excel(writer, sheet_name="Notes", index=False)
+
+
+def test_ratesheet_model_from_workbook():
+    """Sheets are read once and every lookup is answered from memory"""
+    with tempfile.TemporaryDirectory() as folder:
+        file_path = os.path.join(folder, "ratesheet.xlsx")
+        make_workbook(file_path)
+        progress = []
+        model = RatesheetModel.from_workbook(
+            file_path, {"S BASE": MAPPING, "S SMALL": MAPPING},
+            progress=lambda fraction, message: progress.append(fraction)
+        )
+
+    assert model.sheet_names == ["S BASE", "S SMALL"]
+    assert len(progress) == 4 and progress[-1] == 1.0
+    assert model.services("S BASE") == ["Translation", "Formatting", "Project Management"]
+    assert model.services("S SMALL") == ["Translation"]
+    assert model.services("S OTHER") is None
+    assert model.max_service_count() == 3
+    assert model.services_uofm["Formatting"] == "Hour"
+    assert model.service_group1["Translation"] == "Linguistic"
+    assert model.languages("S BASE") == ["English (US)", "French", "German"]
+    assert model.languages("S SMALL") == ["English (US)", "French"]
+
+    quote = model.engine.quote(QuoteRequest(
+        account="S BASE",
+        lps=["English (US) into French"],
+        services=["Translation"],
+        word_counts={"New Words:": 1000},
+        min_fee=0,
+    ))
+    assert round(quote.total, 2) == 200.0
+
+
+def test_empty_ratesheet_model():
+    """An unreadable workbook still gives a usable, empty model"""
+    model = RatesheetModel.empty({})
+    assert model.sheet_names == []
+    assert model.services("S BASE") is None
+    assert model.max_service_count() == 0
+
+
+if __name__ == "__main__":
+    test_ratesheet_model_from_workbook()
+    test_empty_ratesheet_model()
+    print("✓ All ratesheet model tests passed!")
@@ -0,0 +1,67 @@
+"""
+Test script for the Ratesheet Watcher
+Run this to verify only the edited sheets of the workbook are reloaded
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.ratesheet_model import RatesheetModel
+from Core.ratesheet_watcher import RatesheetWatcher, sheet_signatures
+from Core.test_quote_engine import MAPPING
+from Core.test_ratesheet_model import make_workbook
+
+
+def rewrite_sheet(file_path, sheet_name, df):
+    """Replace one sheet of the workbook and bump its modification time"""
+    stat = os.stat(file_path)
+    with pd.ExcelWriter(file_path, engine="openpyxl", mode="a", if_sheet_exists="replace") as writer:
+        df.to_excel(writer, sheet_name=sheet_name, index=False)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_watcher_reloads_changed_sheets():
+    """An edited sheet is reloaded; untouched sheets are shared with the old model"""
+    with tempfile.TemporaryDirectory() as folder:
+        file_path = os.path.join(folder, "ratesheet.xlsx")
+        make_workbook(file_path)
+        model = RatesheetModel.from_workbook(file_path, {"S BASE": MAPPING, "S SMALL": MAPPING})
+        reloads = []
+        watcher = RatesheetWatcher(file_path, model, lambda new, changed: reloads.append((new, changed)))
+
+        # Nothing changed on disk
+        assert watcher.poll() == set()
+        # Touching the file keeps the model
+        os.utime(file_path, ns=(0, os.stat(file_path).st_mtime_ns + 1_000_000_000))
+        assert watcher.poll() == set()
+        assert reloads == []
+
+        base_index = model.rate_index("S BASE")
+        before = sheet_signatures(file_path)
+        small = model.ratesheets["S SMALL"].copy()
+        small["Translation"] = [0.30]
+        rewrite_sheet(file_path, "S SMALL", small)
+        assert sheet_signatures(file_path)["S SMALL"] != before["S SMALL"]
+
+        assert watcher.poll() == {"S SMALL"}
+        new_model, changed = reloads[-1]
+        assert changed == {"S SMALL"}
+        assert watcher.model is new_model
+        assert new_model.ratesheets["S SMALL"]["Translation"].tolist() == [0.30]
+        assert new_model.ratesheets["S BASE"] is model.ratesheets["S BASE"]
+        # The untouched sheet's rate index is taken over, the edited one rebuilt
+        assert new_model.rate_index("S BASE") is base_index
+        assert new_model.rate_index("S SMALL") is not model.rate_index("S SMALL")
+        # The old model is left as it was
+        assert model.ratesheets["S SMALL"]["Translation"].tolist() == [0.20]
+
+
+if __name__ == "__main__":
+    test_watcher_reloads_changed_sheets()
+    print("✓ All ratesheet watcher tests passed!")
@@ -0,0 +1,65 @@
+"""
+Test script for the Service Catalog
+Run this to verify indexed lookups match the row scans and follow store edits
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.pa_service_store import PA_SERVICE_HEADER, PAServicesView, PAServiceStore
+from Core.service_catalog import ServiceCatalog, service_catalog
+
+PA_SERVICES = {
+    "TPUS": [
+        PA_SERVICE_HEADER,
+        ["Language Services", "Translation", "Translation and Proofreading", "Word"],
+        ["Desktop Publishing", "Translation", "Formatting", "Hour"],
+        ["Desktop Publishing", "Layout", "Formatting", "Page"],
+    ],
+    "TPTDE": [PA_SERVICE_HEADER, ["Language Services", "Translation", "Übersetzung", "Word"]],
+    "EMPTY": [PA_SERVICE_HEADER],
+}
+
+
+def test_lookups_match_scans():
+    """Names keep row order and find() returns the first matching row"""
+    catalog = ServiceCatalog(PA_SERVICES)
+    assert catalog.entities() == ["TPUS", "TPTDE", "EMPTY"]
+    for entity, rows in PA_SERVICES.items():
+        assert list(catalog.service_names(entity)) == [row[2] for row in rows[1:]]
+        assert catalog.service_name_set(entity) == {row[2] for row in rows[1:]}
+    assert catalog.find("TPUS", "Formatting") == ("Desktop Publishing", "Translation", "Formatting", "Hour")
+    assert catalog.find("TPUS", "Übersetzung") is None and catalog.find("TPFR", "Formatting") is None
+    assert catalog.has_service("TPTDE", "Übersetzung") and not catalog.has_service("TPFR", "Formatting")
+    assert catalog.service_names("TPFR") == () and catalog.service_name_set("EMPTY") == frozenset()
+
+
+def test_catalog_follows_store_edits():
+    """The catalog of a store view is reused until the store changes"""
+    with tempfile.TemporaryDirectory() as folder:
+        store_file = os.path.join(folder, "pa_services.json")
+        store = PAServiceStore(store_file)
+        for entity, rows in PA_SERVICES.items():
+            store.add_entity(entity, rows[1:])
+        view = PAServicesView(store)
+
+        catalog = service_catalog(view)
+        assert service_catalog(view) is catalog
+
+        store.append_services("EMPTY", [["Handling & Delivery", "", "Courier", "Fee"]])
+        assert service_catalog(view) is not catalog
+        assert service_catalog(view).service_names("EMPTY") == ("Courier",)
+
+        # Edits saved through another store on the same file are picked up too
+        PAServiceStore(store_file).delete_entity("TPTDE")
+        assert service_catalog(view).entities() == ["TPUS", "EMPTY"]
+
+
+if __name__ == "__main__":
+    test_lookups_match_scans()
+    test_catalog_follows_store_edits()
+    print("✓ All service catalog tests passed!")
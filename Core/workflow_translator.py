@@ -11,6 +11,7 @@ from typing import List, Dict, Optional, Tuple
 sys.path.insert(0, str(Path(__file__).parent))
 from entity_service_mapper import EntityServiceMapper
 from WF_Matrix import PA_SERVICES
+from service_catalog import service_catalog
 
 
 class WorkflowTranslator:
@@ -95,22 +96,16 @@ class WorkflowTranslator:
         Returns:
             Dictionary with service data or None if not found
         """
-        if entity not in PA_SERVICES:
+        row = service_catalog(PA_SERVICES).find(entity, service_name)
+        if row is None:
             return None
         
-        entity_services = PA_SERVICES[entity]
-        
-        # Skip header row
-        for row in entity_services[1:]:
-            if len(row) >= 4 and row[2] == service_name:
-                return {
-                    "service_group_1": row[0],
-                    "service_group_2": row[1],
-                    "service": row[2],
-                    "uom": row[3]
-                }
-        
-        return None
+        return {
+            "service_group_1": row[0],
+            "service_group_2": row[1],
+            "service": row[2],
+            "uom": row[3]
+        }
     
     def _get_service_data(self, service_names: List[str], entity: str, include_full: bool) -> List[Dict]:
         """Get service data for a list of services from an entity"""
@@ -0,0 +1,304 @@
+"""
+Batch Quoting
+Price a folder or CSV of job specs in parallel worker processes.
+
+Each worker loads the ratesheet workbook and service label mappings once
+(pool initializer) and then prices jobs with the headless QuoteEngine,
+writing one charges CSV per job. A summary.csv lists every job's total,
+MT fallback LPs and any error.
+
+Job specs use the same keys as QuoteRequest:
+    account, lps, services (or workflow), word_counts, input ("QuoteMe"
+    or "QTC"), file_type, min_fee, hourly_divider, percentages
+A folder may hold *.json files (one job or a list of jobs each) and *.csv
+files. In CSV files lps/services are ";"-separated, label columns such as
+"New Words:" hold word counts and "Project Management"/"Rush Premium"
+columns hold percentages.
+"""
+
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.quote_cache import QuoteCache
+from Core.quote_engine import PERCENTAGE_SERVICES, QuoteEngine, QuoteRequest
+from Core.service_mapping_manager import ServiceMappingManager
+from Core.workflow_manager import WorkflowManager
+
+
+APP_DIR = os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RATESHEET = os.path.join(APP_DIR, "One_BP_IQ fixed.01.xlsx")
+DEFAULT_MAPPING_FILE = os.path.join(APP_DIR, "service_label_mapping.json")
+DEFAULT_WORKFLOW_FILE = os.path.join(APP_DIR, "workflows.json")
+
+SUMMARY_HEADERS = ["Job", "Account", "LPs", "Services", "Lines", "Total", "Fallback LPs", "Output", "Error"]
+
+LIST_SEPARATOR = ";"
+SPEC_KEYS = ("job", "account", "lps", "services", "workflow", "input", "file_type", "min_fee", "hourly_divider")
+FILE_TYPES = ("Live", "Dead")
+INPUT_TYPES = ("QuoteMe", "QTC")
+TRUE_STRINGS = ("true", "yes", "y", "1")
+FALSE_STRINGS = ("false", "no", "n", "0")
+
+
+def _is_missing(value: Any) -> bool:
+    """Blank CSV cells are read as NaN (which is truthy), JSON ones as null or ""."""
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    return isinstance(value, float) and pd.isna(value)
+
+
+def _choice(spec: Dict[str, Any], key: str, choices: Tuple[str, ...]) -> str:
+    """Get a spec value from a fixed set of choices (case-insensitive); the first one is the default."""
+    value = spec.get(key)
+    if _is_missing(value):
+        return choices[0]
+    for choice in choices:
+        if str(value).strip().lower() == choice.lower():
+            return choice
+    raise ValueError(f"Invalid {key} '{value}' (expected {' or '.join(choices)})")
+
+
+def _parse_bool(key: str, value: Any) -> bool:
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in TRUE_STRINGS or text in FALSE_STRINGS:
+            return text in TRUE_STRINGS
+        raise ValueError(f"Invalid {key} '{value}' (expected true or false)")
+    return bool(value)
+
+
+def _split_list(value: Any) -> List[str]:
+    if isinstance(value, (list, tuple)):
+        return [str(item).strip() for item in value if str(item).strip()]
+    if _is_missing(value):
+        return []
+    return [item.strip() for item in str(value).split(LIST_SEPARATOR) if item.strip()]
+
+
+def request_from_spec(spec: Dict[str, Any], workflows: Optional[WorkflowManager] = None) -> QuoteRequest:
+    """
+    Build a QuoteRequest from a job spec dictionary.
+
+    Args:
+        spec: Job spec (JSON object or CSV row)
+        workflows: WorkflowManager used to resolve a "workflow" name to services
+
+    Returns:
+        QuoteRequest for the job
+
+    Raises:
+        ValueError: If the account is missing, the workflow is unknown or
+            a value is invalid
+    """
+    account = str(spec.get("account") or "").strip()
+    if not account:
+        raise ValueError("Job spec has no account")
+
+    services = _split_list(spec.get("services"))
+    workflow = spec.get("workflow")
+    if not services and isinstance(workflow, str) and workflow.strip():
+        account_workflows = workflows.get_workflows_for_account(account) if workflows else {}
+        if workflow.strip() not in account_workflows:
+            raise ValueError(f"Workflow '{workflow}' not found for {account}")
+        services = list(account_workflows[workflow.strip()])
+
+    word_counts = dict(spec.get("word_counts") or {})
+    percentages = dict(spec.get("percentages") or {})
+    # Flat CSV rows: label columns are word counts, percentage service columns are percentages
+    for key, value in spec.items():
+        if key in SPEC_KEYS or _is_missing(value):
+            continue
+        if key in PERCENTAGE_SERVICES:
+            percentages[key] = float(value)
+        elif isinstance(key, str) and key.endswith(":"):
+            word_counts[key] = float(value)
+
+    use_qtc_input = spec.get("use_qtc_input")
+    if _is_missing(use_qtc_input):
+        use_qtc_input = _choice(spec, "input", INPUT_TYPES) == "QTC"
+    else:
+        use_qtc_input = _parse_bool("use_qtc_input", use_qtc_input)
+    kwargs = {}
+    for key in ("min_fee", "hourly_divider"):
+        if not _is_missing(spec.get(key)):
+            kwargs[key] = float(spec[key])
+    return QuoteRequest(
+        account=account,
+        lps=_split_list(spec.get("lps")),
+        services=services,
+        word_counts=word_counts,
+        use_qtc_input=use_qtc_input,
+        file_type=_choice(spec, "file_type", FILE_TYPES),
+        percentages=percentages,
+        **kwargs
+    )
+
+
+def _read_specs(path: Path) -> List[Dict[str, Any]]:
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        specs = data if isinstance(data, list) else [data]
+        if len(specs) == 1 and isinstance(specs[0], dict):
+            specs[0].setdefault("job", path.stem)
+        return specs
+    if path.suffix.lower() == ".csv":
+        df = pd.read_csv(path, encoding="utf-8-sig")
+        specs = df.to_dict("records")
+        for number, spec in enumerate(specs, 1):
+            if not isinstance(spec.get("job"), str) or not spec["job"].strip():
+                spec["job"] = f"{path.stem}_{number}"
+        return specs
+    return []
+
+
+def load_jobs(path, workflows: Optional[WorkflowManager] = None) -> List[Tuple[str, Any]]:
+    """
+    Load job specs from a folder of JSON/CSV files or a single file.
+
+    Args:
+        path: Folder or file with job specs
+        workflows: WorkflowManager used to resolve workflow names
+
+    Returns:
+        List of (job name, QuoteRequest) pairs; a spec that cannot be
+        parsed is returned as (job name, error message), and so is a file
+        that cannot be read (named after the file)
+    """
+    path = Path(path)
+    files = sorted(p for p in path.iterdir() if p.suffix.lower() in (".json", ".csv")) if path.is_dir() else [path]
+
+    jobs = []
+    for file in files:
+        try:
+            specs = _read_specs(file)
+        except (OSError, ValueError) as e:  # Includes JSON, CSV and encoding errors
+            jobs.append((file.stem, f"Cannot read {file.name}: {e}"))
+            continue
+        for number, spec in enumerate(specs, 1):
+            if not isinstance(spec, dict):
+                jobs.append((f"{file.stem}_{number}", f"Job spec is not an object: {spec!r}"))
+                continue
+            name = str(spec.get("job") or f"{file.stem}_{number}")
+            try:
+                jobs.append((name, request_from_spec(spec, workflows)))
+            except (ValueError, TypeError) as e:
+                jobs.append((name, str(e)))
+    return jobs
+
+
+def _output_name(job_name: str) -> str:
+    return re.sub(r"[^\w\-. ]", "_", job_name).strip() or "job"
+
+
+# Per-process engine, loaded once by the pool initializer
+_engine: Optional[QuoteEngine] = None
+
+
+def _init_worker(excel_path: str, mapping_file: str):
+    global _engine
+    _engine = QuoteEngine.from_workbook(excel_path, ServiceMappingManager(mapping_file), QuoteCache())
+
+
+def _run_job(job: Tuple[str, Any, str]) -> Dict[str, Any]:
+    name, request, output_path = job
+    row = {header: "" for header in SUMMARY_HEADERS}
+    row["Job"] = name
+    if not isinstance(request, QuoteRequest):
+        row["Error"] = request
+        return row
+
+    row.update(Account=request.account, LPs=len(request.lps), Services=len(request.services))
+    try:
+        quote = _engine.quote(request)
+        quote.to_csv(output_path)
+    except Exception as e:  # One bad job must not lose the results of the others
+        row["Error"] = str(e) if isinstance(e, (ValueError, KeyError, OSError)) else f"{type(e).__name__}: {e}"
+        return row
+    row.update(
+        Lines=len(quote.charges),
+        Total=round(quote.total, 2),
+        Output=output_path,
+        **{"Fallback LPs": LIST_SEPARATOR.join(quote.fallback_lps)}
+    )
+    return row
+
+
+def run_batch(
+    jobs: Iterable[Tuple[str, Any]],
+    output_dir,
+    excel_path: str = DEFAULT_RATESHEET,
+    mapping_file: str = DEFAULT_MAPPING_FILE,
+    workers: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Price jobs in parallel and write one charges CSV per job plus summary.csv.
+
+    Args:
+        jobs: (job name, QuoteRequest) pairs, e.g. from load_jobs
+        output_dir: Folder for the charges CSVs and summary.csv
+        excel_path: Ratesheet workbook
+        mapping_file: Service label mapping JSON
+        workers: Number of worker processes (default: CPU count, 1 = in-process)
+
+    Returns:
+        Summary DataFrame, one row per job in input order
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    tasks, used = [], set()
+    for name, request in jobs:
+        file_name = _output_name(name)
+        while file_name.lower() in used:
+            file_name += "_"
+        used.add(file_name.lower())
+        tasks.append((name, request, str(output_dir / f"{file_name}.csv")))
+
+    workers = min(workers or os.cpu_count() or 1, max(len(tasks), 1))
+    if workers == 1:
+        _init_worker(excel_path, mapping_file)
+        rows = [_run_job(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(excel_path, mapping_file)) as pool:
+            rows = list(pool.map(_run_job, tasks, chunksize=chunksize))
+
+    summary = pd.DataFrame(rows, columns=SUMMARY_HEADERS)
+    summary.to_csv(output_dir / "summary.csv", index=False, encoding="utf-8-sig")
+    return summary
+
+
+def add_arguments(parser):
+    """Add the batch subcommand arguments to an argparse parser."""
+    parser.add_argument("jobs", help="Folder of *.json/*.csv job specs, or a single spec file")
+    parser.add_argument("-o", "--output", default="quotes", help="Output folder (default: quotes)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--ratesheet", default=DEFAULT_RATESHEET, help="Ratesheet workbook")
+    parser.add_argument("--mappings", default=DEFAULT_MAPPING_FILE, help="Service label mapping JSON")
+    parser.add_argument("--workflows", default=DEFAULT_WORKFLOW_FILE, help="Workflows JSON")
+
+
+def run(args) -> int:
+    """Run the batch subcommand; returns the process exit code."""
+    jobs = load_jobs(args.jobs, WorkflowManager(args.workflows))
+    if not jobs:
+        print(f"No job specs found in {args.jobs}")
+        return 1
+
+    summary = run_batch(jobs, args.output, args.ratesheet, args.mappings, args.workers)
+    failed = summary[summary["Error"] != ""]
+    print(f"Priced {len(summary) - len(failed)}/{len(summary)} jobs -> {Path(args.output) / 'summary.csv'}")
+    for _, row in failed.iterrows():
+        print(f"  {row['Job']}: {row['Error']}")
+    return 1 if len(failed) else 0
@@ -1,6 +1,6 @@
 """
 Entity Manager GUI
-Allows users to create, view, and manage PA Service entities in WF_Matrix.py
+Allows users to create, view, and manage PA Service entities (stored in Core/pa_services.json)
 """
 
 import customtkinter as ctk
@@ -13,6 +13,7 @@ import re
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from Core import WF_Matrix
+from Core.pa_service_store import pa_service_store
 
 
 class ServiceEditorWindow:
@@ -44,11 +45,8 @@ class ServiceEditorWindow:
         
         try:
             # Store original services for comparison
-            import importlib
-            importlib.reload(WF_Matrix)
-            
             if entity_name not in WF_Matrix.PA_SERVICES:
-                messagebox.showerror("Error", f"Entity '{entity_name}' not found in WF_Matrix!")
+                messagebox.showerror("Error", f"Entity '{entity_name}' not found in PA services!")
                 self.window.destroy()
                 return
             
@@ -237,7 +235,7 @@ class ServiceEditorWindow:
                         break
             
     def save_changes(self):
-        """Save changes to WF_Matrix.py"""
+        """Save changes to the PA service store"""
         
         # Collect all services from entry widgets
         new_services = [self.services[0]]  # Keep header
@@ -251,13 +249,14 @@ class ServiceEditorWindow:
             messagebox.showerror("Error", "Cannot save entity with no services!")
             return
         
-        # Update WF_Matrix.py
+        # Update the PA service store
         try:
             # If this is TPUS (master), detect new services and sync to other entities
             if self.entity_name == "TPUS":
                 old_master_services = [row[2] for row in self.services[1:]]  # Old service names
                 new_master_services = [row[2] for row in new_services[1:]]  # New service names
-                added_services = [s for s in new_master_services if s not in old_master_services]
+                old_master_set = set(old_master_services)
+                added_services = [s for s in new_master_services if s not in old_master_set]
                 
                 if added_services:
                     # Import mapper to sync
@@ -292,44 +291,8 @@ class ServiceEditorWindow:
             messagebox.showerror("Error", f"Failed to save services:\n{str(e)}")
     
     def update_services_in_file(self, new_services):
-        """Update services in WF_Matrix.py file"""
-        
-        wf_matrix_path = Path(__file__).parent.parent.parent / "Core" / "WF_Matrix.py"
-        
-        with open(wf_matrix_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # Find the entity list definition
-        variable_name = f"{self.entity_name}_PA_SERVICES"
-        start_line = -1
-        end_line = -1
-        bracket_count = 0
-        
-        for i, line in enumerate(lines):
-            if f"{variable_name} = [" in line:
-                start_line = i
-                bracket_count = line.count('[') - line.count(']')
-            elif start_line != -1:
-                bracket_count += line.count('[') - line.count(']')
-                if bracket_count == 0:
-                    end_line = i
-                    break
-        
-        if start_line == -1:
-            raise Exception(f"Could not find {variable_name} in WF_Matrix.py")
-        
-        # Generate new lines
-        new_lines = [f"{variable_name} = [\n"]
-        for service in new_services:
-            new_lines.append(f"    {service},\n")
-        new_lines.append("]\n")
-        
-        # Replace old definition with new one
-        lines = lines[:start_line] + new_lines + lines[end_line + 1:]
-        
-        # Write back
-        with open(wf_matrix_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+        """Save the entity's services (header row first) to the PA service store"""
+        pa_service_store.set_services(self.entity_name, new_services[1:])
 
 
 class EntityManagerGUI:
@@ -422,7 +385,7 @@ class EntityManagerGUI:
         # Info label
         info_label = ctk.CTkLabel(
             input_frame,
-            text="Entity name will be automatically uppercased\nand formatted as: ENTITYNAME_PA_SERVICES",
+            text="Entity name will be automatically uppercased",
             font=ctk.CTkFont(size=11),
             text_color="gray"
         )
@@ -528,11 +491,7 @@ class EntityManagerGUI:
         for widget in self.entity_list_frame.winfo_children():
             widget.destroy()
         
-        # Reload WF_Matrix to get latest data
-        import importlib
-        importlib.reload(WF_Matrix)
-        
-        # Display entities
+        # Display entities (PA_SERVICES always reflects the saved store)
         entities = WF_Matrix.PA_SERVICES
         
         if not entities:
@@ -704,7 +663,7 @@ class EntityManagerGUI:
             traceback.print_exc()
     
     def delete_entity(self, entity_name):
-        """Delete an entity from WF_Matrix.py"""
+        """Delete an entity from the PA service store"""
         if entity_name == "TPUS":
             messagebox.showerror(
                 "Cannot Delete Master",
@@ -713,9 +672,6 @@ class EntityManagerGUI:
             return
         
         # Confirmation with details
-        import importlib
-        importlib.reload(WF_Matrix)
-        
         service_count = len(WF_Matrix.PA_SERVICES.get(entity_name, [])) - 1
         
         confirm = messagebox.askyesno(
@@ -744,51 +700,7 @@ class EntityManagerGUI:
             return
         
         try:
-            wf_matrix_path = Path(__file__).parent.parent.parent / "Core" / "WF_Matrix.py"
-            
-            with open(wf_matrix_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Find and remove entity list definition
-            variable_name = f"{entity_name}_PA_SERVICES"
-            start_line = -1
-            end_line = -1
-            bracket_count = 0
-            
-            # Find list definition
-            for i, line in enumerate(lines):
-                if f"{variable_name} = [" in line or f"# List of {entity_name}" in line:
-                    if start_line == -1:
-                        start_line = i
-                        if "# List" in line:
-                            continue
-                if start_line != -1 and f"{variable_name} = [" in line:
-                    bracket_count = line.count('[') - line.count(']')
-                elif start_line != -1 and bracket_count > 0:
-                    bracket_count += line.count('[') - line.count(']')
-                    if bracket_count == 0:
-                        end_line = i
-                        break
-            
-            if start_line != -1 and end_line != -1:
-                # Remove list definition (including comment)
-                del lines[start_line:end_line + 2]  # +2 to include newline after
-            
-            # Remove from PA_SERVICES dictionary
-            new_lines = []
-            skip_next = False
-            for line in lines:
-                if f'"{entity_name}":' in line and "_PA_SERVICES" in line:
-                    skip_next = True
-                    continue
-                if skip_next:
-                    skip_next = False
-                    continue
-                new_lines.append(line)
-            
-            # Write back
-            with open(wf_matrix_path, 'w', encoding='utf-8') as f:
-                f.writelines(new_lines)
+            pa_service_store.delete_entity(entity_name)
             
             # Remove mappings
             try:
@@ -836,24 +748,11 @@ class EntityManagerGUI:
         if not re.match(r'^[A-Za-z0-9]+$', name):
             return False, "Entity name must contain only letters and numbers"
         
-        # Reload WF_Matrix to check for latest entities
-        import importlib
-        importlib.reload(WF_Matrix)
-        
         # Check if already exists (case-insensitive)
         existing_entities = [e.upper() for e in WF_Matrix.PA_SERVICES.keys()]
         if name.upper() in existing_entities:
             return False, f"Entity '{name.upper()}' already exists!\n\nDuplicate entities are not allowed.\nPlease choose a different name."
         
-        # Check in file to catch entities not yet in PA_SERVICES dict
-        wf_matrix_path = Path(__file__).parent.parent.parent / "Core" / "WF_Matrix.py"
-        with open(wf_matrix_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        variable_name = f"{name.upper()}_PA_SERVICES"
-        if variable_name in content:
-            return False, f"Entity '{name.upper()}' already exists in WF_Matrix.py!\n\nDuplicate entities are not allowed.\nPlease choose a different name or refresh the entity list."
-        
         return True, ""
     
     def create_entity(self):
@@ -892,8 +791,7 @@ class EntityManagerGUI:
                 messagebox.showinfo(
                     "Success",
                     f"Entity '{entity_name}' has been created!\n\n"
-                    f"Variable name: {entity_name}_PA_SERVICES\n"
-                    f"Location: Core/WF_Matrix.py"
+                    f"Location: Core/pa_services.json"
                 )
             else:
                 self.status_label.configure(
@@ -910,7 +808,7 @@ class EntityManagerGUI:
     
     def add_entity_to_wf_matrix(self, entity_name, copy_from=None):
         """
-        Add new entity to WF_Matrix.py file
+        Add new entity to the PA service store
         
         Args:
             entity_name (str): Name of entity to create
@@ -919,68 +817,14 @@ class EntityManagerGUI:
         Returns:
             bool: True if successful
         """
-        wf_matrix_path = Path(__file__).parent.parent.parent / "Core" / "WF_Matrix.py"
-        
-        # Read current file
-        with open(wf_matrix_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # Prepare new entity list
-        variable_name = f"{entity_name}_PA_SERVICES"
-        
         if copy_from and copy_from != "None" and copy_from in WF_Matrix.PA_SERVICES:
             # Copy services from existing entity
-            services = WF_Matrix.PA_SERVICES[copy_from].copy()
+            services = pa_service_store.get_services(copy_from)
         else:
-            # Create with just header
-            services = [["Service Group 1", "Service Group 2", "Service", "Default UofM"]]
-        
-        # Format services as Python code
-        new_entity_lines = [f"\n# List of {entity_name} PA Services\n"]
-        new_entity_lines.append(f"{variable_name} = [\n")
-        for service in services:
-            new_entity_lines.append(f"    {service},\n")
-        new_entity_lines.append("]\n")
-        
-        # Find the PA_SERVICES dictionary and insert new entity
-        pa_services_dict_line = -1
-        pa_services_closing_line = -1
-        last_dict_entry_line = -1
-        
-        for i, line in enumerate(lines):
-            if "PA_SERVICES = {" in line:
-                pa_services_dict_line = i
-            if pa_services_dict_line != -1:
-                # Look for dictionary entries
-                if '": ' in line and '_PA_SERVICES' in line:
-                    last_dict_entry_line = i
-                if line.strip() == "}":
-                    pa_services_closing_line = i
-                    break
-        
-        if pa_services_dict_line == -1:
-            raise Exception("Could not find PA_SERVICES dictionary in WF_Matrix.py")
-        
-        # Insert new entity definition before PA_SERVICES dictionary
-        lines = lines[:pa_services_dict_line] + new_entity_lines + ["\n"] + lines[pa_services_dict_line:]
-        
-        # Update line numbers after insertion
-        pa_services_closing_line += len(new_entity_lines) + 1
-        last_dict_entry_line += len(new_entity_lines) + 1
-        
-        # Ensure the last entry has a comma
-        if last_dict_entry_line != -1:
-            line = lines[last_dict_entry_line]
-            if not line.rstrip().endswith(','):
-                lines[last_dict_entry_line] = line.rstrip() + ',\n'
-        
-        # Add new entry to PA_SERVICES dictionary (before closing brace)
-        new_dict_entry = f'    "{entity_name}": {variable_name},\n'
-        lines.insert(pa_services_closing_line, new_dict_entry)
-        
-        # Write back to file
-        with open(wf_matrix_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+            # Create with no services
+            services = []
+        
+        pa_service_store.add_entity(entity_name, services)
         
         # Create initial service mappings for the new entity (if not TPUS)
         if entity_name != "TPUS":
@@ -988,10 +832,6 @@ class EntityManagerGUI:
                 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "Core"))
                 from entity_service_mapper import EntityServiceMapper
                 
-                # Reload WF_Matrix to get the new entity
-                import importlib
-                importlib.reload(WF_Matrix)
-                
                 mapper = EntityServiceMapper()
                 mapper.create_entity_mappings(entity_name, WF_Matrix.PA_SERVICES)
             except Exception as e:
@@ -2,8 +2,17 @@
 One Stop Shop - Main Application
 Translation service quote calculator with UI integration.
 Refactored version integrating TheOneBP functionality with AutomationSuite Core.
+
+Usage:
+    python oss_main.py                 Start the GUI
+    python oss_main.py batch JOBS      Price a folder/CSV of job specs
+    python oss_main.py serve           Run the local quote HTTP service
+
+    --profile[=cprofile] (before or after the command) writes a profiling
+    report of the session to the profiles folder.
 """
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -11,16 +20,85 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Import the original MainScript functionality
-# This keeps the UI-heavy code together while leveraging Core modules
-from One_Stop_Shop.theonebp_app import TheOneBPApp
+from Core.profiling import PROFILE_FLAG, profiler
+
+APP_DIR = Path(sys.executable).parent if getattr(sys, 'frozen', False) else Path(__file__).parent
+PROFILE_DIR = APP_DIR / "profiles"
+
+
+def add_profile_argument(parser, default=None):
+    """
+    Add the --profile and --profile=cprofile flags to an argparse parser.
+
+    They are two flags rather than one option with an optional value, so
+    "--profile gui" does not read the command as the profiling mode.
+    """
+    parser.add_argument(
+        PROFILE_FLAG, dest="profile", action="store_const", const="1", default=default,
+        help="Write a profiling report of the session to the profiles folder"
+    )
+    parser.add_argument(
+        f"{PROFILE_FLAG}=cprofile", dest="profile", action="store_const", const="cprofile", default=default,
+        help="Same as --profile, plus cProfile of the UI thread"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    from One_Stop_Shop import batch_quote, quote_service
 
+    parser = argparse.ArgumentParser(description="One Stop Shop quote calculator")
+    add_profile_argument(parser)
+    subparsers = parser.add_subparsers(dest="command")
+    # SUPPRESS keeps "--profile gui" from being reset by the subcommand's default
+    add_profile_argument(subparsers.add_parser("gui", help="Start the GUI (default)"), argparse.SUPPRESS)
+    batch_quote.add_arguments(
+        subparsers.add_parser("batch", help="Price a folder or CSV of job specs in parallel")
+    )
+    quote_service.add_arguments(
+        subparsers.add_parser("serve", help="Run the local quote HTTP/JSON service")
+    )
+    return parser
 
-def main():
+
+def configure_profiler(args, session=profiler, report_dir=PROFILE_DIR) -> bool:
+    """
+    Start profiling if --profile was given.
+
+    Args:
+        args: Parsed command line arguments
+        session: Profiler to start
+        report_dir: Folder of the session report (None: no report on exit)
+
+    Returns:
+        True if profiling was started
+    """
+    if not args.profile:
+        return False
+    return session.configure([f"{PROFILE_FLAG}={args.profile}"], environ={}, report_dir=report_dir)
+
+
+def main(argv=None):
     """Main entry point for One Stop Shop application."""
+    args = build_parser().parse_args(argv)
+    if configure_profiler(args):
+        print(f"Profiling enabled{' with cProfile' if profiler.use_cprofile else ''}; report in {PROFILE_DIR}")
+
+    if args.command == "batch":
+        from One_Stop_Shop import batch_quote
+        return batch_quote.run(args)
+    if args.command == "serve":
+        from One_Stop_Shop import quote_service
+        return quote_service.run(args)
+
+    # Import the original MainScript functionality only when the GUI is wanted;
+    # importing it builds the Tk window
+    from One_Stop_Shop.theonebp_app import TheOneBPApp
+
     app = TheOneBPApp()
     app.run()
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""
+Quote Service
+Small local HTTP/JSON service that prices quotes with a warm QuoteEngine.
+
+The ratesheet workbook, service label mappings and workflows are loaded
+once and reloaded only when their file modification time changes, so a
+request costs a QuoteEngine.quote call instead of an xlsx read.
+
+Endpoints:
+    POST /quote    Job spec (same keys as batch_quote) -> charges and totals
+    GET  /health   Loaded accounts and file versions
+    GET  /stats    Request count, errors, latency percentiles and cache hits
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from Core.quote_cache import QuoteCache
+from Core.quote_engine import QuoteEngine
+from Core.service_mapping_manager import ServiceMappingManager
+from Core.workflow_manager import WorkflowManager
+from Core.utils.logger import get_logger
+from One_Stop_Shop.batch_quote import (
+    DEFAULT_MAPPING_FILE, DEFAULT_RATESHEET, DEFAULT_WORKFLOW_FILE, request_from_spec
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 1024 * 1024
+
+
+def _mtime(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+class LatencyStats:
+    """Thread-safe request counters with a window of recent latencies."""
+
+    def __init__(self, window: int = 1024):
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=window)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float, error: bool = False):
+        with self._lock:
+            self.count += 1
+            self.errors += int(error)
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+            self._recent.append(elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the counters and p50/p95/p99 of the recent window, in ms."""
+        with self._lock:
+            recent = np.array(self._recent, dtype=float)
+            stats = {
+                "requests": self.count,
+                "errors": self.errors,
+                "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+                "max_ms": round(self.max_ms, 3),
+            }
+        for pct in (50, 95, 99):
+            stats[f"p{pct}_ms"] = round(float(np.percentile(recent, pct)), 3) if len(recent) else 0.0
+        return stats
+
+
+class QuoteService:
+    """
+    Warm quote state shared by the HTTP handler threads.
+
+    Reloads swap in a complete new (engine, workflows) pair, so a request
+    always sees one consistent version of the files.
+    """
+
+    def __init__(
+        self,
+        excel_path: str = DEFAULT_RATESHEET,
+        mapping_file: str = DEFAULT_MAPPING_FILE,
+        workflow_file: str = DEFAULT_WORKFLOW_FILE
+    ):
+        self.excel_path = excel_path
+        self.mapping_file = mapping_file
+        self.workflow_file = workflow_file
+        self.stats = LatencyStats()
+        self.cache = QuoteCache()
+        self._reload_lock = threading.Lock()
+        self._mtimes: Dict[str, Optional[float]] = {}
+        self._state: Tuple[Optional[QuoteEngine], Optional[WorkflowManager]] = (None, None)
+        self.reload_if_changed()
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload any file whose modification time changed.
+
+        Returns:
+            True if anything was reloaded
+        """
+        current = {
+            "ratesheet": _mtime(self.excel_path),
+            "mappings": _mtime(self.mapping_file),
+            "workflows": _mtime(self.workflow_file),
+        }
+        if current == self._mtimes:
+            return False
+
+        with self._reload_lock:
+            if current == self._mtimes:
+                return False
+            engine, workflows = self._state
+            changed = [name for name, mtime in current.items() if self._mtimes.get(name, -1) != mtime]
+
+            mapping_manager = engine.mappings if engine else None
+            if "mappings" in changed or mapping_manager is None:
+                mapping_manager = ServiceMappingManager(self.mapping_file)
+            if "ratesheet" in changed or engine is None:
+                engine = QuoteEngine.from_workbook(self.excel_path, mapping_manager, self.cache)
+            else:
+                engine = QuoteEngine(
+                    engine.ratesheets, engine.services_uofm,
+                    engine.service_group1, engine.service_group2, mapping_manager, self.cache
+                )
+            if "workflows" in changed or workflows is None:
+                workflows = WorkflowManager(self.workflow_file)
+
+            self._state = (engine, workflows)
+            self._mtimes = current
+            logger.info(f"Loaded {', '.join(changed)}")
+            return True
+
+    @property
+    def engine(self) -> QuoteEngine:
+        return self._state[0]
+
+    def quote(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Price a job spec.
+
+        Args:
+            spec: Job spec dictionary (see batch_quote)
+
+        Returns:
+            JSON-serialisable quote result
+
+        Raises:
+            ValueError: If the spec is invalid
+        """
+        self.reload_if_changed()
+        engine, workflows = self._state
+        quote = engine.quote(request_from_spec(spec, workflows))
+        return {
+            "account": quote.request.account,
+            "total": round(quote.total, 2),
+            "totals_by_lp": {lp: round(float(total), 2) for lp, total in quote.totals_by_lp().items()},
+            "fallback_lps": quote.fallback_lps,
+            "charges": quote.charges.to_dict("records"),
+        }
+
+    def health(self) -> Dict[str, Any]:
+        return {"status": "ok", "accounts": self.engine.accounts, "versions": dict(self._mtimes)}
+
+
+class QuoteRequestHandler(BaseHTTPRequestHandler):
+    """JSON request handler; the QuoteService is attached to the server."""
+
+    server_version = "OneStopShopQuote/1.0"
+
+    def _send_json(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        service = self.server.quote_service
+        if self.path == "/health":
+            self._send_json(200, service.health())
+        elif self.path == "/stats":
+            self._send_json(200, dict(service.stats.snapshot(), cache=service.cache.stats()))
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/quote":
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        service = self.server.quote_service
+        start = time.perf_counter()
+        status, payload = 200, None
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY_BYTES:
+                raise ValueError("Request body too large")
+            spec = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(spec, dict):
+                raise ValueError("Request body must be a JSON object")
+            payload = service.quote(spec)
+        except (ValueError, TypeError, KeyError) as e:
+            status, payload = 400, {"error": str(e)}
+        except Exception as e:
+            logger.exception("Quote failed")
+            status, payload = 500, {"error": str(e)}
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        service.stats.record(elapsed_ms, error=status != 200)
+        payload["elapsed_ms"] = round(elapsed_ms, 3)
+        self._send_json(status, payload)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def create_server(service: QuoteService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """
+    Create (but do not start) the HTTP server.
+
+    Args:
+        service: Warm QuoteService
+        host: Interface to bind; defaults to localhost only
+        port: Port to bind (0 picks a free port)
+
+    Returns:
+        ThreadingHTTPServer; call serve_forever() to run it
+    """
+    server = ThreadingHTTPServer((host, port), QuoteRequestHandler)
+    server.daemon_threads = True
+    server.quote_service = service
+    return server
+
+
+def add_arguments(parser):
+    """Add the serve subcommand arguments to an argparse parser."""
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Interface to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--ratesheet", default=DEFAULT_RATESHEET, help="Ratesheet workbook")
+    parser.add_argument("--mappings", default=DEFAULT_MAPPING_FILE, help="Service label mapping JSON")
+    parser.add_argument("--workflows", default=DEFAULT_WORKFLOW_FILE, help="Workflows JSON")
+
+
+def run(args) -> int:
+    """Run the serve subcommand until interrupted."""
+    server = create_server(QuoteService(args.ratesheet, args.mappings, args.workflows), args.host, args.port)
+    host, port = server.server_address[:2]
+    print(f"Quote service listening on http://{host}:{port} (POST /quote, GET /stats, GET /health)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nQuote service stopped")
+    finally:
+        server.server_close()
+    return 0
@@ -0,0 +1,108 @@
+"""
+Test script for batch quoting
+Run this to verify job specs are priced in worker processes
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from One_Stop_Shop.batch_quote import load_jobs, request_from_spec, run_batch
+from Core.quote_engine import QuoteRequest
+from Core.workflow_manager import WorkflowManager
+
+
+def test_batch_quote():
+    """JSON and CSV specs are priced in parallel, one CSV per job"""
+    with tempfile.TemporaryDirectory() as folder:
+        jobs_dir = Path(folder) / "jobs"
+        jobs_dir.mkdir()
+        with open(jobs_dir / "requote.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "account": "S IQVIA",
+                "lps": ["English (US) into French (FR)", "English (US) into German (DE)"],
+                "workflow": "workflow2",
+            }, f)
+        pd.DataFrame([
+            {"job": "month end", "account": "S IQVIA", "lps": "English (US) into French (FR)",
+             "services": "Translation;Project Management", "New Words:": 2000, "Project Management": 5},
+            {"job": "broken", "account": "S IQVIA", "lps": "", "services": "Translation"},
+        ]).to_csv(jobs_dir / "jobs.csv", index=False)
+
+        workflows = WorkflowManager(str(Path(__file__).parent / "workflows.json"))
+        jobs = load_jobs(jobs_dir, workflows)
+        summary = run_batch(jobs, Path(folder) / "out", workers=2).set_index("Job")
+
+        assert list(summary.index) == ["month end", "broken", "requote"]
+        assert summary.loc["broken", "Error"] != ""
+        assert summary.loc["requote", "Lines"] == 2
+        charges = pd.read_csv(summary.loc["month end", "Output"], encoding="utf-8-sig")
+        assert charges["Service"].tolist() == ["Translation", "Project Management"]
+        assert charges["Quantity"].tolist() == [2000, 0.05]
+        assert (Path(folder) / "out" / "summary.csv").exists()
+
+
+def test_request_from_spec_values():
+    """Blank CSV cells take the defaults and flags are parsed from text"""
+    spec = {"account": "S IQVIA", "lps": "English (US) into French (FR)", "services": "Translation"}
+    blank = float("nan")
+    request = request_from_spec(dict(spec, file_type=blank, input=blank, use_qtc_input=blank, min_fee=blank))
+    assert (request.file_type, request.use_qtc_input, request.min_fee) == ("Live", False, 150)
+
+    assert request_from_spec(dict(spec, file_type=" dead ", input="qtc")).file_type == "Dead"
+    assert request_from_spec(dict(spec, input="qtc")).use_qtc_input
+    for text, expected in (("false", False), ("0", False), ("No", False), ("TRUE", True), ("1", True)):
+        assert request_from_spec(dict(spec, use_qtc_input=text)).use_qtc_input is expected, text
+
+    for bad in (dict(file_type="nan"), dict(input="Excel"), dict(use_qtc_input="maybe")):
+        try:
+            request_from_spec(dict(spec, **bad))
+            assert False, f"spec should be rejected: {bad}"
+        except ValueError:
+            pass
+
+
+def test_load_jobs_reports_bad_files():
+    """Unreadable files and non-object specs become error rows instead of ending the run"""
+    with tempfile.TemporaryDirectory() as folder:
+        jobs_dir = Path(folder)
+        (jobs_dir / "broken.json").write_text("{not json", encoding="utf-8")
+        (jobs_dir / "list.json").write_text(json.dumps([
+            {"job": "ok", "account": "S IQVIA", "lps": ["English (US) into French (FR)"], "services": ["Translation"]},
+            "Translation",
+        ]), encoding="utf-8")
+
+        jobs = dict(load_jobs(jobs_dir))
+        assert list(jobs) == ["broken", "ok", "list_2"]
+        assert jobs["broken"].startswith("Cannot read broken.json")
+        assert jobs["list_2"].startswith("Job spec is not an object")
+        assert jobs["ok"].services == ["Translation"]
+
+
+def test_failed_job_keeps_other_results():
+    """An unexpected error in one job is recorded in its row; the summary is still written"""
+    spec = dict(account="S IQVIA", lps=["English (US) into French (FR)"], services=["Translation", "Project Management"])
+    jobs = [
+        ("good", QuoteRequest(**spec, word_counts={"New Words:": 1000})),
+        ("bad percentage", QuoteRequest(**spec, percentages={"Project Management": [5]})),
+    ]
+    with tempfile.TemporaryDirectory() as folder:
+        summary = run_batch(jobs, folder, workers=1).set_index("Job")
+        assert summary.loc["good", "Error"] == "" and summary.loc["good", "Total"] > 0
+        assert summary.loc["bad percentage", "Error"].startswith("TypeError")
+        assert (Path(folder) / "summary.csv").exists()
+
+
+if __name__ == "__main__":
+    test_batch_quote()
+    test_request_from_spec_values()
+    test_load_jobs_reports_bad_files()
+    test_failed_job_keeps_other_results()
+    print("✓ All batch quote tests passed!")
@@ -0,0 +1,60 @@
+"""
+Test script for the One Stop Shop entry point
+Run this to verify the command line is parsed and --profile reaches the profiler
+"""
+
+import sys
+from pathlib import Path
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Core.profiling import Profiler
+from One_Stop_Shop.oss_main import build_parser, configure_profiler
+
+
+def test_profile_flag():
+    """--profile is accepted before and after the gui command"""
+    parser = build_parser()
+    cases = {
+        (): (None, None),
+        ("--profile",): (None, "1"),
+        ("gui",): ("gui", None),
+        ("gui", "--profile"): ("gui", "1"),
+        ("gui", "--profile=cprofile"): ("gui", "cprofile"),
+        ("--profile", "gui"): ("gui", "1"),
+        ("--profile=cprofile", "gui"): ("gui", "cprofile"),
+        ("--profile=cprofile", "batch", "jobs"): ("batch", "cprofile"),
+    }
+    for argv, expected in cases.items():
+        args = parser.parse_args(list(argv))
+        assert (args.command, args.profile) == expected, argv
+
+    try:
+        parser.parse_args(["gui", "--profile=fast"])
+        assert False, "unknown profile modes should be rejected"
+    except SystemExit:
+        pass
+
+
+def test_profile_flag_starts_profiler():
+    """The parsed flag starts the profiler in the requested mode"""
+    parser = build_parser()
+    session = Profiler()
+    assert not configure_profiler(parser.parse_args(["gui"]), session, report_dir=None)
+    assert not session.enabled
+
+    assert configure_profiler(parser.parse_args(["gui", "--profile"]), session, report_dir=None)
+    assert session.enabled and not session.use_cprofile
+    session.stop()
+
+    assert configure_profiler(parser.parse_args(["--profile=cprofile"]), session, report_dir=None)
+    assert session.enabled and session.use_cprofile
+    session.stop()
+
+
+if __name__ == "__main__":
+    test_profile_flag()
+    test_profile_flag_starts_profiler()
+    print("✓ All One Stop Shop entry point tests passed!")
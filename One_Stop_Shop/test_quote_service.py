@@ -0,0 +1,78 @@
+"""
+Test script for the local quote service
+Run this to verify quotes are served over HTTP on localhost
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# Add paths
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from One_Stop_Shop.quote_service import QuoteService, create_server
+
+APP_DIR = Path(__file__).parent
+
+
+def call(url, spec=None):
+    data = json.dumps(spec).encode("utf-8") if spec is not None else None
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data)) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+def test_quote_service():
+    """Quotes are priced from warm state and mapping edits are picked up"""
+    with tempfile.TemporaryDirectory() as folder:
+        mapping_file = Path(folder) / "service_label_mapping.json"
+        shutil.copy(APP_DIR / "service_label_mapping.json", mapping_file)
+        service = QuoteService(
+            str(APP_DIR / "One_BP_IQ fixed.01.xlsx"), str(mapping_file), str(APP_DIR / "workflows.json")
+        )
+        server = create_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        spec = {
+            "account": "S IQVIA",
+            "lps": ["English (US) into French (FR)"],
+            "services": ["Translation", "Project Management"],
+            "word_counts": {"New Words:": 2000},
+        }
+        try:
+            status, health = call(f"{base}/health")
+            assert status == 200 and "S IQVIA" in health["accounts"]
+
+            status, quote = call(f"{base}/quote", spec)
+            assert status == 200
+            assert [c["Service"] for c in quote["charges"]] == ["Translation", "Project Management"]
+            assert quote["charges"][1]["Quantity"] == 0.1
+
+            mappings = json.loads(mapping_file.read_text(encoding="utf-8"))
+            mappings["S IQVIA"]["default_pm_percent"] = "5"
+            mapping_file.write_text(json.dumps(mappings), encoding="utf-8")
+            service._mtimes["mappings"] = None  # mtime resolution may hide the edit
+            status, quote = call(f"{base}/quote", spec)
+            assert quote["charges"][1]["Quantity"] == 0.05
+
+            status, error = call(f"{base}/quote", dict(spec, lps=[]))
+            assert status == 400 and "error" in error
+
+            status, stats = call(f"{base}/stats")
+            assert stats["requests"] == 3 and stats["errors"] == 1
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    test_quote_service()
+    print("✓ All quote service tests passed!")
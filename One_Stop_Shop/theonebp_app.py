@@ -1,14 +1,18 @@
+import time
+_STARTUP_T0 = time.perf_counter()
+
 import customtkinter as ctk
-import pandas as pd
 import os
 import json
 import math
+import queue
+import threading
+from contextlib import contextmanager
 from tkinter import filedialog, messagebox
 from tkinter import Listbox
 from ttkthemes import ThemedTk
 from tkinter import StringVar
 from tkinter.ttk import Combobox
-import time
 from threading import Timer
 from tkinter import IntVar
 import sys
@@ -18,14 +22,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import Core modules
+# pandas-based modules (rate_calculations, quote_engine, ...) are imported
+# inside the functions that need them so the window can show before pandas loads
 from Core.workflow_manager import WorkflowManager
 from Core.language_pair_manager import LanguagePairManager
 from Core.service_mapping_manager import ServiceMappingManager
-from Core.rate_calculations import (
-    get_service_type, calculate_hourly_quantity,
-    get_word_rate, get_hourly_rate, apply_minimum_fee_logic,
-    calculate_percentage_service_rate, sanitize_csv_value
-)
+from Core.language_index import LanguageIndex
+from Core.profiling import profiler
 
 # Import admin config UI
 from admin_config_ui import open_admin_config
@@ -39,41 +42,62 @@ def get_excel_path():
 
 current_directory = os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else os.path.dirname(os.path.abspath(__file__))
 
+# Opt-in profiling (ONE_STOP_SHOP_PROFILE=1|cprofile or --profile[=cprofile]);
+# the report of the session is written to the profiles folder on exit.
+# oss_main has already started it when the flag was given there
+PROFILE_DIR = os.path.join(current_directory, "profiles")
+if not profiler.enabled and profiler.configure(sys.argv[1:], report_dir=PROFILE_DIR):
+    print(f"Profiling enabled{' with cProfile' if profiler.use_cprofile else ''}; report in {PROFILE_DIR}")
+
+
+# The workbook is read once, on a background thread after the window is
+# shown, into a RatesheetModel that every callback queries
+ratesheet_model = None
+ratesheet_loaded = False
+DEFAULT_SERVICE_COUNT = 20
+startup_timings = {}
+
 
 def get_max_service_count_across_ratesheets():
-    """Scan all 'S ' worksheets and return the max number of services."""
-    try:
-        excel_file = pd.ExcelFile(get_excel_path())
-        max_count = 0
-        for ws in excel_file.sheet_names:
-            if ws.startswith("S "):
-                df_services = pd.read_excel(get_excel_path(), sheet_name="Services per account")
-                account_name = ws.replace('S ', '')
-                if account_name in df_services.columns:
-                    count = df_services[df_services[account_name].notna()][account_name].count()
-                    if count > max_count:
-                        max_count = count
-        return max_count
-    except Exception as e:
-        print(f"Error finding max service count: {e}")
-        return 20  # fallback default
-WorkSheets = []
-try:
-    excel_file = pd.ExcelFile(get_excel_path())
-    WorkSheets = [ws for ws in excel_file.sheet_names if ws.startswith("S ")]
-    if not WorkSheets:
-        messagebox.showerror("Error", "No worksheets starting with 'S ' found in the Excel file.")
-except Exception as e:
-    messagebox.showerror("Error", f"An error occurred while reading the Excel file: {str(e)}")
-    WorkSheets = ['S IQVIA']
+    """Return the max number of services across the loaded 'S ' worksheets."""
+    if ratesheet_model is None:
+        return DEFAULT_SERVICE_COUNT
+    return ratesheet_model.max_service_count()
 
 
-CurrentWS = WorkSheets[0]
+@profiler.profiled()
+def load_ratesheet_model(progress):
+    """
+    Read the ratesheet workbook into a RatesheetModel.
+
+    Runs on the loader thread, so it must not touch any widget; progress is
+    reported through the progress(fraction, message) callback.
+    """
+    from Core.ratesheet_model import RatesheetModel
+    progress(0.05, "Opening ratesheet...")
+    return RatesheetModel.from_workbook(
+        get_excel_path(), mapping_manager, get_quote_cache(),
+        lambda fraction, message: progress(0.05 + 0.95 * fraction, message)
+    )
+
+
+WorkSheets = []
+CurrentWS = ""
 
 # Initialize managers
 workflow_manager = WorkflowManager(os.path.join(current_directory, "workflows.json"))
 lp_manager = LanguagePairManager()
 mapping_manager = ServiceMappingManager(os.path.join(current_directory, "service_label_mapping.json"))
+quote_cache = None
+
+
+def get_quote_cache():
+    """Quote cache shared by all exports (created on first use)."""
+    global quote_cache
+    if quote_cache is None:
+        from Core.quote_cache import QuoteCache
+        quote_cache = QuoteCache()
+    return quote_cache
 
 def load_service_label_mapping():
     return mapping_manager.get_mapping_for_account(CurrentWS)
@@ -81,17 +105,21 @@ def load_service_label_mapping():
 def get_default_pm_percent():
     return mapping_manager.get_default_pm_percent(CurrentWS)
 
+def get_pricing_config():
+    """Compiled pricing config for the current account (cached by the manager)."""
+    return mapping_manager.get_pricing_config(CurrentWS)
+
 def reload_service_label_mapping():
     global service_label_mapping
+    mapping_manager.reload_mappings()
     service_label_mapping = load_service_label_mapping()
     get_default_pm_percent()
-    update_preview()
+    schedule_preview_update()
 
 service_label_mapping = load_service_label_mapping()
 
 # Global toggle to determine which input is active
 use_qtc_input = False
-suspend_preview_update = False
 
 # Deprecated - now using lp_manager
 LPs = []  # List to store Language Pairs (LPs)
@@ -106,12 +134,12 @@ root.title("The One-Stop Shop v.1.1")
 # Calculate max service count and set window height
 ROW_HEIGHT = 18
 BASE_HEIGHT = 400  # Adjust as needed for your non-service UI
-MAX_SERVICE_COUNT = get_max_service_count_across_ratesheets()
+MAX_SERVICE_COUNT = DEFAULT_SERVICE_COUNT  # updated once the ratesheet is loaded
 MAIN_WINDOW_HEIGHT = BASE_HEIGHT + (MAX_SERVICE_COUNT * ROW_HEIGHT)
 ACTIVE_SERVICES_FRAME_HEIGHT = MAX_SERVICE_COUNT * ROW_HEIGHT
 root.geometry(f"1200x{MAIN_WINDOW_HEIGHT}")
 
-worksheet_var = ctk.StringVar(value=WorkSheets[0])
+worksheet_var = ctk.StringVar(value="Loading...")
 
 
 # Add this near other variable declarations at the top
@@ -162,10 +190,10 @@ ROW_HEIGHT = 18
 
 def get_service_quantity(service, use_qtc_input=False):
     """Sum all mapped QuoteMe or QTC fields for the given service."""
-    mapping = service_label_mapping.get(service, {})
+    pricing = get_pricing_config().service(service)
     total = 0
     if use_qtc_input:
-        labels = mapping.get("QTC", [])
+        labels = pricing.qtc_labels
         for label in labels:
             entry = qtc_entries.get(label)
             if entry:
@@ -174,7 +202,7 @@ def get_service_quantity(service, use_qtc_input=False):
                 except Exception:
                     pass
     else:
-        labels = mapping.get("QuoteMe", [])
+        labels = pricing.quoteme_labels
         for label in labels:
             entry = quoteMe_entries.get(label)
             if entry:
@@ -185,6 +213,7 @@ def get_service_quantity(service, use_qtc_input=False):
     return total
 
 
+@profiler.profiled()
 def refresh_service_checkboxes():
     for widget in ServicesFrame.winfo_children():
         if isinstance(widget, ctk.CTkCheckBox):
@@ -195,12 +224,15 @@ def refresh_service_checkboxes():
         chk = ctk.CTkCheckBox(ServicesFrame, text=service, variable=var, height=ROW_HEIGHT-5)
         chk.grid(row=i, column=0, padx=5, pady=PADY_ITEM, sticky="w")
         checkbox_state[service] = var
-        var.trace_add("write", lambda *args: update_preview())
+        var.trace_add("write", schedule_preview_update)
         
     ServicesFrame.configure(height=ACTIVE_SERVICES_FRAME_HEIGHT)
     PreviewFrame.configure(height=ACTIVE_SERVICES_FRAME_HEIGHT)
+@profiler.profiled()
 def on_worksheet_change(*args):
     global CurrentWS, workflows
+    if not ratesheet_loaded:
+        return
     CurrentWS = worksheet_var.get()
     workflows = workflow_manager.get_workflows_for_account(CurrentWS)
     if lp_manager.get_count() > 0:
@@ -211,7 +243,7 @@ def on_worksheet_change(*args):
     refresh_service_checkboxes()
     populate_languages()
     populate_workflows()
-    update_preview()
+    schedule_preview_update()
 
 worksheet_var.trace_add("write", on_worksheet_change)
 
@@ -223,15 +255,22 @@ Headers = [
 ]
 
 def read_ratesheet():
-    ratesheet_path = get_excel_path()
-    if os.path.exists(ratesheet_path):
-        df = pd.read_excel(ratesheet_path)
-        return df
-    else:
+    """Get the current account's worksheet from the loaded ratesheet model."""
+    if ratesheet_model is None or CurrentWS not in ratesheet_model.ratesheets:
         messagebox.showerror("File Not Found", "Ratesheet file not found.")
         return None
+    return ratesheet_model.ratesheets[CurrentWS]
 
 Languages = []
+# Search index over Languages, rebuilt by populate_languages
+language_index = LanguageIndex(Languages)
+
+def search_values(typed_text, values):
+    """Filter values by typed text, using the language index for the language list"""
+    if values is Languages:
+        return language_index.search(typed_text)
+    typed_text = typed_text.casefold()
+    return [value for value in values if typed_text in value.casefold()]
 workflow_file = os.path.join(current_directory, "workflows.json")
 Services_UofM = {}
 ServiceGroup1 = {}
@@ -240,31 +279,21 @@ ServiceGroup2 = {}
 
 
 
+@profiler.profiled()
 def populate_services_and_uom():
     global Services, Services_UofM, ServiceGroup1, ServiceGroup2
     try:
-        df_services = pd.read_excel(get_excel_path(), sheet_name="Services per account")
-        df_uofm = pd.read_excel(get_excel_path(), sheet_name="UofM")
         Services.clear()
         Services_UofM.clear()
         ServiceGroup1.clear()
         ServiceGroup2.clear()
         account_name = CurrentWS.replace('S ', '')
-        if account_name in df_services.columns:
-            account_services = df_services[df_services[account_name].notna()][account_name].tolist()
+        account_services = ratesheet_model.services(CurrentWS)
+        if account_services is not None:
             Services.extend(account_services)
-            for _, row in df_uofm.iterrows():
-                service = str(row.get("Service name", "")).strip()
-                if service:
-                    uom = str(row.get("UofM", "")).strip()
-                    group1 = str(row.get("Service Group 1", "")).strip()
-                    group2 = str(row.get("Service Group 2", "")).strip()
-                    if uom:
-                        Services_UofM[service] = uom
-                    if group1:
-                        ServiceGroup1[service] = group1
-                    if group2:
-                        ServiceGroup2[service] = group2
+            Services_UofM.update(ratesheet_model.services_uofm)
+            ServiceGroup1.update(ratesheet_model.service_group1)
+            ServiceGroup2.update(ratesheet_model.service_group2)
         else:
             messagebox.showerror("Error", f"Account '{account_name}' not found in Services per account sheet")
     except KeyError as e:
@@ -272,8 +301,6 @@ def populate_services_and_uom():
     except Exception as e:
         messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
-populate_services_and_uom()
-
 # Use workflow_manager instead of direct file operations
 workflows = workflow_manager.get_workflows_for_account(CurrentWS)
 
@@ -304,7 +331,7 @@ pa_entity_dropdown.grid(row=0, column=1, padx=5, pady=PADY_ITEM, sticky="ew")
 
 # Add Rate Sheet dropdown next to PA Entity
 ctk.CTkLabel(header_frame, text="Rate Sheet:", font=FONT).grid(row=1, column=0, padx=5, pady=PADY_LABEL, sticky="w")
-worksheet_dropdown = ctk.CTkOptionMenu(header_frame, variable=worksheet_var, values=WorkSheets)
+worksheet_dropdown = ctk.CTkOptionMenu(header_frame, variable=worksheet_var, values=["Loading..."], state="disabled")
 worksheet_dropdown.grid(row=1, column=1, padx=5, pady=PADY_ITEM, sticky="ew")
 
 # Add File Type dropdown (Live/Dead)
@@ -325,12 +352,10 @@ for i, service in enumerate(Services, start=3):  # Start from row 3 instead of 1
     chk = ctk.CTkCheckBox(ServicesFrame, text=service, variable=var, height=ROW_HEIGHT-5)
     chk.grid(row=i, column=0, padx=5, pady=PADY_ITEM, sticky="w")
     checkbox_state[service] = var
-    var.trace_add("write", lambda *args: update_preview())
+    var.trace_add("write", schedule_preview_update)
 
 worksheet_var.trace_add("write", on_worksheet_change)
 
-populate_services_and_uom()
-
 
 
 # --- CONTAINER FRAME 1 ---
@@ -361,33 +386,30 @@ save_workflow_button = ctk.CTkButton(
 save_workflow_button.pack(pady=PADY_ITEM)
 
 def on_workflow_select(event):
-    global suspend_preview_update
     if not WFlistbox.curselection():
         return
     selected_workflow = WFlistbox.get(WFlistbox.curselection())
     services = workflows.get(selected_workflow, [])
-    suspend_preview_update = True
-    for var in checkbox_state.values():
-        var.set(False)
-    for service in services:
-        if service in checkbox_state:
-            checkbox_state[service].set(True)
+    # One preview update for the whole selection change
+    with preview_batch():
+        for var in checkbox_state.values():
+            var.set(False)
+        for service in services:
+            if service in checkbox_state:
+                checkbox_state[service].set(True)
     # --- Add this line to auto-fill the workflow name entry ---
     new_workflow_entry.delete(0, "end")
     new_workflow_entry.insert(0, selected_workflow)
-    suspend_preview_update = False
-    update_preview()
 
 WFlistbox.bind("<<ListboxSelect>>", on_workflow_select)
-workflows = load_workflows()
 
 
 def get_service_quantity(service, use_qtc_input=False):
     """Sum all mapped QuoteMe or QTC fields for the given service."""
-    mapping = service_label_mapping.get(service, {})
+    pricing = get_pricing_config().service(service)
     total = 0
     if use_qtc_input:
-        labels = mapping.get("QTC", [])
+        labels = pricing.qtc_labels
         for label in labels:
             entry = qtc_entries.get(label)
             if entry:
@@ -396,7 +418,7 @@ def get_service_quantity(service, use_qtc_input=False):
                 except Exception:
                     pass
     else:
-        labels = mapping.get("QuoteMe", [])
+        labels = pricing.quoteme_labels
         for label in labels:
             entry = quoteMe_entries.get(label)
             if entry:
@@ -407,44 +429,6 @@ def get_service_quantity(service, use_qtc_input=False):
     return total
 
 
-def calculate_hourly_quantity(
-    service, file_type, use_qtc_input, quoteme_wc, qtc_wc_translation, qtc_wc_revision, config
-):
-    """
-    Calculate the quantity for an hourly service based on admin config and user input.
-
-    - service: service name (str)
-    - file_type: "Live" or "Dead"
-    - use_qtc_input: bool, True if QTC input is used, False for QuoteMe
-    - quoteme_wc: int/float, total QuoteMe wordcount
-    - qtc_wc_translation: int/float, QTC WC for Translation
-    - qtc_wc_revision: int/float, QTC WC for Revision
-    - config: loaded mapping (dict)
-    """
-    min_hourly_rate = float(config.get("min_hourly_rate", 0.5) or 0.5)
-    increment_rate = float(config.get("increment_rate", 0.25) or 0.25)
-    svc_conf = config.get(service, {})
-    if use_qtc_input:
-        qtc_cfg = svc_conf.get("QTC", {})
-        divider = float(qtc_cfg.get("live_divider" if file_type == "Live" else "dead_divider", 1) or 1)
-        # Use the tickboxes to decide which QTC WC to use
-        if qtc_cfg.get("use_wc_for_translation"):
-            wc = qtc_wc_translation
-        elif qtc_cfg.get("use_wc_for_revision"):
-            wc = qtc_wc_revision
-        else:
-            wc = 0
-    else:
-        quoteme_cfg = svc_conf.get("QuoteMe", {})
-        divider = float(quoteme_cfg.get("live_divider" if file_type == "Live" else "dead_divider", 1) or 1)
-        wc = quoteme_wc
-
-    if divider == 0:
-        return min_hourly_rate
-    hours = wc / divider
-    hours_ceiled = math.ceil(hours / increment_rate) * increment_rate
-    return max(hours_ceiled, min_hourly_rate)
-
 def save_workflow(workflow_name):
     workflow_name = workflow_name.strip()
     if not workflow_name:
@@ -482,7 +466,7 @@ def save_workflow(workflow_name):
         WFlistbox.selection_set(selected_index)
         WFlistbox.activate(selected_index)
         new_workflow_entry.delete(0, "end")
-        update_preview()
+        schedule_preview_update()
         messagebox.showinfo("Workflow Updated", f"Workflow '{workflow_name}' has been updated.")
     else:
         if workflow_manager.workflow_exists(CurrentWS, workflow_name):
@@ -492,9 +476,10 @@ def save_workflow(workflow_name):
         workflows = workflow_manager.get_workflows_for_account(CurrentWS)
         WFlistbox.insert("end", workflow_name)
         new_workflow_entry.delete(0, "end")
-        update_preview()
+        schedule_preview_update()
 
   
+@profiler.profiled()
 def populate_workflows():
     WFlistbox.delete(0, "end")  # Clear existing items
     for workflow_name in workflows.keys():
@@ -520,6 +505,15 @@ preview_grid.grid_columnconfigure(2, weight=1)
 preview_grid.configure(height=ACTIVE_SERVICES_FRAME_HEIGHT)
 preview_quantities = {}
 last_preview_services = []
+# Row widgets of the preview grid, kept between updates: service -> [row, name label, quantity entry, UofM label]
+preview_rows = {}
+# Latency of update_preview, in ms
+preview_stats = {"updates": 0, "recomputed": 0, "slow": 0, "last_ms": 0.0, "max_ms": 0.0, "total_ms": 0.0}
+# Last computed quantity per selected service, and the graph of which inputs feed them
+preview_values = {}
+preview_graph = None
+preview_graph_key = None
+PREVIEW_SLOW_MS = 50  # Updates slower than this are counted in preview_stats["slow"]
 
 def create_preview_header():
     """Create the header row for the preview grid"""
@@ -550,77 +544,144 @@ def get_qtc_value(key):
             return 0
     return 0
 
-def update_preview(*args):
-    """Update the Active Service Preview (ASP) grid"""
-    global suspend_preview_update
-    if suspend_preview_update:
-        return
+def compute_preview_quantity(service):
+    """Compute the preview quantity of one service from the current inputs"""
+    UofM = Services_UofM.get(service, "")
+    service_type = get_service_type(service, UofM)
+
+    if service_type == "hType":
+        # Hourly service: use the new calculation
+        from Core.rate_calculations import calculate_hourly_quantity
+        return calculate_hourly_quantity(
+            service,
+            file_type_var.get(),
+            use_qtc_input,
+            get_quoteMe_value("Total Words:"),
+            get_qtc_value("TC WC for TRANSLATION:"),
+            get_qtc_value("TC WC for REVISION:"),
+            get_pricing_config()
+        )
+    # Word-based or other: use the old logic
+    return get_service_quantity(service, use_qtc_input)
+
+@profiler.profiled()
+def update_preview(*args, changed_labels=None):
+    """
+    Update the Active Service Preview (ASP) grid.
 
+    When only some QuoteMe/QTC inputs changed (changed_labels), only the
+    services that depend on them are recomputed.
+    """
+    global preview_graph, preview_graph_key
+    start = time.perf_counter()
     selected_services = [svc for svc, var in checkbox_state.items() if var.get()]
 
-    # Update word counts based on active input source
-    if use_qtc_input:
-        translation_value = get_qtc_value("TC WC for TRANSLATION:")
-        revision_value = get_qtc_value("TC WC for REVISION:")  # Get revision value for QTC
-        word_counts = {
-            "new_words": translation_value,
-            "tm_exact": 0,
-            "tm_fuzzy": 0,
-            "revision_words": revision_value  # Add revision words to word_counts
-        }
-    else:
-        translation_value = get_quoteMe_value("New Words:")
-        word_counts = {
-            "new_words": translation_value,
-            "tm_exact": get_quoteMe_value("Context:") + get_quoteMe_value("100%:"),
-            "tm_fuzzy": get_quoteMe_value("Repetitions:") + get_quoteMe_value("Fuzzy Matches:"),
-            "revision_words": 0
-        }
-
-    # Clear the preview grid (except the header row)
-    for widget in preview_grid.winfo_children():
-        if widget.grid_info()["row"] > 0:
+    # Only destroy the rows of services that were deselected
+    for service in [svc for svc in preview_rows if svc not in selected_services]:
+        for widget in preview_rows.pop(service)[1:]:
             widget.destroy()
+        preview_quantities.pop(service, None)
+        preview_values.pop(service, None)
+
+    # The dependency graph changes with the selection, input mode and mapping
+    graph_key = (tuple(selected_services), use_qtc_input, file_type_var.get(), get_pricing_config())
+    if graph_key != preview_graph_key:
+        preview_graph = None
+        if selected_services:
+            from Core.quantity_graph import QuantityGraph
+            preview_graph = QuantityGraph(graph_key[3], selected_services, Services_UofM, use_qtc_input)
+        preview_graph_key = graph_key
+        dirty = selected_services
+    elif changed_labels is None:
+        dirty = selected_services
+    else:
+        dirty = preview_graph.affected(changed_labels) if preview_graph else []
 
-    # Populate the preview grid with selected service
-    for row, service in enumerate(selected_services, start=1):
-        UofM = Services_UofM.get(service, "")
-        service_type = get_service_type(service, UofM)
-
-        if service_type == "hType":
-            # Hourly service: use the new calculation
-            file_type = file_type_var.get()
-            quoteme_wc = get_quoteMe_value("Total Words:")
-            qtc_wc_translation = get_qtc_value("TC WC for TRANSLATION:")
-            qtc_wc_revision = get_qtc_value("TC WC for REVISION:")
-            quantity = calculate_hourly_quantity(
-                service,
-                file_type,
-                use_qtc_input,
-                quoteme_wc,
-                qtc_wc_translation,
-                qtc_wc_revision,
-                service_label_mapping
-            )
-        else:
-            # Word-based or other: use the old logic
-            quantity = get_service_quantity(service, use_qtc_input)
-
-        # Add service name
-        ctk.CTkLabel(preview_grid, text=service, font=FONT).grid(
-            row=row, column=0, padx=5, pady=PADY_ITEM, sticky="w"
-        )
+    for service in dirty:
+        preview_values[service] = compute_preview_quantity(service)
 
-        # Add quantity entry
+    # Update the preview grid in place, creating rows for newly selected services
+    dirty = set(dirty)
+    for row, service in enumerate(selected_services, start=1):
+        if service in dirty or service not in preview_rows:
+            set_preview_row(row, service, str(round(preview_values[service], 2)), Services_UofM.get(service, ""))
+
+    preview_stats["recomputed"] += len(dirty)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    preview_stats["updates"] += 1
+    preview_stats["last_ms"] = elapsed_ms
+    preview_stats["total_ms"] += elapsed_ms
+    preview_stats["max_ms"] = max(preview_stats["max_ms"], elapsed_ms)
+    if elapsed_ms > PREVIEW_SLOW_MS:
+        preview_stats["slow"] += 1
+
+def set_preview_row(row, service, quantity_text, UofM):
+    """Show a service on a preview grid row, reusing its widgets if it already has some"""
+    if service not in preview_rows:
+        name_label = ctk.CTkLabel(preview_grid, text=service, font=FONT)
         quantity_entry = ctk.CTkEntry(preview_grid, width=100)
-        quantity_entry.grid(row=row, column=1, padx=5, pady=PADY_ITEM, sticky="ew")
-        quantity_entry.insert(0, str(round(quantity, 2)))
+        uofm_label = ctk.CTkLabel(preview_grid, text=UofM, font=FONT)
+        preview_rows[service] = [None, name_label, quantity_entry, uofm_label]
         preview_quantities[service] = quantity_entry
 
-        # Add UofM
-        ctk.CTkLabel(preview_grid, text=UofM, font=FONT).grid(
-            row=row, column=2, padx=5, pady=PADY_ITEM, sticky="w"
-        )
+    entry = preview_rows[service]
+    current_row, name_label, quantity_entry, uofm_label = entry
+    if current_row != row:
+        name_label.grid(row=row, column=0, padx=5, pady=PADY_ITEM, sticky="w")
+        quantity_entry.grid(row=row, column=1, padx=5, pady=PADY_ITEM, sticky="ew")
+        uofm_label.grid(row=row, column=2, padx=5, pady=PADY_ITEM, sticky="w")
+        entry[0] = row
+    if quantity_entry.get() != quantity_text:
+        quantity_entry.delete(0, "end")
+        quantity_entry.insert(0, quantity_text)
+    if uofm_label.cget("text") != UofM:
+        uofm_label.configure(text=UofM)
+
+# --- PREVIEW SCHEDULING ---
+# Traces and key bindings only mark the preview dirty; it is recomputed
+# once per idle cycle after PREVIEW_DEBOUNCE_MS without new changes.
+PREVIEW_DEBOUNCE_MS = 30
+preview_job = None
+preview_full_pending = False
+preview_pending_labels = set()
+preview_batch_depth = 0
+
+def schedule_preview_update(*args, changed_labels=None):
+    """Mark the preview dirty (only changed_labels if given) and schedule one update"""
+    global preview_job, preview_full_pending
+    if changed_labels is None:
+        preview_full_pending = True
+    else:
+        preview_pending_labels.update(changed_labels)
+    if preview_batch_depth:
+        return
+    if preview_job is not None:
+        root.after_cancel(preview_job)
+    preview_job = root.after(PREVIEW_DEBOUNCE_MS, lambda: root.after_idle(flush_preview_update))
+
+def flush_preview_update():
+    """Run the pending preview update"""
+    global preview_job, preview_full_pending
+    preview_job = None
+    if preview_batch_depth:
+        return
+    changed_labels = None if preview_full_pending else set(preview_pending_labels)
+    preview_full_pending = False
+    preview_pending_labels.clear()
+    if changed_labels is None or changed_labels:
+        update_preview(changed_labels=changed_labels)
+
+@contextmanager
+def preview_batch():
+    """Suppress preview updates during a bulk change; one update runs afterwards"""
+    global preview_batch_depth
+    preview_batch_depth += 1
+    try:
+        yield
+    finally:
+        preview_batch_depth -= 1
+        if not preview_batch_depth and (preview_full_pending or preview_pending_labels):
+            schedule_preview_update(changed_labels=())
 
 # --- Bindings for Workflow and Services ---
 # Input for hourly divider
@@ -647,8 +708,7 @@ def perform_filter(typed_text, combobox, values):
     if typed_text == "":
         combobox["values"] = values  # Reset to full list if no input
     else:
-        filtered_values = [value for value in values if typed_text.lower() in value.lower()]
-        combobox["values"] = filtered_values  # Update dropdown with filtered values
+        combobox["values"] = search_values(typed_text, values)  # Update dropdown with filtered values
     combobox.event_generate("<Down>")  # Open the dropdown to show suggestions
 
 # === REPLACE ContainerFrame section with this updated code ===
@@ -768,7 +828,7 @@ for i, field in enumerate(qtc):
 # Update the switch_input_mode function to handle visibility
 def switch_input_mode():
     """Switch between QuoteMe and QTC input modes"""
-    global use_qtc_input, suspend_preview_update
+    global use_qtc_input
     
     if toggle_var.get():  # Switching to QTC
         if not use_qtc_input:  # Only if not already in QTC mode
@@ -779,7 +839,6 @@ def switch_input_mode():
                     toggle_var.set(False)  # Revert switch if user cancels
                     return
                 
-            suspend_preview_update = True
             # Hide QuoteMe and show QTC
             QuoteMeFrame.grid_remove()
             QtcFrame.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
@@ -795,8 +854,7 @@ def switch_input_mode():
                 entry.configure(state="normal")
             
             use_qtc_input = True
-            suspend_preview_update = False
-            update_preview()
+            schedule_preview_update()
     else:  # Switching to QuoteMe
         if use_qtc_input:  # Only if not already in QuoteMe mode
             qtc_values = sum(get_qtc_value(key) for key in qtc_entries.keys())
@@ -806,7 +864,6 @@ def switch_input_mode():
                     toggle_var.set(True)  # Revert switch if user cancels
                     return
             
-            suspend_preview_update = True
             # Hide QTC and show QuoteMe
             QtcFrame.grid_remove()
             QuoteMeFrame.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
@@ -822,8 +879,7 @@ def switch_input_mode():
                     entry.configure(state="normal")
             
             use_qtc_input = False
-            suspend_preview_update = False
-            update_preview()
+            schedule_preview_update()
 
 # --- Language Frame ---
 LanguageFrame = ctk.CTkFrame(ContainerFrame)
@@ -870,8 +926,7 @@ def filter_combobox_debounced(event, combobox, values, key):
         if not typed:
             combobox['values'] = values
         else:
-            filtered = [v for v in values if typed.lower() in v.lower()]
-            combobox['values'] = filtered
+            combobox['values'] = search_values(typed, values)
         combobox.event_generate('<Down>')
     typeahead_after_ids[key] = combobox.after(150, do_filter)
 
@@ -885,15 +940,12 @@ target_language_dropdown.bind(
 )
 def refresh_lp_listbox():
     """Refresh the Listbox with numbered LPs without triggering preview updates."""
-    global suspend_preview_update
-    suspend_preview_update = True  # Temporarily suspend preview updates
     LPListbox.delete(0, "end")  # Clear the Listbox
     for lp_str in lp_manager.get_numbered_list():
         LPListbox.insert("end", lp_str)
     # Also update legacy LPs list for compatibility
     global LPs
     LPs = lp_manager.get_all_language_pairs()
-    suspend_preview_update = False  # Resume preview updates
 
 def save_lp():
     """Save the selected language pair (LP) without resetting ASP values."""
@@ -911,25 +963,26 @@ def save_lp():
 
 # Now create the Save LP button
 save_lp_button = ctk.CTkButton(
-    LanguageFrame, text="Save LP", command=save_lp, width=160
+    LanguageFrame, text="Save LP", command=save_lp, width=160, state="disabled"
 )
 save_lp_button.grid(row=4, column=0, pady=PADY_ITEM, sticky="ew")
 
 def clean_all():
-    # Clear Language Pairs
-    lp_manager.clear_all()
-    refresh_lp_listbox()
-    # Clear QuoteMe wordcount entries
-    for key, entry in quoteMe_entries.items():
-        entry.configure(state="normal")
-        entry.delete(0, "end")
-        entry.insert(0, "0")
-    update_total_words()
-    # Clear QTC wordcount entries
-    for entry in qtc_entries.values():
-        entry.delete(0, "end")
-        entry.insert(0, "0")
-    update_preview()
+    with preview_batch():
+        # Clear Language Pairs
+        lp_manager.clear_all()
+        refresh_lp_listbox()
+        # Clear QuoteMe wordcount entries
+        for key, entry in quoteMe_entries.items():
+            entry.configure(state="normal")
+            entry.delete(0, "end")
+            entry.insert(0, "0")
+        update_total_words()
+        # Clear QTC wordcount entries
+        for entry in qtc_entries.values():
+            entry.delete(0, "end")
+            entry.insert(0, "0")
+        schedule_preview_update()
 
 # Add the button below Save LP in LanguageFrame
 clean_all_button = ctk.CTkButton(
@@ -1034,6 +1087,7 @@ def calculate_quantity(service_type, service, word_counts, hourly_divider):
 
 def get_word_rate(df_s_iqvia, source_lang, target_lang, service):
     """Get word-based rate from S IQVIA worksheet"""
+    import pandas as pd
     # Map plural service names to singular column names if needed
     service_column_map = {
         "TM - Fuzzy Matches": "TM - Fuzzy Match",
@@ -1057,6 +1111,7 @@ def get_word_rate(df_s_iqvia, source_lang, target_lang, service):
 
 def get_hourly_rate(df_s_iqvia, service):
     """Get hourly rate from S IQVIA worksheet first row"""
+    import pandas as pd
     try:
         # Get the rate from the first row of the service column
         if service in df_s_iqvia.columns:
@@ -1083,299 +1138,167 @@ def sanitize_csv_value(val):
         return ""
     return str(val)
 
+def build_quote_request():
+    """Collect the current UI state into a QuoteRequest."""
+    from Core.quote_engine import PERCENTAGE_SERVICES, QuoteRequest
+    word_counts = {key: get_quoteMe_value(key) for key in quoteMe_entries}
+    word_counts.update({key: get_qtc_value(key) for key in qtc_entries})
+    try:
+        hourly_divider = HourlyDivider.get()
+    except:
+        hourly_divider = 1000
+    return QuoteRequest(
+        account=CurrentWS,
+        lps=list(LPs),
+        services=[svc for svc, var in checkbox_state.items() if var.get()],
+        word_counts=word_counts,
+        use_qtc_input=use_qtc_input,
+        file_type=file_type_var.get(),
+        min_fee=MinFeeRate.get() if isinstance(MinFeeRate, IntVar) else MinFeeRate,
+        hourly_divider=hourly_divider,
+        percentages={svc: get_preview_quantity(svc) for svc in PERCENTAGE_SERVICES}
+    )
+
+
+@profiler.profiled()
 def save_charges_csv():
-    # Get the count of saved Language Pairs (LPs)
-    lp_count = len(LPs)
-    if lp_count == 0:
+    request = build_quote_request()
+    if not request.lps:
         messagebox.showwarning("No Language Pairs", "Please save at least one Language Pair before saving charges.")
         return
-
-    # Get selected services
-    selected_services = [svc for svc, var in checkbox_state.items() if var.get()]
-    if not selected_services:
+    if not request.services:
         messagebox.showwarning("No Services Selected", "Please select at least one service before saving charges.")
         return
 
-    # Get values directly using the global function
-    context_value = get_quoteMe_value("Context:")
-    hundred_percent_value = get_quoteMe_value("100%:")
-    repetitions_value = get_quoteMe_value("Repetitions:")
-    fuzzy_matches_value = get_quoteMe_value("Fuzzy Matches:")
-    new_words_value = get_quoteMe_value("New Words:")
-
-    # Calculate sums for TM services
-    word_counts = {
-        "new_words": new_words_value,
-        "tm_exact": context_value + hundred_percent_value,
-        "tm_fuzzy": repetitions_value + fuzzy_matches_value
-    }
-
-    # Create a DataFrame with headers and duplicated services for each LP
-    rows = []
+    if export_job["thread"] is not None:
+        messagebox.showwarning("Export Running", "Charges are already being exported.")
+        return
 
-    # Read the S IQVIA worksheet for rates
+    # Rates come from the loaded ratesheet model; the request and the model
+    # are snapshots, so the worker never reads widgets or a reloaded model
+    engine = ratesheet_model.engine
     try:
-        df_s_iqvia = pd.read_excel(
-            get_excel_path(), 
-            sheet_name=CurrentWS
-        )
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to read rates from ratesheet: {e}")
+        engine.validate(request)
+    except ValueError as e:
+        messagebox.showerror("Error", str(e))
+        return
+
+    # Rows are streamed to the file while they are priced, so ask for it first
+    from Core.charges_writer import CHARGES_FILETYPES
+    file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=CHARGES_FILETYPES)
+    if not file_path:
         return
 
-    # Prepare quantities and rates for all services
+    cancel = threading.Event()
+    results = queue.Queue()
+    export_job.update(thread=threading.Thread(
+        target=export_worker, args=(engine, request, file_path, cancel, results), name="charges-export", daemon=True
+    ), cancel=cancel)
+    save_charges_button.configure(state="disabled")
+    startup_progress.set(0)
+    startup_progress.grid()
+    export_cancel_button.grid()
+    startup_status_label.configure(text=f"Pricing {len(request.lps)} language pairs...")
+    export_job["thread"].start()
+    poll_export(results)
+
+# Export worker state: the running thread and its cancel flag
+export_job = {"thread": None, "cancel": None}
+
+@profiler.profiled()
+def export_worker(engine, request, file_path, cancel, results):
+    """Worker thread: price the request chunk by chunk and stream each chunk to file_path"""
+    from Core.charges_writer import open_charges_writer
     try:
-        hourly_divider = HourlyDivider.get()
-        if hourly_divider <= 0:
-            messagebox.showerror("Error", "Hourly divider must be greater than zero.")
-            return
-    except:
-        hourly_divider = 1000
+        fallback_lps, done = [], 0
+        with open_charges_writer(file_path) as writer:
+            for quote in engine.quote_chunks(request):
+                if cancel.is_set():
+                    writer.discard()
+                    results.put(("cancelled",))
+                    return
+                writer.write(quote.charges)
+                fallback_lps.extend(quote.fallback_lps)
+                done += len(quote.request.lps)
+                results.put(("progress", done / len(request.lps)))
+        results.put(("done", fallback_lps))
+    except ValueError as e:
+        results.put(("error", str(e)))
+    except Exception as e:
+        results.put(("error", f"Failed to export charges: {e}"))
 
-    # Determine which service to use for each LP
-    use_machine_translation = "Machine Translation" in selected_services
-    use_translation = "Translation" in selected_services
+def cancel_export():
+    if export_job["cancel"] is not None:
+        export_job["cancel"].set()
+        startup_status_label.configure(text="Cancelling export...")
 
-    # If both are checked, treat as Machine Translation only
-    if use_machine_translation:
-        effective_services = [svc for svc in selected_services if svc != "Translation"]
-    else:
-        effective_services = selected_services[:]
-
-    # Track LPs that will fallback to Translation
-    fallback_lps = []
-
-    for lp in LPs:
-        source_language = lp.split(" into ")[0]
-        target_language = lp.split(" into ")[1]
-
-        # Determine which service to use for this LP
-        services_for_lp = []
-        if use_machine_translation:
-            # Check if Machine Translation rate exists for this LP
-            mt_rate = get_word_rate(df_s_iqvia, source_language, target_language, "Machine Translation")
-            if mt_rate and mt_rate > 0:
-                services_for_lp = [svc for svc in effective_services if svc != "Translation"]  # Use MT, remove Translation
-                # Insert Machine Translation at the correct position if needed
-                if "Machine Translation" not in services_for_lp:
-                    services_for_lp.insert(0, "Machine Translation")
-            else:
-                # Fallback to Translation for this LP
-                fallback_lps.append(lp)
-                services_for_lp = [svc for svc in effective_services if svc != "Machine Translation"]
-                if "Translation" not in services_for_lp:
-                    services_for_lp.insert(0, "Translation")
-        elif use_translation:
-            services_for_lp = [svc for svc in effective_services if svc != "Machine Translation"]
-            if "Translation" not in services_for_lp:
-                services_for_lp.insert(0, "Translation")
-        else:
-            # Neither service is selected, skip both
-            services_for_lp = [svc for svc in effective_services if svc not in ["Translation", "Machine Translation"]]
-
-        # Prepare quantities and rates for all services for this LP
-        quantities = []
-        rates = []
-        for service in services_for_lp:
-            UofM = Services_UofM.get(service, "")
-            service_type = get_service_type(service, UofM)
-            if service_type == "hType":
-                file_type = file_type_var.get()
-                quoteme_wc = get_quoteMe_value("Total Words:")
-                qtc_wc_translation = get_qtc_value("TC WC for TRANSLATION:")
-                qtc_wc_revision = get_qtc_value("TC WC for REVISION:")
-                quantity = calculate_hourly_quantity(
-                    service,
-                    file_type,
-                    use_qtc_input,
-                    quoteme_wc,
-                    qtc_wc_translation,
-                    qtc_wc_revision,
-                    service_label_mapping
-                )
-            else:
-                quantity = get_service_quantity(service, use_qtc_input)
-            quantities.append(quantity)
-
-            # Get rate based on service type
-            rate = 0
-            if service_type == "wcType":
-                rate = get_word_rate(df_s_iqvia, source_language, target_language, service)
-            elif service_type == "hType":
-                rate = get_hourly_rate(df_s_iqvia, service)
-            rates.append(rate)
-
-        # First pass: build all row data, but leave Project Management and Rush Premium rates as None
-        row_data = []
-        for i, service in enumerate(services_for_lp):
-            UofM = Services_UofM.get(service, "")
-            service_type = get_service_type(service, UofM)
-            group1 = ServiceGroup1.get(service, "")
-            group2 = ServiceGroup2.get(service, "")
-
-            if pd.isna(group1) or group1 is None:
-                group1 = ""
-            if pd.isna(group2) or group2 is None:
-                group2 = ""
-
-            if service == "Project Management":
-                quantity = get_preview_quantity(service)
-                quantity_csv = float(quantity) / 100
-                rate = None  # To be filled in second pass
-                quantity_out = quantity_csv
-            elif service == "Rush Premium":
-                quantity = get_preview_quantity(service)
-                quantity_csv = float(quantity) / 100
-                rate = None  # To be filled in second pass
-                quantity_out = quantity_csv
+def poll_export(results):
+    """Apply export progress on the Tk thread and finish the export when the worker is done"""
+    try:
+        while True:
+            kind, *payload = results.get_nowait()
+            if kind == "progress":
+                startup_progress.set(payload[0])
+                continue
+            export_job.update(thread=None, cancel=None)
+            save_charges_button.configure(state="normal")
+            startup_progress.grid_remove()
+            export_cancel_button.grid_remove()
+            if kind == "done":
+                startup_status_label.configure(text="Charges saved")
+                finish_export(payload[0])
+            elif kind == "cancelled":
+                startup_status_label.configure(text="Export cancelled")
             else:
-                quantity_out = quantities[i]
-                rate = rates[i]
-
-            row_data.append({
-                "service": service,
-                "UofM": UofM,
-                "group1": group1,
-                "group2": group2,
-                "quantity": quantity_out,
-                "rate": rate,
-                "orig_quantity": quantities[i] if i < len(quantities) else 0,
-                "orig_rate": rates[i] if i < len(rates) else 0,
-            })
-
-        # --- Apply Min Fee logic before calculating Project Management and Rush Premium ---
-        # Find sumproduct for Word services except Back Translation
-        word_sumproduct = sum(
-            float(row["quantity"]) * float(row["rate"])
-            for row in row_data
-            if Services_UofM.get(row["service"], "") == "Word" and row["service"] != "Back Translation"
-        )
-        min_fee = MinFeeRate.get() if isinstance(MinFeeRate, IntVar) else MinFeeRate
-
-        if word_sumproduct < min_fee:
-            for row in row_data:
-                if row["service"] in ["Translation", "Machine Translation"]:
-                    row["UofM"] = "Minimum"
-                    row["quantity"] = 1
-                    row["rate"] = min_fee
-                elif Services_UofM.get(row["service"], "") == "Word" and row["service"] != "Back Translation":
-                    row["quantity"] = 0
-
-        # Back Translation min fee logic
-        bt_row = next((row for row in row_data if row["service"] == "Back Translation"), None)
-        if bt_row:
-            bt_sum = float(bt_row["quantity"]) * float(bt_row["rate"])
-            if bt_sum < min_fee:
-                bt_row["UofM"] = "Minimum"
-                bt_row["quantity"] = 1
-                bt_row["rate"] = min_fee
-
-        # --- Now calculate Project Management and Rush Premium rates using updated row_data ---
-        for i, row in enumerate(row_data):
-            if row["service"] == "Project Management":
-                # Project Management rate: sum of all services above (excluding itself)
-                total_value = 0
-                for j in range(i):
-                    total_value += float(row_data[j]["quantity"]) * float(row_data[j]["rate"])
-                row["rate"] = round(total_value, 6)
-            elif row["service"] == "Rush Premium":
-                # Rush Premium rate: sum of all services above (including Project Management and itself)
-                total_value = 0
-                for j in range(i + 1):
-                    q = float(row_data[j]["quantity"])
-                    r = float(row_data[j]["rate"]) if row_data[j]["rate"] is not None else 0
-                    total_value += q * r
-                row["rate"] = round(total_value, 6)
-
-        # Now write rows to CSV
-        for row in row_data:
-            rows.append({
-                Headers[0]: sanitize_csv_value("x" if len(rows) % len(services_for_lp) == 0 else ""),
-                Headers[1]: sanitize_csv_value(f"{source_language} into {target_language}"),
-                Headers[2]: sanitize_csv_value(source_language),
-                Headers[3]: sanitize_csv_value(target_language),
-                Headers[4]: sanitize_csv_value(0),
-                Headers[5]: sanitize_csv_value(0),
-                Headers[6]: sanitize_csv_value(row["group1"]),
-                Headers[7]: sanitize_csv_value(row["group2"]),
-                Headers[9]: sanitize_csv_value(row["service"]),
-                Headers[10]: sanitize_csv_value(row["UofM"]),
-                Headers[11]: sanitize_csv_value(row["quantity"]),
-                Headers[12]: sanitize_csv_value(row["rate"]),
-            })
+                startup_status_label.configure(text="Export failed")
+                messagebox.showerror("Error", payload[0])
+            return
+    except queue.Empty:
+        pass
+    root.after(50, poll_export, results)
 
+def finish_export(fallback_lps):
+    """Show the fallback notice once the charges are saved (Tk thread)"""
     # Notify user if any LPs fell back to Translation
     if fallback_lps:
         messagebox.showinfo(
             "Machine Translation Fallback",
-            "The following Language Pairs do not have a Machine Translation rate and will use Translation instead:\n\n" +
+            "The following Language Pairs do not have a Machine Translation rate and used Translation instead:\n\n" +
             "\n".join(fallback_lps)
         )
+    messagebox.showinfo("Success", "Charges saved successfully!")
 
-    # Create DataFrame directly from rows
-    df = pd.DataFrame(rows, columns=Headers)
-
-    # Replace NaN values with empty strings
-    df = df.fillna('')
-    df.replace(to_replace=[float('nan'), 'nan', None], value='', inplace=True)
-
-    # --- Calculate sumproduct for Word services except Back Translation, per LP ---
-    df["Quantity"] = pd.to_numeric(df["Quantity"], errors="coerce").fillna(0)
-    df["Rate"] = pd.to_numeric(df["Rate"], errors="coerce").fillna(0)
-    min_fee = MinFeeRate.get() if isinstance(MinFeeRate, IntVar) else MinFeeRate
-
-    for lp in df["Line Item Description"].unique():
-        lp_mask = df["Line Item Description"] == lp
-        # Calculate sumproduct for this LP (excluding Back Translation)
-        lp_word_mask = lp_mask & (df["UofM"] == "Word") & (df["Service"] != "Back Translation")
-        lp_bt_mask = lp_mask & (df["UofM"] == "Word") & (df["Service"] == "Back Translation")
-        lp_sumproduct = (df.loc[lp_word_mask, "Quantity"] * df.loc[lp_word_mask, "Rate"]).sum()
-        lp_bt_sum = (df.loc[lp_bt_mask, "Quantity"] * df.loc[lp_bt_mask, "Rate"]).sum()
-
-        # Append sumproduct to CommentsForInvoice for this LP's Word services (except Back Translation)
-        #df.loc[lp_word_mask, "CommentsForInvoice"] = f"Sumproduct: {lp_sumproduct:.3f}"
-
-        # For Back Translation, append its own sumproduct (row-wise)
-        '''for idx in df[lp_bt_mask].index:
-            bt_sum = df.at[idx, "Quantity"] * df.at[idx, "Rate"]
-            df.at[idx, "CommentsForInvoice"] = f"Sumproduct: {bt_sum:.3f}" '''
-
-        # --- Enforce Min Fee Logic per LP ---
-        if lp_sumproduct < min_fee:
-            for svc in ["Translation", "Machine Translation"]:
-                svc_mask = lp_mask & (df["Service"] == svc)
-                if svc_mask.any():
-                    df.loc[svc_mask, "UofM"] = "Minimum"
-                    df.loc[svc_mask, "Quantity"] = 1
-                    df.loc[svc_mask, "Rate"] = min_fee
-            # Set other Word services (except Back Translation) quantity to 0
-            other_word_mask = lp_word_mask & ~df["Service"].isin(["Translation", "Machine Translation"])
-            df.loc[other_word_mask, "Quantity"] = 0
-        # Back Translation min fee logic
-        if bt_sum < min_fee:
-            bt_mask = lp_mask & (df["Service"] == "Back Translation")
-            if bt_mask.any():
-                df.loc[bt_mask, "UofM"] = "Minimum"
-                df.loc[bt_mask, "Quantity"] = 1
-                df.loc[bt_mask, "Rate"] = min_fee
-
-
-            # Set other Word services (except Back Translation) quantity to 0
-            other_word_mask = lp_word_mask & ~df["Service"].isin(["Translation", "Machine Translation"])
-            df.loc[other_word_mask, "Quantity"] = 0
-        # Back Translation min fee logic
-        if bt_sum < min_fee:
-            bt_mask = lp_mask & (df["Service"] == "Back Translation")
-            if bt_mask.any():
-                df.loc[bt_mask, "UofM"] = "Minimum"
-                df.loc[bt_mask, "Quantity"] = 1
-                df.loc[bt_mask, "Rate"] = min_fee
-
-    # Save to CSV with explicit UTF-8 encoding and no BOM
-    file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
-    if file_path:
-        df.to_csv(file_path, index=False, encoding='utf-8-sig')
-        messagebox.showinfo("Success", "Charges saved successfully!")
+def compare_accounts_window():
+    """Price the current job against every "S " worksheet and show the ranking."""
+    request = build_quote_request()
+    if not request.lps:
+        messagebox.showwarning("No Language Pairs", "Please save at least one Language Pair before comparing accounts.")
+        return
+    if not request.services:
+        messagebox.showwarning("No Services Selected", "Please select at least one service before comparing accounts.")
+        return
+
+    from Core.account_comparison import compare_accounts
+    try:
+        table = compare_accounts(ratesheet_model.engine, request)
+    except ValueError as e:
+        messagebox.showerror("Error", str(e))
+        return
+
+    window = ctk.CTkToplevel(root)
+    window.title("Compare Accounts")
+    textbox = ctk.CTkTextbox(window, width=720, height=240, font=("Consolas", 12))
+    textbox.insert("1.0", table.to_string(index=False))
+    textbox.configure(state="disabled")
+    textbox.pack(padx=10, pady=10, fill="both", expand=True)
+
+    def save_comparison():
+        file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
+        if file_path:
+            table.to_csv(file_path, index=False, encoding='utf-8-sig')
+
+    ctk.CTkButton(window, text="Save CSV", command=save_comparison, width=160).pack(pady=PADY_ITEM)
+    window.lift()
 
 # Add "Delete Workflow" button
 def delete_workflow():
@@ -1401,10 +1324,128 @@ save_charges_button = ctk.CTkButton(
     PreviewFrame, 
     text="Save Charges CSV", 
     command=save_charges_csv, 
-    width=200  # Adjust width as needed
+    width=200,  # Adjust width as needed
+    state="disabled"  # enabled once the ratesheet is loaded
 )
 save_charges_button.grid(row=2, column=0, columnspan=3, pady=10, sticky="ew")  # Place at the bottom of the ASP frame
 
+compare_accounts_button = ctk.CTkButton(
+    PreviewFrame,
+    text="Compare Accounts",
+    command=compare_accounts_window,
+    width=200,
+    state="disabled"
+)
+compare_accounts_button.grid(row=3, column=0, columnspan=3, pady=(0, 10), sticky="ew")
+
+def snapshot_session():
+    """Collect the current quote into a QuoteSession."""
+    from Core.quote_session import QuoteSession
+    try:
+        hourly_divider = HourlyDivider.get()
+    except:
+        hourly_divider = 1000
+    return QuoteSession(
+        account=CurrentWS,
+        lps=lp_manager.get_all_language_pairs(),
+        services=[svc for svc, var in checkbox_state.items() if var.get()],
+        quoteme={key: get_quoteMe_value(key) for key in quoteMe_entries if key != "Total Words:"},
+        qtc={key: get_qtc_value(key) for key in qtc_entries},
+        use_qtc_input=use_qtc_input,
+        file_type=file_type_var.get(),
+        min_fee=MinFeeRate.get(),
+        hourly_divider=hourly_divider,
+        pa_entity=pa_entity_var.get(),
+    )
+
+@profiler.profiled()
+def restore_session(session):
+    """Apply a QuoteSession to the UI with a single preview update at the end."""
+    global use_qtc_input
+    if session.account not in WorkSheets:
+        raise ValueError(f"Account '{session.account}' is not in the ratesheet.")
+    with preview_batch():
+        # Clearing the LPs first keeps the worksheet change from prompting
+        lp_manager.clear_all()
+        if session.account != CurrentWS:
+            worksheet_var.set(session.account)
+
+        # Values are replaced below, so switch modes without the clear prompt
+        use_qtc_input = not session.use_qtc_input
+        toggle_var.set(session.use_qtc_input)
+        for entry in list(quoteMe_entries.values()) + list(qtc_entries.values()):
+            entry.configure(state="normal")
+            entry.delete(0, "end")
+            entry.insert(0, "0")
+        switch_input_mode()
+        for entries, values in ((quoteMe_entries, session.quoteme), (qtc_entries, session.qtc)):
+            for key, value in values.items():
+                if key in entries and key != "Total Words:":
+                    entries[key].delete(0, "end")
+                    entries[key].insert(0, str(value))
+        update_total_words()
+
+        file_type_var.set(session.file_type)
+        HourlyDivider.set(session.hourly_divider)
+        MinFeeRate.set(session.min_fee)
+        if session.pa_entity in pa_entities:
+            pa_entity_var.set(session.pa_entity)
+
+        selected = set(session.services)
+        for service, var in checkbox_state.items():
+            if var.get() != (service in selected):
+                var.set(service in selected)
+
+        skipped = lp_manager.set_language_pairs(session.lps)
+        refresh_lp_listbox()
+        schedule_preview_update()
+    return skipped
+
+def save_session_file():
+    from Core.quote_session import SESSION_FILETYPES, save_session
+    file_path = filedialog.asksaveasfilename(defaultextension=".oss.json", filetypes=SESSION_FILETYPES)
+    if not file_path:
+        return
+    try:
+        save_session(snapshot_session(), file_path)
+    except OSError as e:
+        messagebox.showerror("Error", f"Failed to save session: {e}")
+        return
+    startup_status_label.configure(text=f"Session saved to {os.path.basename(file_path)}")
+
+def open_session_file():
+    from Core.quote_session import SESSION_FILETYPES, load_session
+    file_path = filedialog.askopenfilename(filetypes=SESSION_FILETYPES)
+    if not file_path:
+        return
+    if lp_manager.get_count() > 0 and not messagebox.askyesno(
+        "Open Session", "Opening a session will replace the current quote. Continue?"
+    ):
+        return
+    start = time.perf_counter()
+    try:
+        skipped = restore_session(load_session(file_path))
+    except (OSError, ValueError) as e:
+        messagebox.showerror("Error", f"Failed to open session: {e}")
+        return
+    startup_status_label.configure(
+        text=f"Session restored in {(time.perf_counter() - start) * 1000:.0f} ms"
+    )
+    if skipped:
+        messagebox.showwarning("Skipped Language Pairs", "These language pairs could not be restored:\n\n" + "\n".join(skipped))
+
+session_frame = ctk.CTkFrame(PreviewFrame, fg_color="transparent")
+session_frame.grid(row=4, column=0, columnspan=3, pady=(0, 10), sticky="ew")
+session_frame.grid_columnconfigure((0, 1), weight=1)
+save_session_button = ctk.CTkButton(
+    session_frame, text="Save Session", command=save_session_file, width=100, state="disabled"
+)
+save_session_button.grid(row=0, column=0, padx=(0, 5), sticky="ew")
+open_session_button = ctk.CTkButton(
+    session_frame, text="Open Session", command=open_session_file, width=100, state="disabled"
+)
+open_session_button.grid(row=0, column=1, padx=(5, 0), sticky="ew")
+
 
 # Add the button somewhere in your UI, for example, top right corner of main_content
 admin_config_button = ctk.CTkButton(
@@ -1419,9 +1460,8 @@ admin_config_button = ctk.CTkButton(
 
 admin_config_button.grid(row=3, column=2, padx=5, pady=5, sticky="ne")
 
+@profiler.profiled()
 def populate_test_values():
-    global suspend_preview_update
-    suspend_preview_update = True
     # Populate Services checkboxes
     test_services = [
         "Translation", "TM - Fuzzy Match", "TM - Exact Match", 
@@ -1429,9 +1469,10 @@ def populate_test_values():
         "Desktop Publishing (DTP)", "Back Translation", "Editing",
         "Reconciliation", "Project Management", "Rush Premium"
     ]
-    for service in test_services:
-        if service in checkbox_state:
-            checkbox_state[service].set(True)
+    with preview_batch():
+        for service in test_services:
+            if service in checkbox_state:
+                checkbox_state[service].set(True)
 
     # Populate QuoteMe values
     """ test_quoteme_values = {
@@ -1460,26 +1501,19 @@ def populate_test_values():
     """test_workflows = ["Trans + proof", "trans + bt", "allDevTestWF"]
     for workflow in test_workflows:
         if workflow not in workflows:
-            WFlistbox.insert("end", workflow)
-    suspend_preview_update = False"""
-    update_preview()  # Only call once after all changes
+            WFlistbox.insert("end", workflow)"""
 
 # 3. Then define populate_languages function
-def populate_languages():
+@profiler.profiled()
+def populate_languages(clear_lps=True):
     """Populate Languages list from current worksheet and update dropdowns"""
-    global Languages
+    global Languages, language_index
     prev_source = source_language_dropdown.get()
     prev_target = target_language_dropdown.get()
     Languages.clear()
     try:
-        df_s_iqvia = pd.read_excel(
-            get_excel_path(),
-            sheet_name=CurrentWS
-        )
-        source_languages = df_s_iqvia["Source Language"].dropna().unique()
-        target_languages = df_s_iqvia["Target Language"].dropna().unique()
-        unique_languages = sorted(set(source_languages).union(set(target_languages)))
-        Languages.extend(unique_languages)
+        Languages.extend(ratesheet_model.languages(CurrentWS))
+        language_index = LanguageIndex(Languages)
         source_language_dropdown['values'] = Languages
         target_language_dropdown['values'] = Languages
         # Restore previous selection if still valid
@@ -1492,19 +1526,15 @@ def populate_languages():
         else:
             target_language_dropdown.set("Select Target Language")
         # Clear existing language pairs
-        global LPs
-        LPs.clear()
-        refresh_lp_listbox()
+        if clear_lps:
+            global LPs
+            LPs.clear()
+            refresh_lp_listbox()
     except KeyError:
         messagebox.showerror("Error", f"The worksheet '{CurrentWS}' does not contain the required columns.")
     except Exception as e:
         messagebox.showerror("Error", f"An error occurred: {e}")
 
-# 4. Finally call populate_languages
-populate_languages()
-
-# Call the function to populate test values
-populate_test_values()
 create_preview_header()
 
 canvas.grid(row=0, column=0, sticky="nsew")
@@ -1517,17 +1547,17 @@ def bind_preview_updates():
     # Unbind previous events if needed (not strictly necessary unless rebinding)
     # Bind checkbox state changes
     for var in checkbox_state.values():
-        var.trace_add("write", update_preview)
+        var.trace_add("write", schedule_preview_update)
 
-    # Bind QuoteMe entries
-    for entry in quoteMe_entries.values():
-        entry.bind("<KeyRelease>", update_preview)
+    # Bind QuoteMe and QTC entries; only the services fed by the edited label are recomputed
+    for label, entry in list(quoteMe_entries.items()) + list(qtc_entries.items()):
+        entry.bind("<KeyRelease>", lambda event, label=label: schedule_preview_update(changed_labels={label}))
 
     # Bind hourly divider
-    hourly_divider_input.bind("<KeyRelease>", update_preview)
+    hourly_divider_input.bind("<KeyRelease>", schedule_preview_update)
 
 bind_preview_updates()
-update_preview()  # Add this line to force initial update
+schedule_preview_update()  # Add this line to force initial update
 
 
 # Set max with to match the container frame
@@ -1543,6 +1573,153 @@ refresh_service_checkboxes()
 TOTAL_HEIGHT = 1000  # Or whatever height you want
 
 
+# --- BACKGROUND RATESHEET LOADING ---
+startup_status_frame = ctk.CTkFrame(main_content)
+startup_status_frame.grid(row=4, column=0, columnspan=3, sticky="ew", padx=10, pady=5)
+startup_status_frame.grid_columnconfigure(1, weight=1)
+startup_status_label = ctk.CTkLabel(startup_status_frame, text="Loading ratesheet...", font=FONT)
+startup_status_label.grid(row=0, column=0, padx=5, pady=PADY_ITEM, sticky="w")
+startup_progress = ctk.CTkProgressBar(startup_status_frame)
+startup_progress.grid(row=0, column=1, padx=5, pady=PADY_ITEM, sticky="ew")
+startup_progress.set(0)
+export_cancel_button = ctk.CTkButton(startup_status_frame, text="Cancel", command=cancel_export, width=100)
+export_cancel_button.grid(row=0, column=2, padx=5, pady=PADY_ITEM)
+export_cancel_button.grid_remove()
+
+# Messages from the loader and watcher threads, applied on the Tk thread
+startup_queue = queue.Queue()
+ratesheet_watcher = None
+RATESHEET_POLL_MS = 500
+
+
+def ratesheet_loader():
+    """Loader thread: read the workbook and hand the result to the Tk thread."""
+    global ratesheet_watcher
+    try:
+        result = load_ratesheet_model(lambda fraction, message: startup_queue.put(("progress", fraction, message)))
+        from Core.ratesheet_watcher import RatesheetWatcher
+        ratesheet_watcher = RatesheetWatcher(
+            get_excel_path(), result,
+            lambda model, changed: startup_queue.put(("reload", model, changed))
+        )
+        startup_queue.put(("done", result))
+    except Exception as e:
+        startup_queue.put(("error", e))
+
+
+def resize_for_services():
+    """Size the window and service panels for the longest service list."""
+    global MAX_SERVICE_COUNT, MAIN_WINDOW_HEIGHT, ACTIVE_SERVICES_FRAME_HEIGHT
+    MAX_SERVICE_COUNT = get_max_service_count_across_ratesheets()
+    MAIN_WINDOW_HEIGHT = BASE_HEIGHT + (MAX_SERVICE_COUNT * ROW_HEIGHT)
+    ACTIVE_SERVICES_FRAME_HEIGHT = MAX_SERVICE_COUNT * ROW_HEIGHT
+    root.geometry(f"1200x{MAIN_WINDOW_HEIGHT}")
+    preview_grid.configure(height=ACTIVE_SERVICES_FRAME_HEIGHT)
+
+
+@profiler.profiled()
+def on_ratesheet_loaded(model):
+    """Populate the window from the loaded ratesheet model (runs on the Tk thread)."""
+    global WorkSheets, CurrentWS, workflows, service_label_mapping, ratesheet_loaded, ratesheet_model
+    ratesheet_model = model
+    WorkSheets = model.sheet_names
+    if not WorkSheets:
+        messagebox.showerror("Error", "No worksheets starting with 'S ' found in the Excel file.")
+        WorkSheets = ['S IQVIA']
+    CurrentWS = WorkSheets[0]
+    worksheet_dropdown.configure(values=WorkSheets)
+    worksheet_var.set(CurrentWS)
+    service_label_mapping = load_service_label_mapping()
+    resize_for_services()
+
+    populate_services_and_uom()
+    workflows = workflow_manager.get_workflows_for_account(CurrentWS)
+    populate_workflows()
+    populate_languages()
+    populate_test_values()
+    refresh_service_checkboxes()
+    ratesheet_loaded = True
+    schedule_preview_update()
+
+    for widget in (worksheet_dropdown, save_lp_button, save_charges_button, compare_accounts_button,
+                   save_session_button, open_session_button):
+        widget.configure(state="normal")
+
+    startup_timings["ratesheet_loaded_ms"] = (time.perf_counter() - _STARTUP_T0) * 1000
+    startup_progress.grid_remove()
+    startup_status_label.configure(
+        text=f"Window shown after {startup_timings['first_paint_ms']:.0f} ms, "
+             f"ratesheet ready after {startup_timings['ratesheet_loaded_ms']:.0f} ms"
+    )
+    print(f"Startup: first paint {startup_timings['first_paint_ms']:.0f} ms, "
+          f"ratesheet loaded {startup_timings['ratesheet_loaded_ms']:.0f} ms")
+    if ratesheet_watcher is not None:
+        ratesheet_watcher.start()
+
+
+@profiler.profiled()
+def on_ratesheet_reloaded(model, changed):
+    """Swap in a model reloaded by the watcher and refresh the widgets it affects."""
+    global ratesheet_model, WorkSheets
+    from Core.ratesheet_model import SERVICES_SHEET, UOFM_SHEET
+    ratesheet_model = model
+    if model.sheet_names and model.sheet_names != WorkSheets:
+        WorkSheets = model.sheet_names
+        worksheet_dropdown.configure(values=WorkSheets)
+    if SERVICES_SHEET in changed:
+        resize_for_services()
+
+    if CurrentWS not in model.ratesheets and WorkSheets:
+        # The current account was removed: switch to the first one
+        worksheet_var.set(WorkSheets[0])
+    elif changed & {SERVICES_SHEET, UOFM_SHEET, CurrentWS}:
+        selected = [service for service, var in checkbox_state.items() if var.get()]
+        populate_services_and_uom()
+        refresh_service_checkboxes()
+        for service in selected:
+            if service in checkbox_state:
+                checkbox_state[service].set(True)
+        if CurrentWS in changed:
+            populate_languages(clear_lps=False)
+        schedule_preview_update()
+    startup_status_label.configure(text=f"Ratesheet reloaded: {', '.join(sorted(changed))}")
+
+
+def poll_ratesheet_loader():
+    """Apply loader progress and watcher reloads on the Tk thread."""
+    try:
+        while True:
+            kind, *payload = startup_queue.get_nowait()
+            if kind == "progress":
+                fraction, message = payload
+                startup_progress.set(fraction)
+                startup_status_label.configure(text=message)
+            elif kind == "done":
+                on_ratesheet_loaded(payload[0])
+            elif kind == "reload":
+                on_ratesheet_reloaded(*payload)
+            else:
+                messagebox.showerror("Error", f"An error occurred while reading the Excel file: {payload[0]}")
+                from Core.ratesheet_model import RatesheetModel
+                on_ratesheet_loaded(RatesheetModel.empty(mapping_manager, get_quote_cache()))
+                return
+    except queue.Empty:
+        pass
+    # Poll quickly during startup, then only for watcher reloads
+    root.after(50 if not ratesheet_loaded else RATESHEET_POLL_MS, poll_ratesheet_loader)
+
+
+def start_ratesheet_loading():
+    """Record time-to-first-paint, then load the workbook in the background."""
+    startup_timings["first_paint_ms"] = (time.perf_counter() - _STARTUP_T0) * 1000
+    threading.Thread(target=ratesheet_loader, name="ratesheet-loader", daemon=True).start()
+    poll_ratesheet_loader()
+
+
+# Runs once the main loop has drawn the window
+root.after_idle(start_ratesheet_loading)
+
+
 class TheOneBPApp:
     """The One-Stop Shop Application wrapper class."""
     